@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Import time of the survey_dashboard modules, measured with python -X importtime.
+
+Every module is imported in a fresh interpreter, repeat times. Reported are the
+median cumulative import time of the module, including all its dependencies,
+and the median sum of the self times of the survey_dashboard modules imported
+with it, which excludes third party packages like pandas and bokeh.
+
+Usage:
+    python benchmarks/bench_import_time.py --repeat 10 --json imports.json
+    python benchmarks/bench_import_time.py survey_dashboard.core.catalog
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+MODULES = [
+    "survey_dashboard.data.hcs_clean_dictionaries",
+    "survey_dashboard.core.catalog",
+    "survey_dashboard.core.config",
+    "survey_dashboard.core.data",
+]
+
+
+def import_times(module: str) -> dict:
+    """Self and cumulative import time in microseconds of every module imported by `import module`."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def median(values: list) -> float:
+    return sorted(values)[len(values) // 2]
+
+
+def run(modules: list = MODULES, repeat: int = 10) -> dict:
+    """Median cumulative and survey_dashboard self import time of every module in milliseconds."""
+    result = {}
+    for module in modules:
+        cumulative, own = [], []
+        for _ in range(repeat):
+            times = import_times(module)
+            cumulative.append(times[module][1])
+            own.append(sum(self_us for name, (self_us, _) in times.items() if name.startswith("survey_dashboard")))
+        result[module] = {
+            "cumulative_ms": median(cumulative) / 1000,
+            "survey_dashboard_ms": median(own) / 1000,
+        }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=MODULES, help="Modules to import")
+    parser.add_argument("--repeat", type=int, default=10, help="Fresh interpreters per module")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    result = run(args.modules, args.repeat)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as stream:
+            json.dump(result, stream, indent=2)
+
+    print(f"{'module':50s} {'cumulative [ms]':>16s} {'survey_dashboard [ms]':>22s}")
+    for module, timing in result.items():
+        print(f"{module:50s} {timing['cumulative_ms']:16.1f} {timing['survey_dashboard_ms']:22.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Counting of multiple choice answers, per-column pandas loops against the count cube.
+
+For every question of HCS_MCList in the cleaned survey, the answers are counted
+per research area with the per-column value_counts loop the dashboard used
+before, and with the count cube. The cube is timed building the table of the
+question, looking up a method filter in it, and in select_data with the result
+cache cleared. Both counts have to be equal, median times per method filter are
+reported.
+
+Usage:
+    python benchmarks/bench_mc_aggregation.py --repeat 10 --json mc.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from survey_dashboard.core.aggregates import CountCube
+from survey_dashboard.core.config import FILTER_BY, FILTER_BY_2, HCS_MCSUBQUESTIONS_FLATTENED
+from survey_dashboard.core.data import DataProcessor
+from survey_dashboard.data.hcs_clean_dictionaries import HCS_MCList, HCS_MCsubquestions
+
+METHOD_FILTERS = [[], ["imaging"], ["simulations", "recordings"]]
+
+
+def reference_counts(df, keylist) -> dict:
+    """Counts per x tick label and per research area as the per-column loop computed them."""
+    combined = {}
+    per_area = {}
+    areas = list(df[FILTER_BY].value_counts().keys())
+    for key in keylist:
+        xtick = HCS_MCSUBQUESTIONS_FLATTENED[key].replace(" \n", "")
+        column = df[key].replace(to_replace=True, value=xtick).replace(to_replace=False, value=None)
+        counts = column[df[FILTER_BY].notna()].value_counts()
+        combined[xtick] = combined.get(xtick, 0) + (int(counts.iloc[0]) if not counts.empty else 0)
+        for area in areas:
+            area_counts = column[df[FILTER_BY] == area].value_counts()
+            per_area.setdefault(area, []).append(0 if area_counts.empty else int(area_counts.iloc[0]))
+    return {"Cum. Sum": list(combined.values()), "x_value": list(combined), **per_area}
+
+
+def timed(function, repeat: int) -> float:
+    """Median seconds of repeat calls of function."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def time_question(processor: DataProcessor, text: str, keylist: list, repeat: int) -> dict:
+    """Equivalence and median milliseconds of the loop and the count cube for one question."""
+    dataset = processor.dataset
+    timings = {"loop": [], "build": [], "table": [], "select_data": []}
+    equal = True
+    for methods in METHOD_FILTERS:
+        method_columns = [key for key, method in HCS_MCsubquestions[FILTER_BY_2].items() if method in methods]
+        df = processor.survey_data[list(dict.fromkeys([FILTER_BY] + keylist + method_columns))].astype(object)
+        for column in method_columns:
+            df = df[df[column] == True]  # noqa: E712, the columns hold objects
+        timings["loop"].append(timed(lambda: reference_counts(df, keylist), repeat))
+
+        # A new cube per call, the first table() call of a question builds its counts
+        cubes = [CountCube(dataset.encoded, dataset.counts.method_columns, FILTER_BY) for _ in range(repeat)]
+        timings["build"].append(timed(lambda: cubes.pop().table(keylist, method_columns), repeat))
+        timings["table"].append(timed(lambda: dataset.counts.table(keylist, method_columns), repeat))
+
+        def select():
+            processor.results.clear()
+            return processor.select_data(text, ["Cum. Sum"], methods)[0].data
+
+        timings["select_data"].append(timed(select, repeat))
+        data = select()
+        reference = reference_counts(df, keylist)
+        equal = equal and all(
+            [int(value) if key != "x_value" else value for value in data[key]] == values
+            for key, values in reference.items()
+        )
+    return {
+        "columns": len(keylist),
+        "equal": equal,
+        **{f"{name}_ms": statistics.median(values) * 1000 for name, values in timings.items()},
+    }
+
+
+def run(repeat: int = 10) -> dict:
+    """Equivalence and median times for every multiple choice question of the cleaned survey."""
+    processor = DataProcessor()
+    result = {}
+    for question in HCS_MCList:
+        try:
+            text = processor.map_qkey_to_question(question)
+        except KeyError:
+            # HCS_MCList also holds the raw survey keys of the renamed questions
+            continue
+        # The columns select_data counts, in the order of its x values
+        keylist = [key for key in processor.map_question_to_qkey(text) if key in processor.encoded]
+        result[question] = time_question(processor, text, keylist, repeat)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10, help="Timed calls per measurement (default: 10)")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    result = run(args.repeat)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as stream:
+            json.dump(result, stream, indent=2)
+
+    print(f"{'question':20s} {'cols':>4s} {'loop [ms]':>10s} {'build [ms]':>11s} {'table [ms]':>11s} "
+          f"{'select [ms]':>12s} {'speedup':>8s}  equal")
+    for question, timing in result.items():
+        print(
+            f"{question:20s} {timing['columns']:4d} {timing['loop_ms']:10.2f} {timing['build_ms']:11.3f} "
+            f"{timing['table_ms']:11.4f} {timing['select_data_ms']:12.3f} "
+            f"{timing['loop_ms'] / timing['select_data_ms']:7.1f}x  {timing['equal']}"
+        )
+    loop = sum(timing["loop_ms"] for timing in result.values())
+    select = sum(timing["select_data_ms"] for timing in result.values())
+    print(f"{'total':20s} {'':4s} {loop:10.2f} {'':11s} {'':11s} {select:12.3f} {loop / select:7.1f}x")
+    if not all(timing["equal"] for timing in result.values()):
+        print("Counts differ from the per-column loops")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
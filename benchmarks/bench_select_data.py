@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Microbenchmark of DataProcessor.select_data for every question in BARCHART_ALLOWED.
+
+Each question is run with a fixed set of research area and method filters, the
+median time per call is reported. Results can be written to JSON and compared
+with an earlier run, e.g. one made on another commit:
+
+Usage:
+    python benchmarks/bench_select_data.py --json after.json --compare before.json
+"""
+
+import argparse
+import itertools
+import json
+import statistics
+import time
+
+from survey_dashboard.core.data import DataProcessor
+from survey_dashboard.data.hcs_clean_dictionaries import BARCHART_ALLOWED
+
+AREA_FILTERS = [["All"], ["All", "Physics"], ["Cum. Sum", "Chemistry", "Life Science"]]
+METHOD_FILTERS = [[], ["imaging"], ["simulations", "recordings"]]
+
+
+def time_question(processor: DataProcessor, question: str, repeat: int) -> float:
+    """Median seconds of one select_data call over all filter combinations."""
+    timings = []
+    for data_filters, methods in itertools.product(AREA_FILTERS, METHOD_FILTERS):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                processor.select_data(question, data_filters, methods)
+            except KeyError:
+                # Some questions fail in older versions, their time is still counted
+                pass
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def run(repeat: int = 5) -> dict:
+    """Median seconds per select_data call for every question in BARCHART_ALLOWED."""
+    processor = DataProcessor()
+    # Warm up lazily built state, this is not part of a user interaction
+    processor.select_data(processor.map_qkey_to_question(BARCHART_ALLOWED[0]), ["All"], [])
+    return {key: time_question(processor, processor.map_qkey_to_question(key), repeat) for key in BARCHART_ALLOWED}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Calls per filter combination (default: 5)")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare against")
+    args = parser.parse_args()
+
+    result = run(args.repeat)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as stream:
+            json.dump(result, stream, indent=2)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as stream:
+            baseline = json.load(stream)
+
+    print(f"{'question':32s} {'ms/call':>9s}" + (f" {'before':>9s} {'speedup':>8s}" if baseline else ""))
+    for key, seconds in result.items():
+        line = f"{key:32s} {seconds * 1e3:9.3f}"
+        if key in baseline:
+            line += f" {baseline[key] * 1e3:9.3f} {baseline[key] / seconds:7.1f}x"
+        print(line)
+
+    total = sum(result.values())
+    line = f"{'total':32s} {total * 1e3:9.3f}"
+    if baseline:
+        before = sum(baseline.get(key, 0.0) for key in result)
+        line += f" {before * 1e3:9.3f} {before / total:7.1f}x"
+    print(line)
+
+
+if __name__ == "__main__":
+    main()
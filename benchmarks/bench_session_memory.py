@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Memory benchmark for many concurrently open dashboard sessions.
+
+Every session owns one DataProcessor. This compares the memory held by N open
+sessions with the previous behaviour, where each DataProcessor also wrapped the
+full survey table in two ColumnDataSources.
+
+Usage:
+    python benchmarks/bench_session_memory.py --sessions 50
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from bokeh.models import ColumnDataSource
+
+from survey_dashboard.core.data import DataProcessor, get_survey_dataset
+
+
+def _legacy_session():
+    """A session as it was before: processor plus two full-table data sources."""
+    processor = DataProcessor()
+    return processor, ColumnDataSource(processor.survey_data), ColumnDataSource(processor.survey_data)
+
+
+def _current_session():
+    """A session now, chart sources hold only the aggregated select_* results."""
+    return DataProcessor()
+
+
+def measure_sessions(create_session, sessions: int) -> int:
+    """Return the memory in bytes held by the given number of open sessions."""
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    open_sessions = [create_session() for _ in range(sessions)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del open_sessions
+    return current - start
+
+
+def run(sessions: int = 50) -> dict:
+    """Measure legacy and current memory for the given number of sessions."""
+    # The shared dataset is loaded once per process and is not part of a session
+    get_survey_dataset()
+
+    legacy = measure_sessions(_legacy_session, sessions)
+    current = measure_sessions(_current_session, sessions)
+    return {
+        "sessions": sessions,
+        "legacy_bytes": legacy,
+        "current_bytes": current,
+        "saved_bytes_per_session": (legacy - current) / sessions,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=50, help="Number of open sessions (default: 50)")
+    args = parser.parse_args()
+
+    result = run(args.sessions)
+    print(f"Open sessions:         {result['sessions']}")
+    print(f"Legacy (2 full CDS):   {result['legacy_bytes'] / 1e6:8.2f} MB")
+    print(f"Without full CDS:      {result['current_bytes'] / 1e6:8.2f} MB")
+    print(f"Saved per session:     {result['saved_bytes_per_session'] / 1e3:8.1f} kB")
+
+
+if __name__ == "__main__":
+    main()
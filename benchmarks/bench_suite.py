@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Startup and per-session latency of the dashboard, one timing per benchmark case.
+
+Covers the start of a worker process, the creation of a session's DataProcessor,
+select_data for every question in BARCHART_ALLOWED, select_data_corr for every
+pair of corr_chart_allowed, each under several filter combinations, the word
+cloud pipeline per tab, the construction of the overview bar charts and the
+full build of app.py, without and with serializing its document. Everything
+runs offline, on the survey shipped with the package or on the file set in
+SURVEY_DASHBOARD_DATA_FILE, e.g. a large survey of synthetic_survey.py.
+
+Query results are computed on every call, the shared result cache is cleared
+before each call outside of the timing, and the pool of prebuilt figures is
+disabled. The numbers are therefore the cost of a cache miss, which is what
+changes between versions. Word cloud layouts are computed in the
+wordcloud.generate cases only, the app cases reuse them as a server does with
+its prebuilt layouts. Every case is run once untimed before it is measured.
+
+Results are written to JSON together with the commit, package versions and survey file.
+Comparing with an earlier run lists every case that got slower or faster by
+more than the threshold and exits with status 1 if any case got slower.
+
+Usage:
+    python benchmarks/bench_suite.py --json before.json
+    python benchmarks/bench_suite.py --json after.json --compare before.json
+    python benchmarks/bench_suite.py -k select_data_corr --repeat 10
+    SURVEY_DASHBOARD_DATA_FILE=survey-100000.csv python benchmarks/bench_suite.py --json 100k.json
+    python benchmarks/bench_suite.py --list
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import platform
+import runpy
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+import bokeh
+import numpy as np
+import pandas as pd
+import panel as pn
+from bokeh.document import Document
+
+import survey_dashboard
+from survey_dashboard.core.config import ACCORDION_WIDTH, DATAFILE_PATH, DEFAULT_QUESTIONS, WORDCLOUD_CONTENT
+from survey_dashboard.core.data import DataProcessor, get_survey_dataset
+from survey_dashboard.core.prebuilt import get_figure_pool
+from survey_dashboard.data.hcs_clean_dictionaries import BARCHART_ALLOWED, corr_chart_allowed
+from survey_dashboard.plots import (
+    DEFAULT_FIGURE_HEIGHT,
+    bokeh_barchart,
+    generate_wordcloud,
+    interactive_wordcloud,
+)
+
+APP_PATH = Path(survey_dashboard.__file__).parent / "app.py"
+
+AREA_FILTERS = [["All"], ["All", "Physics"], ["Cum. Sum", "Chemistry", "Life Science"]]
+METHOD_FILTERS = [[], ["imaging"], ["simulations", "recordings"]]
+FILTER_COMBOS = list(itertools.product(AREA_FILTERS, METHOD_FILTERS))
+# The correlation plot has no research area comparison, fewer combinations keep the pairs fast
+CORR_FILTER_COMBOS = [(["All"], []), (["Physics"], ["imaging"])]
+
+
+@dataclass
+class Case:
+    """
+    A benchmark case, timed per call.
+
+    Attributes:
+        name: Dotted name, group first, e.g. select_data.fairFamiliarity
+        calls: Functions without arguments, every one is timed separately
+        setup: Run before every call, not part of the timing
+    """
+    name: str
+    calls: list
+    setup: Callable = None
+
+
+def time_case(case: Case, repeat: int) -> dict:
+    """Median, minimum and maximum seconds per call over repeat rounds of all calls of the case."""
+    timings = []
+    for round_ in range(repeat + 1):
+        for call in case.calls:
+            if case.setup is not None:
+                case.setup()
+            start = time.perf_counter()
+            call()
+            seconds = time.perf_counter() - start
+            # The first round warms up imports and lazily built state
+            if round_:
+                timings.append(seconds)
+    return {
+        "median_s": statistics.median(timings),
+        "min_s": min(timings),
+        "max_s": max(timings),
+        "samples": len(timings),
+    }
+
+
+def _start_worker():
+    """Import the data layer and load the dataset in a fresh interpreter, as a new worker process does."""
+    subprocess.run(
+        [sys.executable, "-c", "from survey_dashboard.core.data import DataProcessor; DataProcessor()"],
+        check=True,
+    )
+
+
+def _build_app() -> dict:
+    return runpy.run_path(str(APP_PATH), run_name="survey_dashboard_benchmark")
+
+
+def _build_app_document():
+    """Build app.py and serialize its document, as it is sent to the browser of a new session."""
+    document = Document()
+    _build_app()["template"].server_doc(document)
+    document.to_json()
+
+
+def _barchart_call(processor: DataProcessor, question: str) -> Callable:
+    """Construct the bar chart of question from prepared data, like ChartManager does."""
+    data, ydata_spec, display_options = processor.select_data(question, ["All"], [])
+    y_keys = ydata_spec.data["y_keys"]
+    return lambda: bokeh_barchart(
+        data, y=y_keys, factors=y_keys, legend_labels=y_keys, fill_color=ydata_spec.data["colors"],
+        orientation="vertical", **display_options,
+    )
+
+
+def _wordcloud_cases(processor: DataProcessor, clear_results: Callable) -> list:
+    """Word selection, layout and figure construction of every word cloud tab."""
+    cases = []
+    for content_type, content in WORDCLOUD_CONTENT.items():
+        words = processor.select_data_wordcloud(["All"], [], content)
+        wordcloud = generate_wordcloud(words, height=DEFAULT_FIGURE_HEIGHT, width=ACCORDION_WIDTH)
+        cases += [
+            Case(
+                f"wordcloud.select.{content_type}",
+                [partial(processor.select_data_wordcloud, area, method, content)
+                 for area, method in FILTER_COMBOS],
+                clear_results,
+            ),
+            # Without a layout cache every call lays out the words
+            Case(
+                f"wordcloud.generate.{content_type}",
+                [partial(generate_wordcloud, words, height=DEFAULT_FIGURE_HEIGHT, width=ACCORDION_WIDTH)],
+            ),
+            Case(f"wordcloud.interactive.{content_type}", [partial(interactive_wordcloud, wordcloud)]),
+        ]
+    return cases
+
+
+def collect_cases() -> list:
+    """All benchmark cases, in the order they run."""
+    processor = DataProcessor()
+    # Every case builds its figures, the pool would hand out figures built in the background
+    get_figure_pool().size = 0
+
+    def clear_results():
+        processor.results.clear()
+
+    cases = [
+        Case("startup.worker", [_start_worker]),
+        Case("session.data_processor", [DataProcessor]),
+    ]
+    for key in BARCHART_ALLOWED:
+        question = processor.map_qkey_to_question(key)
+        cases.append(Case(
+            f"select_data.{key}",
+            [partial(processor.select_data, question, area, method) for area, method in FILTER_COMBOS],
+            clear_results,
+        ))
+    for key1, key2 in itertools.combinations(corr_chart_allowed, 2):
+        question1, question2 = processor.map_qkey_to_question(key1), processor.map_qkey_to_question(key2)
+        cases.append(Case(
+            f"select_data_corr.{key1}.{key2}",
+            [partial(processor.select_data_corr, question1, question2, area, method)
+             for area, method in CORR_FILTER_COMBOS],
+            clear_results,
+        ))
+    cases += _wordcloud_cases(processor, clear_results)
+    for key in DEFAULT_QUESTIONS["overview"].values():
+        cases.append(Case(f"bokeh_barchart.{key}", [_barchart_call(processor, processor.map_qkey_to_question(key))]))
+    cases += [
+        Case("app.layout", [_build_app], clear_results),
+        Case("app.document", [_build_app_document], clear_results),
+    ]
+    return cases
+
+
+def environment() -> dict:
+    """Commit, interpreter and package versions and the survey file of a run."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=APP_PATH.parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "data_file": DATAFILE_PATH,
+        "respondents": get_survey_dataset().shape[0],
+        "packages": {
+            "panel": pn.__version__,
+            "bokeh": bokeh.__version__,
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+        },
+    }
+
+
+def run(pattern: str = "", repeat: int = 5) -> dict:
+    """Timings of all cases whose name contains pattern, with the environment of the run."""
+    # The dataset is loaded once per worker process, startup.worker measures that on its own
+    get_survey_dataset()
+    results = {}
+    for case in collect_cases():
+        if pattern in case.name:
+            results[case.name] = time_case(case, repeat)
+    return {"environment": environment(), "repeat": repeat, "results": results}
+
+
+def compare(result: dict, baseline: dict, threshold: float) -> tuple:
+    """Cases slower and faster than in baseline by more than the threshold factor."""
+    slower, faster = [], []
+    for name, timing in result["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = timing["median_s"] / before["median_s"]
+        if ratio > threshold:
+            slower.append(name)
+        elif ratio < 1 / threshold:
+            faster.append(name)
+    return slower, faster
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", dest="pattern", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed rounds of every case (default: 5)")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="Median time ratio counted as a change when comparing (default: 1.2)")
+    parser.add_argument("--list", action="store_true", help="List the case names and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for case in collect_cases():
+            if args.pattern in case.name:
+                print(case.name)
+        return
+
+    result = run(args.pattern, args.repeat)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as stream:
+            json.dump(result, stream, indent=2)
+
+    baseline = {"results": {}}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as stream:
+            baseline = json.load(stream)
+
+    print(f"{'case':60s} {'median [ms]':>12s} {'min [ms]':>10s}" + (f" {'before':>10s} {'ratio':>7s}" if args.compare else ""))
+    for name, timing in result["results"].items():
+        line = f"{name:60s} {timing['median_s'] * 1e3:12.3f} {timing['min_s'] * 1e3:10.3f}"
+        before = baseline["results"].get(name)
+        if before is not None:
+            line += f" {before['median_s'] * 1e3:10.3f} {timing['median_s'] / before['median_s']:6.2f}x"
+        print(line)
+
+    if args.compare:
+        slower, faster = compare(result, baseline, args.threshold)
+        print(f"\nCompared with {baseline.get('environment', {}).get('commit')}, threshold {args.threshold}x: "
+              f"{len(slower)} slower, {len(faster)} faster")
+        for name in slower:
+            print(f"  slower: {name}")
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Size of the websocket message sent to the browser when a chart is updated.
+
+Every chart is shown in a Bokeh pane of a document, then updated once by
+replacing the figure and once in place. The PATCH-DOC message the server would
+send for the collected document events is serialized and its size reported.
+
+Usage:
+    python benchmarks/bench_update_payload.py --json payload.json
+"""
+
+import argparse
+import json
+
+import panel as pn
+from bokeh.document import Document
+from bokeh.protocol import Protocol
+
+from survey_dashboard.core.charts import ChartManager
+from survey_dashboard.core.config import DEFAULT_QUESTIONS, WORDCLOUD_CONTENT
+from survey_dashboard.core.data import DataProcessor
+
+BEFORE = (["All"], [])
+AFTER = (["All"], ["imaging"])
+
+
+def message_size(events: list) -> int:
+    """Bytes of the PATCH-DOC message holding the given document events."""
+    if not events:
+        return 0
+    message = Protocol().create("PATCH-DOC", events)
+    return len(message.header_json) + len(message.content_json) + sum(
+        len(buffer.to_bytes()) for buffer in message.buffers
+    )
+
+
+def measure(build, update) -> dict:
+    """
+    Message sizes of a rebuild and an in-place update of one chart.
+
+    Args:
+        build: Returns a new figure for the filters BEFORE or AFTER
+        update: Updates the given figure to the filters AFTER, returns the figure shown afterwards
+    """
+    result = {}
+    for mode in ("rebuild", "in_place"):
+        doc = Document()
+        pane = pn.pane.Bokeh(build(*BEFORE))
+        doc.add_root(pane.get_root(doc))
+        events = []
+        doc.on_change(events.append)
+        if mode == "rebuild":
+            pane.object = build(*AFTER)
+        else:
+            fig = update(pane.object)
+            if fig is not pane.object:
+                pane.object = fig
+        result[mode] = message_size(events)
+    return result
+
+
+def run() -> dict:
+    """Message sizes in bytes per chart of a rebuild and an in-place update."""
+    chart_manager = ChartManager(DataProcessor())
+    charts = {}
+    for key, qkey in DEFAULT_QUESTIONS["overview"].items():
+        question = chart_manager.data_processor.map_qkey_to_question(qkey)
+        charts[key] = (
+            lambda filters, methods, question=question: chart_manager.create_chart(
+                question, filters, methods, "Vertical Bar chart"
+            ),
+            lambda fig, question=question: chart_manager.update_chart(
+                fig, question, *AFTER, "Vertical Bar chart"
+            ),
+        )
+
+    exploration = DEFAULT_QUESTIONS["exploration"]
+    question1 = chart_manager.data_processor.map_qkey_to_question(exploration["corr1"])
+    question2 = chart_manager.data_processor.map_qkey_to_question(exploration["corr2"])
+    charts["correlation"] = (
+        lambda filters, methods: chart_manager.create_correlation_plot(question1, question2, filters, methods),
+        lambda fig: chart_manager.update_correlation_plot(fig, question1, question2, *AFTER),
+    )
+
+    for key, content in WORDCLOUD_CONTENT.items():
+        charts[f"wordcloud_{key}"] = (
+            lambda filters, methods, content=content: chart_manager.create_wordcloud(filters, methods, content),
+            lambda fig, content=content: chart_manager.update_wordcloud(fig, *AFTER, content),
+        )
+
+    return {key: measure(build, update) for key, (build, update) in charts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    result = run()
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as stream:
+            json.dump(result, stream, indent=2)
+
+    print(f"{'chart':24s} {'rebuild [B]':>12s} {'in place [B]':>13s} {'ratio':>7s}")
+    for key, sizes in result.items():
+        ratio = sizes["rebuild"] / sizes["in_place"] if sizes["in_place"] else float("inf")
+        print(f"{key:24s} {sizes['rebuild']:12d} {sizes['in_place']:13d} {ratio:6.1f}x")
+    rebuild = sum(sizes["rebuild"] for sizes in result.values())
+    in_place = sum(sizes["in_place"] for sizes in result.values())
+    print(f"{'total':24s} {rebuild:12d} {in_place:13d} {rebuild / in_place:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Time to turn a laid out word cloud into a Bokeh figure.
+
+A word cloud of 100 distinct words is laid out once, then interactive_wordcloud
+is timed with empty font and glyph metric caches (cold) and with the caches
+filled by a previous call (warm).
+
+Usage:
+    python benchmarks/bench_wordcloud_glyphs.py --words 100 --repeat 20 --json glyphs.json
+"""
+
+import argparse
+import json
+import time
+
+from survey_dashboard.plots import (
+    generate_wordcloud,
+    interactive_wordcloud,
+    _truetype_font,
+    _glyph_metrics,
+)
+
+
+def clear_caches():
+    """Empty the font and glyph metric caches."""
+    _truetype_font.cache_clear()
+    _glyph_metrics.cache_clear()
+
+
+def timed(function, repeat: int, before=None) -> float:
+    """Median seconds of repeat calls of function, before is called untimed ahead of each call."""
+    times = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def run(words: int = 100, repeat: int = 20) -> dict:
+    """Cold and warm timings of interactive_wordcloud and the number of fonts parsed."""
+    # Zipf like frequencies, so the words get many different font sizes
+    word_list = [f"word{rank}" for rank in range(words) for _ in range(words // (rank + 1))]
+    wordcloud = generate_wordcloud(word_list, max_words=words, height=400, width=600, random_state=0)
+
+    clear_caches()
+    interactive_wordcloud(wordcloud)
+    fonts = _truetype_font.cache_info().misses
+    cold = timed(lambda: interactive_wordcloud(wordcloud), repeat, before=clear_caches)
+    warm = timed(lambda: interactive_wordcloud(wordcloud), repeat)
+    return {
+        "words": len(wordcloud.layout_),
+        "fonts_parsed": fonts,
+        "cold_ms": cold * 1000,
+        "warm_ms": warm * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", type=int, default=100, help="Number of distinct words in the cloud")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per measurement")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    result = run(args.words, args.repeat)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as stream:
+            json.dump(result, stream, indent=2)
+
+    print(f"words placed:  {result['words']}")
+    print(f"fonts parsed:  {result['fonts_parsed']}")
+    print(f"cold:          {result['cold_ms']:.1f} ms")
+    print(f"warm:          {result['warm_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
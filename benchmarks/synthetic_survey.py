@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Synthetic survey files with the columns of the 2021 survey, for scale testing.
+
+The answers of every column are drawn from the answer frequencies of the shipped
+survey, separately per research area, so the per area comparisons of the
+dashboard stay plausible. Small research areas are smoothed towards the answer
+frequencies of all respondents. The possible answers of a column are the ones in
+the shipped survey plus every category of HCS_orderedCats and, for the options of
+the multiple choice questions in HCS_MCsubquestions, a check mark, so categories
+and options nobody chose in 2021 still show up occasionally. Columns are drawn
+independently of each other otherwise.
+
+The file has the format of the shipped survey and is written in chunks, so
+millions of respondents need no more memory than one chunk. Serve or benchmark
+it by pointing SURVEY_DASHBOARD_DATA_FILE to it.
+
+Usage:
+    python benchmarks/synthetic_survey.py 100000 --output survey-100k.csv
+    SURVEY_DASHBOARD_DATA_FILE=survey-100k.csv python benchmarks/bench_suite.py --json 100k.json
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from survey_dashboard.core.config import FILTER_BY, HCS_MCSUBQUESTIONS_FLATTENED, get_data_path
+from survey_dashboard.data.hcs_clean_dictionaries import HCS_colnamesDict, HCS_dtypesWOmc, HCS_orderedCats
+
+# Column of the research area, as named in the survey file
+AREA_COLUMN = next(original for original, column in HCS_colnamesDict.items() if column == FILTER_BY)
+# Weight of the answer frequencies of all respondents in those of a single research area, in respondents
+SMOOTHING = 20
+# Number of respondents given to a possible answer nobody chose in the shipped survey
+UNSEEN_WEIGHT = 0.5
+
+
+@dataclass
+class ColumnModel:
+    """
+    Answer frequencies of one column of the survey file.
+
+    Attributes:
+        answers: Possible answers, the last one None for no answer
+        probabilities: Probability of every answer per research area, areas x answers
+    """
+    answers: np.ndarray
+    probabilities: np.ndarray
+
+
+def possible_answers(original: str, values: pd.Series) -> list:
+    """Answers of the shipped survey, then the ones the schema allows in addition."""
+    answers = list(values.dropna().unique())
+    column = HCS_colnamesDict.get(original)
+    if column in HCS_MCSUBQUESTIONS_FLATTENED:
+        extra = [True]
+    elif HCS_dtypesWOmc.get(column) == "category":
+        extra = HCS_orderedCats.get(column, [])
+    else:
+        extra = []
+    return answers + [answer for answer in extra if answer not in answers]
+
+
+def answer_codes(values: pd.Series, answers: list) -> np.ndarray:
+    """Index of the answer of every respondent, len(answers) for no answer."""
+    codes = pd.Categorical(values, categories=answers).codes.astype(np.int64)
+    codes[codes < 0] = len(answers)
+    return codes
+
+
+def answer_counts(values: pd.Series, answers: list, group_codes: np.ndarray, groups: int) -> np.ndarray:
+    """Respondents per group and answer, groups x answers plus a last column for no answer."""
+    cells = group_codes * (len(answers) + 1) + answer_codes(values, answers)
+    return np.bincount(cells, minlength=groups * (len(answers) + 1)).reshape(groups, -1).astype(float)
+
+
+def fit_column(values: pd.Series, original: str, area_codes: np.ndarray, areas: int) -> ColumnModel:
+    answers = possible_answers(original, values)
+    counts = answer_counts(values, answers, area_codes, areas)
+    total = counts.sum(axis=0)
+    total[:-1][total[:-1] == 0] = UNSEEN_WEIGHT
+    overall = total / total.sum()
+    probabilities = (counts + SMOOTHING * overall) / (counts.sum(axis=1, keepdims=True) + SMOOTHING)
+    return ColumnModel(np.array(answers + [None], dtype=object), probabilities)
+
+
+def fit_survey(reference: pd.DataFrame) -> tuple:
+    """
+    Fit the answer frequencies of every column of a survey file.
+
+    Args:
+        reference: Survey file as read by pandas, with the original column names
+
+    Returns:
+        tuple: (area model, column models), the area model has a single row of probabilities
+    """
+    area_model = fit_column(reference[AREA_COLUMN], AREA_COLUMN, np.zeros(len(reference), dtype=np.int64), 1)
+    # Respondents without research area are a group of their own
+    area_codes = answer_codes(reference[AREA_COLUMN], list(area_model.answers[:-1]))
+
+    models = {}
+    for original, values in reference.items():
+        if original not in ("id", AREA_COLUMN):
+            models[original] = fit_column(values, original, area_codes, len(area_model.answers))
+    return area_model, models
+
+
+def draw(model: ColumnModel, area_rows: list, rows: int, rng: np.random.Generator) -> np.ndarray:
+    """Answers of rows respondents, area_rows holds the respondents of every research area."""
+    codes = np.empty(rows, dtype=np.int64)
+    for area, respondents in enumerate(area_rows):
+        if len(respondents):
+            codes[respondents] = rng.choice(len(model.answers), size=len(respondents), p=model.probabilities[area])
+    return model.answers[codes]
+
+
+def generate_chunk(columns: list, area_model: ColumnModel, models: dict, first_id: int, rows: int,
+                   rng: np.random.Generator) -> pd.DataFrame:
+    """Respondents first_id to first_id + rows - 1 with the columns of the survey file."""
+    area_codes = rng.choice(len(area_model.answers), size=rows, p=area_model.probabilities[0])
+    area_rows = [np.flatnonzero(area_codes == area) for area in range(len(area_model.answers))]
+    chunk = {}
+    for original in columns:
+        if original == "id":
+            chunk[original] = np.arange(first_id, first_id + rows)
+        elif original == AREA_COLUMN:
+            chunk[original] = area_model.answers[area_codes]
+        else:
+            chunk[original] = draw(models[original], area_rows, rows, rng)
+    return pd.DataFrame(chunk, columns=columns)
+
+
+def write_survey(path, rows: int, seed: int = 0, chunk_rows: int = 100_000, reference_path=None):
+    """
+    Write a synthetic survey file of rows respondents, equal for equal seeds and chunk sizes.
+
+    Args:
+        path: CSV file to write
+        rows: Number of respondents
+        seed: Seed of the random answers
+        chunk_rows: Respondents generated and written at a time
+        reference_path: Survey file whose answer frequencies are used, the shipped survey by default
+    """
+    reference_path = Path(reference_path or get_data_path())
+    reference = pd.read_csv(reference_path, comment="#")
+    area_model, models = fit_survey(reference)
+    rng = np.random.default_rng(seed)
+
+    with open(path, "w", encoding="utf-8", newline="") as stream:
+        stream.write(
+            f"# Dataset: Synthetic survey with the columns of {reference_path.name}\n"
+            f"# Respondents: {rows}\n"
+            f"# Seed: {seed}\n"
+            f"# Answers drawn from the answer frequencies of {reference_path.name} per research area\n"
+        )
+        reference.head(0).to_csv(stream, index=False)
+        for start in range(0, rows, chunk_rows):
+            chunk = generate_chunk(list(reference.columns), area_model, models, start + 1,
+                                   min(chunk_rows, rows - start), rng)
+            chunk.to_csv(stream, header=False, index=False)
+
+
+def run(rows: int, output: str, seed: int = 0, chunk_rows: int = 100_000) -> dict:
+    """Write the survey file and return its size and the time it took."""
+    start = time.perf_counter()
+    write_survey(output, rows, seed, chunk_rows)
+    return {
+        "path": output,
+        "rows": rows,
+        "seconds": time.perf_counter() - start,
+        "bytes": Path(output).stat().st_size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("rows", type=int, help="Number of respondents, e.g. 10000, 100000 or 1000000")
+    parser.add_argument("--output", help="CSV file to write (default: survey-<rows>.csv)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random answers (default: 0)")
+    parser.add_argument("--chunk-rows", type=int, default=100_000,
+                        help="Respondents generated and written at a time (default: 100000)")
+    args = parser.parse_args()
+
+    result = run(args.rows, args.output or f"survey-{args.rows}.csv", args.seed, args.chunk_rows)
+    print(f"Wrote {result['rows']} respondents to {result['path']} "
+          f"({result['bytes'] / 1e6:.1f} MB in {result['seconds']:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
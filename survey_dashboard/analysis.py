@@ -13,10 +13,8 @@ This module contains some function to process survey data in certain way and
 prepare the data for visualization
 """
 
-import math
+import numpy as np
 import pandas as pd
-from typing import List, Tuple
-from .data.hcs_clean_dictionaries import HCS_colnamesDict
 
 
 def calculate_crosstab(
@@ -51,302 +49,60 @@ def calculate_crosstab(
     return df_crosstab
 
 
-def filter_dataframe(
-    df: pd.DataFrame,
-    include: List[str] = None,
-    exclude: List[Tuple[str, List]] = None,
-    exclude_nan: bool = True,
-    exclude_anonymized: bool = True,
-    as_type: str = "object",
-) -> pd.DataFrame:
+def crosstab_from_counts(
+    counts: np.ndarray,
+    labels1: list,
+    labels2: list,
+    data_key1: str,
+    data_key2: str,
+) -> dict:
     """
-    Filter dataframe based on include/exclude criteria
+    Columns of calculate_crosstab from a precomputed table of answer pair counts
+
+    The rows are laid out as calculate_crosstab lays them out: answers sorted by
+    label, only answers occurring in a pair, all pairs of the second key per
+    answer of the first key. Totals count the pairs per answer of the first key,
+    as every counted respondent answered both keys.
 
     Args:
-        df: Input dataframe
-        include: List of columns to include
-        exclude: List of tuples (column, values_to_exclude)
-        exclude_nan: Whether to exclude rows with NaN values
-        exclude_anonymized: Whether to replace "Anonymized" with empty string
-        as_type: Data type to convert columns to
+        counts: Number of respondents per answer pair, shape (len(labels1), len(labels2))
+        labels1: Answers of data_key1 in the order of the rows of counts
+        labels2: Answers of data_key2 in the order of the columns of counts
+        data_key1: Name of the first key
+        data_key2: Name of the second key
 
     Returns:
-        Filtered dataframe
+        dict of numpy arrays with the keys data_key1, data_key2, value, total and percentage
     """
-    # Check if the DataFrame has already been renamed (has human-readable column names)
-    # If it has renamed columns, don't try to convert back to original names
-    has_renamed_columns = any(col in df.columns for col in ['careerLevel', 'researchArea', 'centerAffiliation'])
-    
-    if include is not None:
-        if has_renamed_columns:
-            # DataFrame already has renamed columns, use them directly
-            include_columns = include
-        else:
-            # DataFrame has original column names, convert if needed
-            original_to_renamed = {v: k for k, v in HCS_colnamesDict.items()}
-            include_columns = [original_to_renamed.get(col, col) for col in include]
-        
-        df = (
-            df[include_columns]
-            .dropna(how="all", subset=include_columns)
-            .astype(as_type)
-        )
-
-    if exclude:
-        for key, val in exclude:
-            if has_renamed_columns:
-                # DataFrame already has renamed columns, use them directly
-                key_column = key
-            else:
-                # DataFrame has original column names, convert if needed
-                original_to_renamed = {v: k for k, v in HCS_colnamesDict.items()}
-                key_column = original_to_renamed.get(key, key)
-            
-            df = df.loc[~df[key_column].isin(val)]
-
-    if exclude_nan:
-        for key in df.keys():
-            df = df.loc[~df[key].isna()]
-
-    if exclude_anonymized:
-        df = df.replace(to_replace="Anonymized", value="")
-
-    return df
-
-
-def get_all_values(df: pd.DataFrame, keylist: List[str], display_dict=None) -> dict:
-    """
-    Count all values of a given key from a key list in a data frame and
-    return these values in a dictionary sorted.
-
-    """
-    if len(keylist) == 1:
-        key = keylist[0]
-        all_areas = df[key].value_counts()
-        all_areas = all_areas.sort_index()
-        data = {"All": all_areas.values, key: list(all_areas.keys())}
-    else:  # multiple keys now the keys become the xticks
-        combined = {}
-        for key in keylist:
-            if display_dict is not None:
-                xtick = display_dict[key]
-            else:
-                xtick = key
-            xtick = xtick.replace(" \n", "")
-            temp = df[key]
-            temp.replace(to_replace=True, value=xtick, inplace=True)
-            temp.replace(to_replace=False, value=None, inplace=True)
-            a = temp.value_counts()
-            if a.empty:
-                combined[xtick] = 0
-            else:
-                # greedy, there is probably a pandas way to do this...
-                # there is a problem if df is empty, i.e temp.value_counts() True 0
-                for i, ke in enumerate(a.keys()):
-                    # because other can contain all... others..
-                    # ke = ke.lower() # sometimes there are mixed upper and lower case keys...
-                    # ke = ke.replace(' \n', '') # some are with and without breaks
-                    temp_val = combined.get(ke, 0)
-                    temp_val = temp_val + a.values[i]
-                    combined[ke] = temp_val
-
-            # for i, ke in enumerate(a.keys()):
-            #    ke = ke.lower() # sometimes there are mixed upper and lower case keys...
-            #    ke = ke.replace(' \n', '') # some are with and without breaks
-            #    temp_val = combined.get(ke, 0)
-            #    temp_val = temp_val + a.values[i]
-            #    combined[ke] = temp_val
-        data = {"All": list(combined.values()), key: list(combined.keys())}
-    return data
-
-
-def prepare_data_research_field(
-    df: pd.DataFrame,
-    keylist: List[str],
-    key2: str = "researchArea",
-    sort_as=None,
-    display_dict=None,
-):  # -> dict, list:
-    """Creates a dict dictionary with data in the form needed by the plotting functions
-
-    We prepare several outputs, i.e y_keys because they can have different length and one should be able to create a
-    ColumnDataSource by ColumnDataSource(data=data)
-    :param df: [description]
-    :type df: pd.DataFrame
-    :param key: [description]
-    :type key: str
-
-    example:
-    prepare_data_research_field(df, key=careerLevel)
-        {'Cum. Sum': array([  0,   0, 130, 128, 148, 272,   0]),
-         'careerLevel': ['Director (of the institute)',
-          'Other',
-          'PhD student',
-          'Postdoc',
-          'Principal Investigator',
-          'Research associate',
-          'Undergraduate / Masters student'],
-         'researchArea': ['Engineering Science',
-          'Physics',
-          'Life Science',
-          'Earth Science',
-          'Chemistry',
-          'Other',
-          'Psychology',
-          'Mathematics'],
-         'Engineering Science': array([  0,   0,  47,  30,  52, 134,   0]),
-         'Physics': array([ 0,  0, 33, 38, 39, 57,  0]),
-         'Life Science': array([ 0,  0, 28, 29, 27, 33,  0]),
-         'Earth Science': array([ 0,  0,  8, 11, 18, 32,  0]),
-         'Chemistry': array([ 0,  0,  9, 12,  6,  4,  0]),
-         'Other': array([0, 0, 1, 2, 3, 6, 0]),
-         'Psychology': array([0, 0, 3, 2, 3, 2, 0]),
-         'Mathematics': array([0, 0, 1, 4, 0, 4, 0])}
-
-    """
-    research_areas = list(df[key2].value_counts().keys())
-    y_keys = ["Cum. Sum"] + research_areas
-    # Multiple columns will be combined. A single column will be treated differently
-    if len(keylist) == 1:
-        key = keylist[0]
-        all_areas = df[key].value_counts()
-        all_areas = all_areas.sort_index()
-        data = {
-            "Cum. Sum": all_areas.values,
-            key: list(all_areas.keys()),
-            "x_value": list(all_areas.keys()),
-        }
-        for area in research_areas:
-            area_counts = df[df[key2] == area][key].value_counts()
-            area_counts = area_counts.sort_index()
-            data[area] = area_counts.values
-    else:
-        # Cum. Sum. is buggy?
-        combined = {}
-        data = {}
-        for key in keylist:
-            if display_dict is not None:
-                xtick = display_dict[key]
-            else:
-                xtick = key
-            xtick = xtick.replace(" \n", "")
-            temp = df[key]
-            temp.replace(to_replace=True, value=xtick, inplace=True)
-            temp.replace(to_replace=False, value=None, inplace=True)
-            a = temp.value_counts()
-            # greedy, there is probably a pandas way to do this...
-            # there is a problem if df is empty, i.e temp.value_counts() True 0
-            if a.empty:
-                combined[xtick] = 0
-            else:
-                for i, ke in enumerate(a.keys()):
-                    # because other can contain all... others..
-                    # ke = ke.lower() # sometimes there are mixed upper and lower case keys...
-                    # ke = ke.replace(' \n', '') # some are with and without breaks
-                    temp_val = combined.get(ke, 0)
-                    temp_val = temp_val + a.values[i]
-                    combined[ke] = temp_val
-
-            # now fill research area specifics
-            for area in research_areas:
-                area_counts = df[df[key2] == area][key].copy()
-                area_counts.replace(to_replace=True, value=xtick, inplace=True)
-                area_counts.replace(to_replace=False, value=None, inplace=True)
-                area_counts = area_counts.value_counts()
-                area_counts = area_counts.sort_index()
-                temp = data.get(area, [])
-                # print(area_counts)
-                if area_counts.empty:
-                    temp.append(0)
-                else:
-                    temp.append(int(area_counts.values[0]))
-                data[area] = temp
-
-        data["Cum. Sum"] = list(combined.values())
-        data["x_value"] = list(combined.keys())
-
-    return data, y_keys
-
-
-'''
-def prepare_data_research_field(df: pd.DataFrame, key:str, key2:str='researchArea', sort_as=None):# -> dict, list:
-    """Creates a dict dictionary with data in the form needed by the plotting functions
-
-    We prepare several outputs, i.e y_keys because they can have different length and one should be able to create a
-    ColumnDataSource by ColumnDataSource(data=data)
-    :param df: [description]
-    :type df: pd.DataFrame
-    :param key: [description]
-    :type key: str
-
-    example:
-    prepare_data_research_field(df, key=careerLevel)
-        {'Cum. Sum': array([  0,   0, 130, 128, 148, 272,   0]),
-         'careerLevel': ['Director (of the institute)',
-          'Other',
-          'PhD student',
-          'Postdoc',
-          'Principal Investigator',
-          'Research associate',
-          'Undergraduate / Masters student'],
-         'researchArea': ['Engineering Science',
-          'Physics',
-          'Life Science',
-          'Earth Science',
-          'Chemistry',
-          'Other',
-          'Psychology',
-          'Mathematics'],
-         'Engineering Science': array([  0,   0,  47,  30,  52, 134,   0]),
-         'Physics': array([ 0,  0, 33, 38, 39, 57,  0]),
-         'Life Science': array([ 0,  0, 28, 29, 27, 33,  0]),
-         'Earth Science': array([ 0,  0,  8, 11, 18, 32,  0]),
-         'Chemistry': array([ 0,  0,  9, 12,  6,  4,  0]),
-         'Other': array([0, 0, 1, 2, 3, 6, 0]),
-         'Psychology': array([0, 0, 3, 2, 3, 2, 0]),
-         'Mathematics': array([0, 0, 1, 4, 0, 4, 0])}
-
-    """
-    all_areas = df[key].value_counts()
-    all_areas = all_areas.sort_index()
-    research_areas = list(df[key2].value_counts().keys())
-    data = {'Cum. Sum': all_areas.values, key:list(all_areas.keys()), 'x_value': list(all_areas.keys())}
-    y_keys = ['Cum. Sum'] + research_areas
-    for area in research_areas:
-        area_counts = df[df[key2] == area][key].value_counts()
-        area_counts = area_counts.sort_index()
-        data[area] = area_counts.values
-
-    return data, y_keys
-'''
-'''
-def prepare_data_research_field(df: pd.DataFrame, key:str):
-    """AI is creating summary for prepare_data_researchfield
-
-    :param df: [description]
-    :type df: pd.DataFrame
-    :param key: [description]
-    :type key: str
-    """
-    all_areas = df[key].value_counts()
-    all_areas = all_areas.sort_index()
-    data = {'All': {'counts': all_areas.values, 'values': list(all_areas.keys())}}
-    research_areas = list(df['researchArea'].value_counts().keys())
-    for area in research_areas:
-        area_counts = df[df["researchArea"] == area][key].value_counts()
-        area_counts = area_counts.sort_index()
-        data[area] = {'counts': area_counts.values, 'values': list(area_counts.keys())}
-
-    return data
-'''
-
-
-def percentage_to_area(data: List[float], scale_m: float = 1.0) -> List[float]:
+    rows = [i for i in sorted(range(len(labels1)), key=labels1.__getitem__) if counts[i].any()]
+    columns = [j for j in sorted(range(len(labels2)), key=labels2.__getitem__) if counts[:, j].any()]
+    table = counts[np.ix_(rows, columns)].astype(np.int64)
+    totals = table.sum(axis=1)
+
+    # melt order, all rows of the first column, then of the second column, ...
+    value = table.T.ravel()
+    total = np.tile(totals, len(columns))
+    return {
+        data_key1: np.array([labels1[i] for i in rows] * len(columns), dtype=object),
+        data_key2: np.array([labels2[j] for j in columns for _ in rows], dtype=object),
+        "value": value,
+        "total": total,
+        "percentage": (value / total) * 100,
+    }
+
+
+def percentage_to_area(data, scale_m: float = 1.0) -> np.ndarray:
     """
     Convert numbers in a given array to a radius,
 
     where a circle of with that radius is proportionate to the circle area
     Useful for circle plots where the area should be proportional to the value
+
+    Args:
+        data: Array like of non-negative numbers, e.g. percentages
+        scale_m: Factor applied to every value before taking the square root
+
+    Returns:
+        Float array of the radii, same shape as data
     """
-    radius_data = [2 * math.sqrt(val * scale_m / math.pi) for val in data]
-    return radius_data
+    return 2 * np.sqrt(np.asarray(data, dtype=float) * scale_m / np.pi)
@@ -61,16 +61,20 @@ callbacks = callback_manager.create_update_callbacks(widgets)
 # Bind callbacks to widgets and charts
 def bind_callbacks():
     """Bind all interactive callbacks to their respective widgets and charts."""
-    # Global filter callbacks for overview charts
-    for i, chart_key in enumerate(['ov1', 'ov2', 'ov3', 'ov4']):
-        widgets["global_filters"]["research_area"].param.watch(
-            lambda event, target=overview_charts[chart_key], callback=callbacks["overview"][i]: callback(target, event), 
-            "value"
-        )
-        widgets["global_filters"]["method"].param.watch(
-            lambda event, target=overview_charts[chart_key], callback=callbacks["overview"][i]: callback(target, event), 
-            "value"  
-        )
+    # Global filter callbacks, one debounced update of every chart depending on the filters
+    wordcloud_targets = [wordcloud_panes["methods"], wordcloud_panes["software"], wordcloud_panes["repositories"]]
+    global_updates = [
+        (callbacks["overview"][i], overview_charts[chart_key])
+        for i, chart_key in enumerate(['ov1', 'ov2', 'ov3', 'ov4'])
+    ]
+    global_updates += list(zip(callbacks["exploration"], exploration_charts))
+    global_updates.append((callbacks["correlation"], correlation_chart[0]))
+    global_updates += list(zip(callbacks["wordclouds"], wordcloud_targets))
+    callback_manager.bind_global_filters(
+        widgets["global_filters"]["research_area"],
+        widgets["global_filters"]["method"],
+        global_updates
+    )
 
     # Exploration chart callbacks
     for widget_key in ["question1", "question2", "chart_type1", "chart_type2"]:
@@ -80,18 +84,6 @@ def bind_callbacks():
             lambda event, target=target_chart, callback=callbacks["exploration"][callback_idx]: callback(target, event),
             "value"
         )
-    
-    # Global filter callbacks for exploration charts
-    for i, callback in enumerate(callbacks["exploration"]):
-        target_chart = exploration_charts[i]
-        widgets["global_filters"]["research_area"].param.watch(
-            lambda event, target=target_chart, callback=callback: callback(target, event), 
-            "value"
-        )
-        widgets["global_filters"]["method"].param.watch(
-            lambda event, target=target_chart, callback=callback: callback(target, event), 
-            "value"
-        )
 
     # Correlation chart callbacks
     widgets["exploration"]["question1"].param.watch(
@@ -102,27 +94,6 @@ def bind_callbacks():
         lambda event, target=correlation_chart[0], callback=callbacks["correlation"]: callback(target, event), 
         "value"
     )
-    widgets["global_filters"]["research_area"].param.watch(
-        lambda event, target=correlation_chart[0], callback=callbacks["correlation"]: callback(target, event), 
-        "value"
-    )
-    widgets["global_filters"]["method"].param.watch(
-        lambda event, target=correlation_chart[0], callback=callbacks["correlation"]: callback(target, event), 
-        "value"
-    )
-
-    # Word cloud callbacks
-    wordcloud_targets = [wordcloud_panes["methods"], wordcloud_panes["software"], wordcloud_panes["repositories"]]
-    for i, callback in enumerate(callbacks["wordclouds"]):
-        target = wordcloud_targets[i]
-        widgets["global_filters"]["research_area"].param.watch(
-            lambda event, target=target, callback=callback: callback(target, event), 
-            "value"
-        )
-        widgets["global_filters"]["method"].param.watch(
-            lambda event, target=target, callback=callback: callback(target, event), 
-            "value"
-        )
 
 # Create complete layout
 layout = layout_manager.create_complete_layout(
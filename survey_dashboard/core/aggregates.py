@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Precomputed answer counts per research area and data generation method combination.
+Chart queries and the cross tables of the correlation plot are answered from these
+counts without touching the respondent rows.
+"""
+
+import threading
+
+import numpy as np
+
+from survey_dashboard.core.encoding import EncodedSurvey
+
+
+def superset_sums(counts: np.ndarray, n_bits: int) -> np.ndarray:
+    """
+    Sum the counts of every bit combination over all its supersets.
+
+    Args:
+        counts: Array whose first axis is indexed by a combination of n_bits flags
+        n_bits: Number of flags
+
+    Returns:
+        Array of the same shape, entry S holds the sum of all entries C with C & S == S
+    """
+    sums = counts.reshape((2,) * n_bits + counts.shape[1:]).copy()
+    for axis in range(n_bits):
+        without = [slice(None)] * sums.ndim
+        with_bit = [slice(None)] * sums.ndim
+        without[axis] = 0
+        with_bit[axis] = 1
+        sums[tuple(without)] += sums[tuple(with_bit)]
+    return sums.reshape(counts.shape)
+
+
+class CountCube:
+    """
+    Answer counts per (data generation method combination, research area, answer).
+
+    Every respondent falls into exactly one combination of the method flags. The
+    counts are summed over all supersets of each combination, so the respondents
+    using at least the selected methods are a single lookup. Tables are built on
+    first use per question and are read-only afterwards; build() precomputes them.
+    Cross tables of two single choice questions are kept the same way, with the
+    answer pairs of respondents who answered both and have a research area.
+    """
+
+    def __init__(self, encoded: EncodedSurvey, method_columns: list, by: str):
+        self.encoded = encoded
+        self.method_columns = list(method_columns)
+        self.by = by
+        self._bits = {column: 1 << i for i, column in enumerate(self.method_columns)}
+        self._n_combinations = 1 << len(self.method_columns)
+        self._n_groups = len(encoded.categories(by)) + 1
+        self._tables = {}
+        self._crosstabs = {}
+        self._lock = threading.Lock()
+
+        weights = np.left_shift(1, np.arange(len(self.method_columns)))
+        combinations = encoded.flags(self.method_columns).astype(np.intp) @ weights if self.method_columns else 0
+        self._combinations = np.broadcast_to(combinations, (encoded.n_rows,))
+        # Index into (combination, research area) for every respondent
+        self._cells = self._combinations * self._n_groups + encoded.group_codes(by)
+        self._respondents = self._finish(
+            np.bincount(self._cells, minlength=self._n_combinations * self._n_groups), 1
+        )
+
+    def _finish(self, counts: np.ndarray, n_answers: int) -> np.ndarray:
+        """Reshape flat cell counts to (combination, area, answer), sum supersets and freeze."""
+        counts = counts.reshape(self._n_combinations, self._n_groups, n_answers)
+        table = superset_sums(counts.astype(np.int32), len(self.method_columns))
+        table.flags.writeable = False
+        return table
+
+    def _build(self, columns: tuple) -> np.ndarray:
+        """Count one question, a single choice column or the subcolumns of a multiple choice question."""
+        if len(columns) == 1 and not self.encoded.is_flag(columns[0]):
+            codes = self.encoded.codes(columns[0])
+            answered = codes >= 0
+            n_answers = len(self.encoded.categories(columns[0]))
+            cells = self._cells[answered] * n_answers + codes[answered]
+        else:
+            row_index, answers = np.nonzero(self.encoded.flags(list(columns)))
+            n_answers = len(columns)
+            cells = self._cells[row_index] * n_answers + answers
+        counts = np.bincount(cells, minlength=self._n_combinations * self._n_groups * n_answers)
+        return self._finish(counts, n_answers)
+
+    def build(self, questions: list):
+        """Precompute the tables of the given questions, each a list of columns."""
+        for columns in questions:
+            self.table(columns, [])
+
+    def _build_crosstab(self, column1: str, column2: str) -> np.ndarray:
+        """Count the answer pairs of two single choice columns per method combination."""
+        codes1 = self.encoded.codes(column1)
+        codes2 = self.encoded.codes(column2)
+        n1 = len(self.encoded.categories(column1))
+        n2 = len(self.encoded.categories(column2))
+        rows = (codes1 >= 0) & (codes2 >= 0) & (self.encoded.codes(self.by) >= 0)
+        cells = (self._combinations[rows] * n1 + codes1[rows]) * n2 + codes2[rows]
+        counts = np.bincount(cells, minlength=self._n_combinations * n1 * n2).reshape(self._n_combinations, n1, n2)
+        table = superset_sums(counts.astype(np.int32), len(self.method_columns))
+        table.flags.writeable = False
+        return table
+
+    def build_crosstabs(self, pairs: list):
+        """Precompute the cross tables of the given (column1, column2) pairs."""
+        for column1, column2 in pairs:
+            self.crosstab(column1, column2, [])
+
+    def crosstab(self, column1: str, column2: str, method_columns: list) -> np.ndarray:
+        """
+        Cross table of two single choice columns for respondents using at least the given methods.
+
+        Only respondents who answered both columns and have a research area are counted.
+
+        Returns:
+            Read-only array of shape (len(categories(column1)), len(categories(column2)))
+        """
+        key = (column1, column2)
+        table = self._crosstabs.get(key)
+        if table is None:
+            with self._lock:
+                table = self._crosstabs.get(key)
+                if table is None:
+                    table = self._build_crosstab(column1, column2)
+                    self._crosstabs[key] = table
+        return table[self.combination(method_columns)]
+
+    def combination(self, method_columns: list) -> int:
+        """Bit combination of the given method columns, unknown columns are ignored."""
+        return sum(self._bits.get(column, 0) for column in set(method_columns))
+
+    def table(self, columns: list, method_columns: list) -> np.ndarray:
+        """
+        Answer counts of respondents using at least the given methods.
+
+        Returns:
+            Read-only array of shape (len(categories(by)) + 1, answers), the last row
+            holds the respondents without a research area.
+        """
+        key = tuple(columns)
+        table = self._tables.get(key)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(key)
+                if table is None:
+                    table = self._build(key)
+                    self._tables[key] = table
+        return table[self.combination(method_columns)]
+
+    def respondents(self, method_columns: list) -> np.ndarray:
+        """Number of respondents per research area using at least the given methods, no area last."""
+        return self._respondents[self.combination(method_columns), :, 0]
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Inverted index of the survey as packed bitmaps, one bit per respondent.
+Filter selections are bitwise AND/OR of bitmaps, counts are popcounts.
+"""
+
+import threading
+
+import numpy as np
+
+from survey_dashboard.core.encoding import EncodedSurvey
+
+if hasattr(np, "bitwise_count"):
+    _bitwise_count = np.bitwise_count
+else:
+    # numpy < 2.0, number of set bits of every byte value
+    _BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+    def _bitwise_count(bits: np.ndarray) -> np.ndarray:
+        return _BYTE_POPCOUNT[np.ascontiguousarray(bits).view(np.uint8)]
+
+
+def popcount(bits: np.ndarray) -> np.ndarray:
+    """Number of set bits along the last axis of packed bitmaps."""
+    return _bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+
+
+class BitsetIndex:
+    """
+    One packed bitmap per (column, answer) and per multiple choice subcolumn.
+
+    Bitmaps are arrays of uint64 words holding the output of np.packbits, bits past
+    the last respondent are always zero. The bitmaps of a column are built from the
+    EncodedSurvey on first use and are read-only afterwards.
+    """
+
+    def __init__(self, encoded: EncodedSurvey):
+        self.encoded = encoded
+        self.n_rows = encoded.n_rows
+        self.n_words = (self.n_rows + 63) // 64
+        self._all = self.pack(np.ones(self.n_rows, dtype=bool))
+        self._values = {}
+        self._groups = {}
+        self._flags = {}
+        # Reentrant, the bitmaps of a column are built from the bitmaps of another one
+        self._lock = threading.RLock()
+
+    def _pack_rows(self, masks: np.ndarray) -> np.ndarray:
+        """Bitmaps of a boolean matrix of shape (n, rows), shape (n, n_words)."""
+        packed = np.zeros((len(masks), self.n_words * 8), dtype=np.uint8)
+        packed[:, :(self.n_rows + 7) // 8] = np.packbits(masks, axis=1, bitorder="little")
+        return packed.view(np.uint64)
+
+    def pack(self, mask: np.ndarray) -> np.ndarray:
+        """Bitmap of a boolean row mask."""
+        bits = self._pack_rows(mask[None, :])[0]
+        bits.flags.writeable = False
+        return bits
+
+    def unpack(self, bits: np.ndarray) -> np.ndarray:
+        """Boolean row mask of a bitmap, e.g. to select rows of the survey table."""
+        mask = np.unpackbits(bits.view(np.uint8), count=self.n_rows, bitorder="little").astype(bool)
+        mask.flags.writeable = False
+        return mask
+
+    def all_rows(self) -> np.ndarray:
+        """Bitmap of all respondents."""
+        return self._all
+
+    def _memoized(self, memo: dict, key, build) -> np.ndarray:
+        bits = memo.get(key)
+        if bits is None:
+            with self._lock:
+                bits = memo.get(key)
+                if bits is None:
+                    bits = build()
+                    bits.flags.writeable = False
+                    memo[key] = bits
+        return bits
+
+    def values(self, column: str) -> np.ndarray:
+        """Bitmaps of a single choice column, shape (len(categories(column)), bytes)."""
+        def build():
+            codes = self.encoded.codes(column)
+            n_categories = len(self.encoded.categories(column))
+            return self._pack_rows(codes[None, :] == np.arange(n_categories)[:, None])
+
+        return self._memoized(self._values, column, build)
+
+    def groups(self, by: str) -> np.ndarray:
+        """Bitmaps of the categories of `by` and a last one of the respondents without an answer."""
+        def build():
+            values = self.values(by)
+            missing = self._all & ~np.bitwise_or.reduce(values, axis=0) if len(values) else self._all
+            return np.vstack([values, missing])
+
+        return self._memoized(self._groups, by, build)
+
+    def answered(self, column: str) -> np.ndarray:
+        """Bitmap of respondents who answered a single choice column."""
+        return self._all & ~self.groups(column)[-1]
+
+    def flag(self, column: str) -> np.ndarray:
+        """Bitmap of respondents who ticked a multiple choice subcolumn."""
+        return self._memoized(self._flags, column, lambda: self._pack_rows(self.encoded.flag(column)[None, :])[0])
+
+    def all_of(self, columns: list) -> np.ndarray:
+        """Bitmap of respondents who ticked every one of the given subcolumns."""
+        bits = self._all.copy()
+        for column in columns:
+            bits &= self.flag(column)
+        return bits
+
+    def any_of(self, column: str, codes: list) -> np.ndarray:
+        """Bitmap of respondents whose answer to a single choice column is one of the given codes."""
+        return np.bitwise_or.reduce(self.values(column)[list(codes)], axis=0) if len(codes) else np.zeros_like(self._all)
+
+    def count_by(self, column: str, by: str, bits: np.ndarray) -> np.ndarray:
+        """
+        Count the answers of a single choice column per category of another column.
+
+        Args:
+            column: Column whose categories are counted
+            by: Column to group by
+            bits: Bitmap of the respondents to count
+
+        Returns:
+            Array of shape (len(categories(by)) + 1, len(categories(column))), the last
+            row holds the respondents without an answer in `by`.
+        """
+        return popcount((self.groups(by) & bits)[:, None, :] & self.values(column)[None, :, :])
+
+    def count_flags_by(self, columns: list, by: str, bits: np.ndarray) -> np.ndarray:
+        """
+        Count the ticked multiple choice subcolumns per category of another column.
+
+        Returns:
+            Array of shape (len(categories(by)) + 1, len(columns)), laid out as in count_by.
+        """
+        flags = np.vstack([self.flag(column) for column in columns])
+        return popcount((self.groups(by) & bits)[:, None, :] & flags[None, :, :])
+
+    def count_rows_by(self, by: str, bits: np.ndarray) -> np.ndarray:
+        """Number of selected respondents per category of `by`, missing answers last."""
+        return popcount(self.groups(by) & bits)
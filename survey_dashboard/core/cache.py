@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Result cache shared by all sessions of a worker process.
+Cached values are frozen, every caller gets its own mutable copy via thaw().
+"""
+
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+import numpy as np
+
+
+def freeze(value):
+    """
+    Return a read-only version of a result.
+
+    Dicts become mapping proxies, lists become tuples and numpy arrays are made
+    read-only, nested values are frozen as well. Arrays that are still writeable
+    are copied first, so the caller's own arrays stay untouched.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(val) for key, val in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(val) for val in value)
+    if isinstance(value, np.ndarray) and value.flags.writeable:
+        value = value.copy()
+        value.flags.writeable = False
+    return value
+
+
+def thaw(value):
+    """
+    Return a mutable copy of a frozen result.
+
+    Mapping proxies become dicts and tuples inside them become lists again. Tuples
+    nested in those lists, e.g. tooltips, are kept. Arrays are shared read-only.
+    """
+    if isinstance(value, MappingProxyType):
+        return {key: thaw(val) for key, val in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(val) if isinstance(val, MappingProxyType) else val for val in value]
+    return value
+
+
+class LRUCache:
+    """
+    Thread-safe, bounded least recently used cache with hit and miss counters.
+
+    Values are computed outside of the lock, so a slow computation does not block
+    other sessions. Two sessions missing the same key at once may both compute it.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key, compute):
+        """Return the value cached for key, computing and storing it with compute() on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+        if self.maxsize <= 0:
+            return value
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def items(self) -> list:
+        """Snapshot of the cached (key, value) pairs, least recently used first."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Hit and miss counters and the current size of the cache."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / requests if requests else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
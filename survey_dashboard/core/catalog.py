@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Lookup tables between question texts, question keys and survey columns.
+Built once at import from the survey dictionaries, every lookup is a dict access.
+"""
+
+import re
+import threading
+from types import MappingProxyType
+
+from survey_dashboard.data.hcs_clean_dictionaries import (
+    HCSquestions,
+    HCS_colnamesDict,
+    HCS_MCList,
+    HCS_MCsubquestions,
+)
+
+
+def natural_key(text: str) -> tuple:
+    """Sort key ordering the numbers in a string by value, e.g. _1 _2 _10."""
+    return tuple(int(part) if part.isdigit() else part for part in re.split(r"(\d+)", text))
+
+
+class QuestionCatalog:
+    """
+    Immutable mapping of the survey questions to their columns and back.
+
+    The column tables are built on creation, the question text tables of a
+    language on its first lookup.
+
+    Attributes:
+        columns: Original key to the renamed survey columns holding its answers,
+            one column for every key of HCS_colnamesDict, the subcolumns in
+            natural order for the multiple choice keys of HCS_MCList
+        column_questions: Survey column to its key in columns, the multiple
+            choice key for subcolumns
+    """
+
+    def __init__(self):
+        self._original_names = {column: original for original, column in HCS_colnamesDict.items()}
+
+        # Subcolumns by the key before the "/", free text "other" answers are not
+        # part of HCS_MCsubquestions
+        subcolumns = {}
+        for original, column in HCS_colnamesDict.items():
+            key, separator, _ = original.partition("/")
+            if separator and "other" not in original:
+                subcolumns.setdefault(key, []).append(column)
+
+        columns = {original: (column,) for original, column in HCS_colnamesDict.items()}
+        for key in HCS_MCList:
+            columns[key] = tuple(sorted(subcolumns.get(key, ()), key=natural_key))
+        column_questions = {column: original for column, original in self._original_names.items()}
+        column_questions.update({column: key for key in HCS_MCList for column in columns[key]})
+
+        self.columns = MappingProxyType(columns)
+        self.column_questions = MappingProxyType(column_questions)
+        self._languages = {}
+        self._lock = threading.Lock()
+
+    def _language(self, lang: str) -> tuple:
+        """Question text to key and key to question text tables of a language."""
+        tables = self._languages.get(lang)
+        if tables is None:
+            with self._lock:
+                tables = self._languages.get(lang)
+                if tables is None:
+                    tables = self._languages[lang] = self._build_language(HCSquestions[lang])
+        return tables
+
+    def _build_language(self, questions: dict) -> tuple:
+        texts = {
+            column: questions[original] for column, original in self._original_names.items() if original in questions
+        }
+        # Multiple choice keys of HCS_MCList share the question of their first subcolumn
+        for key in HCS_MCList:
+            if key in HCS_MCsubquestions:
+                original = self._original_names[next(iter(HCS_MCsubquestions[key]))].split("/")[0]
+                if original in questions:
+                    texts[key] = questions[original]
+        keys = {text: key for key, text in questions.items()}
+        return MappingProxyType(keys), MappingProxyType(texts)
+
+    def questions(self, lang: str) -> MappingProxyType:
+        """Question text to original question key, in the given language."""
+        return self._language(lang)[0]
+
+    def texts(self, lang: str) -> MappingProxyType:
+        """Column name or HCS_MCList key to question text, in the given language."""
+        return self._language(lang)[1]
+
+    def question_columns(self, question: str, lang: str) -> tuple:
+        """Survey columns of a question text, with or without the ★ correlation indicator prefix."""
+        return self.columns[self.questions(lang)[question.replace("★ ", "")]]
+
+    def question_text(self, key: str, lang: str) -> str:
+        """Question text of a survey column or of a multiple choice key of HCS_MCList."""
+        return self.texts(lang)[key]
+
+
+QUESTION_CATALOG = QuestionCatalog()
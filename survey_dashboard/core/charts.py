@@ -13,6 +13,8 @@ Chart creation module for the survey dashboard.
 Handles creation of all chart types and visualizations.
 """
 
+from functools import partial
+
 import panel as pn
 
 from survey_dashboard.plots import (
@@ -22,6 +24,10 @@ from survey_dashboard.plots import (
     create_legend_corr,
     generate_wordcloud,
     interactive_wordcloud,
+    wordcloud_data,
+    update_barchart,
+    update_corr_plot,
+    update_wordcloud,
     DEFAULT_FIGURE_WIDTH,
     DEFAULT_FIGURE_HEIGHT
 )
@@ -33,6 +39,8 @@ from survey_dashboard.core.config import (
     SIZING_MODE,
     LANGUAGE
 )
+from survey_dashboard.core.prebuilt import get_figure_pool
+from survey_dashboard.core.wordclouds import get_wordcloud_cache
 from survey_dashboard.i18n.text_display import (
     md_text_tools_used,
     md_text_tools_tabs
@@ -42,100 +50,131 @@ from survey_dashboard.i18n.text_display import (
 class ChartManager:
     """Manages creation of all chart types."""
     
-    def __init__(self, data_processor):
-        """Initialize chart manager with data processor."""
+    def __init__(self, data_processor, layout_cache=None, figure_pool=None):
+        """
+        Initialize chart manager with data processor, the word cloud layout cache and
+        the pool of prebuilt initial figures, the shared ones by default.
+        """
         self.data_processor = data_processor
+        self.layout_cache = get_wordcloud_cache() if layout_cache is None else layout_cache
+        self.figure_pool = get_figure_pool() if figure_pool is None else figure_pool
         self.half_width = int(ACCORDION_WIDTH / 2)
-    
-    def create_overview_charts(self, data_filters, data_filters_method):
-        """Create all overview charts."""
-        overview_charts = {}
-        
-        # Get overview question mappings
-        overview_questions = {
-            'ov1': self.data_processor.map_qkey_to_question(DEFAULT_QUESTIONS["overview"]["ov1"]),
-            'ov2': self.data_processor.map_qkey_to_question(DEFAULT_QUESTIONS["overview"]["ov2"]),
-            'ov3': self.data_processor.map_qkey_to_question(DEFAULT_QUESTIONS["overview"]["ov3"]),
-            'ov4': self.data_processor.map_qkey_to_question(DEFAULT_QUESTIONS["overview"]["ov4"])
-        }
-        
-        # Create each overview chart
-        for key, question in overview_questions.items():
-            start_display_data, ydata_spec, display_options = self.data_processor.select_data(
-                question, data_filters, data_filters_method
-            )
-            y_keys = ydata_spec.data["y_keys"]
-            
-            overview_charts[key] = pn.pane.Bokeh(
-                bokeh_barchart(
-                    start_display_data,
-                    y=y_keys,
-                    factors=y_keys,
-                    legend_labels=y_keys,
-                    fill_color=ydata_spec.data["colors"],
-                    orientation="vertical",
-                    **display_options,
-                )
+
+    def _take(self, key, build):
+        """
+        Take a figure from the pool and refill it once the page of the session has loaded.
+
+        Building the next figures while the session still renders its page would
+        compete with it for the interpreter. Without a session the refill starts at once.
+        """
+        figure = self.figure_pool.take(key, build)
+        pn.state.onload(partial(self.figure_pool.fill, key, build))
+        return figure
+
+    def _overview_entries(self, data_filters, data_filters_method):
+        """Pool keys and build functions of the overview charts, see FigurePool.take."""
+        return {
+            key: self._barchart_entry(
+                self.data_processor.map_qkey_to_question(DEFAULT_QUESTIONS["overview"][key]),
+                data_filters, data_filters_method
             )
-        
-        return overview_charts
-    
-    def create_exploration_charts(self, question_select, question_select2, data_filters, data_filters_method):
-        """Create exploration charts."""
-        # First exploration chart
+            for key in ['ov1', 'ov2', 'ov3', 'ov4']
+        }
+
+    def _barchart_entry(self, question, data_filters, data_filters_method):
+        """Pool key and build function of the vertical bar chart of a question."""
+        filters, methods = list(data_filters), list(data_filters_method)
+        key = ("barchart", question, tuple(filters), tuple(methods))
+        return key, partial(self._build_barchart, question, filters, methods)
+
+    def _build_barchart(self, question, data_filters, data_filters_method):
+        """Build the vertical bar chart of a question."""
         start_display_data, ydata_spec, display_options = self.data_processor.select_data(
-            question_select.value, data_filters, data_filters_method
+            question, data_filters, data_filters_method
         )
         y_keys = ydata_spec.data["y_keys"]
-        fill_colors = ydata_spec.data["colors"]
-        
-        fig_exp1 = pn.pane.Bokeh(
-            bokeh_barchart(
-                start_display_data,
-                y=y_keys,
-                factors=y_keys,
-                legend_labels=y_keys,
-                fill_color=fill_colors,
-                orientation="vertical",
-                **display_options,
-            )
+        return bokeh_barchart(
+            start_display_data,
+            y=y_keys,
+            factors=y_keys,
+            legend_labels=y_keys,
+            fill_color=ydata_spec.data["colors"],
+            orientation="vertical",
+            **display_options,
         )
-        
-        # Second exploration chart
-        start_display_data, ydata_spec, display_options = self.data_processor.select_data(
-            question_select2.value, data_filters, data_filters_method
+
+    def _correlation_entry(self, question1, question2, data_filters, data_filters_method):
+        """Pool key and build function of the correlation plot and its legend."""
+        filters, methods = list(data_filters), list(data_filters_method)
+        key = ("correlation", question1, question2, tuple(filters), tuple(methods))
+        return key, partial(self._build_correlation, question1, question2, filters, methods)
+
+    def _build_correlation(self, question1, question2, data_filters, data_filters_method):
+        """Build the correlation plot of two questions and its legend."""
+        start_corr_data, display_options_corr, marker_scale = self.data_processor.select_data_corr(
+            question1, question2, data_filters, data_filters_method
         )
-        y_keys = ydata_spec.data["y_keys"]
-        fill_colors = ydata_spec.data["colors"]
-        
-        fig_exp2 = pn.pane.Bokeh(
-            bokeh_barchart(
-                start_display_data,
-                y=y_keys,
-                factors=y_keys,
-                legend_labels=y_keys,
-                fill_color=fill_colors,
-                orientation="vertical",
-                **display_options,
+        fig_corr = bokeh_corr_plot(start_corr_data, **display_options_corr)
+        legend = create_legend_corr(fig_corr, colors=start_corr_data.data["color"], scale_m=marker_scale)
+        return fig_corr, legend
+
+    def _wordcloud_entries(self, data_filters, data_filters_method):
+        """Pool keys and build functions of the word cloud tabs, per content type."""
+        filters, methods = list(data_filters), list(data_filters_method)
+        return {
+            content_type: (
+                ("wordcloud", content_type, tuple(filters), tuple(methods)),
+                partial(self._build_wordcloud_tab, filters, methods, content_fields),
             )
-        )
-        
+            for content_type, content_fields in WORDCLOUD_CONTENT.items()
+        }
+
+    def _build_wordcloud_tab(self, data_filters, data_filters_method, content_fields):
+        """Build the word cloud of a tab, returns the figure and the size of its pane."""
+        wordcloud = self.layout_wordcloud(data_filters, data_filters_method, content_fields, width=ACCORDION_WIDTH)
+        return interactive_wordcloud(wordcloud), wordcloud.width, wordcloud.height
+
+    def prebuild_initial_charts(self, question1, question2, data_filters, data_filters_method):
+        """
+        Build the figures of the initial dashboard state in the background.
+
+        Called once per process ahead of the first session, the create_* methods
+        then take these figures from the pool instead of building them.
+        """
+        entries = [
+            *self._overview_entries(data_filters, data_filters_method).values(),
+            self._barchart_entry(question1, data_filters, data_filters_method),
+            self._barchart_entry(question2, data_filters, data_filters_method),
+            self._correlation_entry(question1, question2, data_filters, data_filters_method),
+            *self._wordcloud_entries(data_filters, data_filters_method).values(),
+        ]
+        for key, build in entries:
+            self.figure_pool.fill(key, build)
+
+    def create_overview_charts(self, data_filters, data_filters_method):
+        """Create all overview charts."""
+        return {
+            key: pn.pane.Bokeh(self._take(*entry))
+            for key, entry in self._overview_entries(data_filters, data_filters_method).items()
+        }
+    
+    def create_exploration_charts(self, question_select, question_select2, data_filters, data_filters_method):
+        """Create exploration charts."""
+        fig_exp1 = pn.pane.Bokeh(self._take(
+            *self._barchart_entry(question_select.value, data_filters, data_filters_method)
+        ))
+        fig_exp2 = pn.pane.Bokeh(self._take(
+            *self._barchart_entry(question_select2.value, data_filters, data_filters_method)
+        ))
         return fig_exp1, fig_exp2
     
     def create_correlation_chart(self, question_select, question_select2, data_filters, data_filters_method):
         """Create correlation chart with legend."""
-        start_corr_data, display_options_corr, marker_scale = self.data_processor.select_data_corr(
+        fig_corr_1, legend = self._take(*self._correlation_entry(
             question_select.value, question_select2.value, data_filters, data_filters_method
-        )
-        fig_corr_1 = bokeh_corr_plot(start_corr_data, **display_options_corr)
+        ))
         fig_corr = pn.pane.Bokeh(fig_corr_1, align="center")
-        
-        leg_corr = pn.pane.Bokeh(
-            create_legend_corr(
-                fig_corr_1, colors=start_corr_data.data["color"], scale_m=marker_scale
-            ),
-            align="center",
-        )
+        leg_corr = pn.pane.Bokeh(legend, align="center")
         
         return fig_corr, leg_corr
     
@@ -144,17 +183,12 @@ class ChartManager:
         wordcloud_panes = {}
         
         # Create word clouds for each content type
-        for content_type, content_fields in WORDCLOUD_CONTENT.items():
-            text_list = self.data_processor.select_data_wordcloud(
-                data_filters, data_filters_method, content=content_fields
-            )
-            wordcloud = generate_wordcloud(
-                text_list, height=DEFAULT_FIGURE_HEIGHT, width=ACCORDION_WIDTH
-            )
+        for content_type, entry in self._wordcloud_entries(data_filters, data_filters_method).items():
+            wordcloud_fig, width, height = self._take(*entry)
             wordcloud_panes[content_type] = pn.pane.Bokeh(
-                interactive_wordcloud(wordcloud),
-                width=wordcloud.width,
-                height=wordcloud.height + OFFSET_HEIGHT_FOR_TABS,
+                wordcloud_fig,
+                width=width,
+                height=height + OFFSET_HEIGHT_FOR_TABS,
             )
         
         # Create tabs
@@ -172,23 +206,39 @@ class ChartManager:
 
     def create_chart(self, question, data_filters, data_filters_method, chart_type):
         """Create a chart of the specified type."""
+        return self.render_chart(None, self.prepare_chart(question, data_filters, data_filters_method, chart_type))
+
+    def update_chart(self, fig, question, data_filters, data_filters_method, chart_type):
+        """
+        Update a chart in place, rebuild it if the glyphs do not fit the new data.
+
+        Args:
+            fig: Figure shown so far, may be None
+
+        Returns:
+            The updated figure, a new figure if it had to be rebuilt
+        """
+        return self.render_chart(fig, self.prepare_chart(question, data_filters, data_filters_method, chart_type))
+
+    def prepare_chart(self, question, data_filters, data_filters_method, chart_type):
+        """
+        Select the data of a chart and the keyword arguments of its plot function.
+
+        Does not touch any document, so it may run outside of the session's thread.
+
+        Returns:
+            tuple: (df, plot_options, chart_type) for render_chart
+        """
         df, ydata_spec, display_options = self.data_processor.select_data(
             question, data_filters, data_filters_method
         )
 
         y_keys = ydata_spec.data["y_keys"]
         fill_colors = ydata_spec.data["colors"]
+        plot_options = {"y": y_keys, "legend_labels": y_keys, "fill_color": fill_colors}
 
         if chart_type == "Vertical Bar chart":
-            fig = bokeh_barchart(
-                df,
-                y=y_keys,
-                factors=y_keys,
-                legend_labels=y_keys,
-                fill_color=fill_colors,
-                orientation="vertical",
-                **display_options,
-            )
+            plot_options.update(factors=y_keys, orientation="vertical")
         elif chart_type == "Horizontal Bar chart":
             # Swap the ranges for horizontal orientation
             y_range = display_options["y_range"]
@@ -198,43 +248,85 @@ class ChartManager:
             # Swap the labels for horizontal orientation
             display_options["xlabel"] = ""  # X axis lays vertically but shows categorical data
             display_options["ylabel"] = "Number of Answers"  # Y axis now lays horizontally but still shows numerical data
-            
-            fig = bokeh_barchart(
-                df,
-                y=y_keys,
-                factors=y_keys,
-                legend_labels=y_keys,
-                fill_color=fill_colors,
-                orientation="horizontal",
-                **display_options,
-            )
+            plot_options.update(factors=y_keys, orientation="horizontal")
         elif chart_type == "Pie chart":
             display_options.pop("x_range")
             display_options.pop("y_range")
             display_options.pop("width")
-            fig = bokeh_piechart(
-                df,
-                y=y_keys,
-                legend_labels=y_keys,
-                fill_color=fill_colors,
-                **display_options,
-            )
-        
+
+        plot_options.update(display_options)
+        return df, plot_options, chart_type
+
+    def render_chart(self, fig, prepared):
+        """Show the output of prepare_chart in fig if possible, otherwise in a new figure."""
+        df, plot_options, chart_type = prepared
+        # Pie charts are always rebuilt, their wedges are laid out from the data
+        if chart_type != "Pie chart" and fig is not None and update_barchart(fig, df, **plot_options):
+            return fig
+
+        if chart_type in ("Vertical Bar chart", "Horizontal Bar chart"):
+            fig = bokeh_barchart(df, **plot_options)
+        elif chart_type == "Pie chart":
+            fig = bokeh_piechart(df, **plot_options)
+
         return fig
 
     def create_correlation_plot(self, question1, question2, data_filters, data_filters_method):
         """Create correlation plot."""
+        return self.render_correlation_plot(
+            None, self.prepare_correlation_plot(question1, question2, data_filters, data_filters_method)
+        )
+
+    def update_correlation_plot(self, fig, question1, question2, data_filters, data_filters_method):
+        """Update the correlation plot in place, returns a new plot if it had to be rebuilt."""
+        return self.render_correlation_plot(
+            fig, self.prepare_correlation_plot(question1, question2, data_filters, data_filters_method)
+        )
+
+    def prepare_correlation_plot(self, question1, question2, data_filters, data_filters_method):
+        """Select the data of the correlation plot, see prepare_chart."""
         df, display_options, marker_scale = self.data_processor.select_data_corr(
             question1, question2, data_filters, data_filters_method
         )
+        return df, display_options
+
+    def render_correlation_plot(self, fig, prepared):
+        """Show the output of prepare_correlation_plot in fig if possible, otherwise in a new plot."""
+        df, display_options = prepared
+        if fig is not None and update_corr_plot(fig, df, **display_options):
+            return fig
         return bokeh_corr_plot(df, **display_options)
 
     def create_wordcloud(self, data_filters, data_filters_method, content):
         """Create word cloud visualization."""
+        return self.render_wordcloud(None, self.prepare_wordcloud(data_filters, data_filters_method, content))
+
+    def update_wordcloud(self, fig, data_filters, data_filters_method, content):
+        """Update a word cloud in place, returns a new figure if it had to be rebuilt."""
+        return self.render_wordcloud(fig, self.prepare_wordcloud(data_filters, data_filters_method, content))
+
+    def prepare_wordcloud(self, data_filters, data_filters_method, content):
+        """
+        Lay out the words of a word cloud and compute their glyph data, see prepare_chart.
+
+        Returns:
+            tuple: (wordcloud, data) for render_wordcloud
+        """
+        wordcloud = self.layout_wordcloud(data_filters, data_filters_method, content)
+        return wordcloud, wordcloud_data(wordcloud)
+
+    def layout_wordcloud(self, data_filters, data_filters_method, content, width=DEFAULT_FIGURE_WIDTH):
+        """Word cloud of the answers in the content columns, laid out through the layout cache."""
         text_list = self.data_processor.select_data_wordcloud(
             data_filters, data_filters_method, content=content
         )
-        wordcloud = generate_wordcloud(
-            text_list, height=DEFAULT_FIGURE_HEIGHT, width=DEFAULT_FIGURE_WIDTH
+        return generate_wordcloud(
+            text_list, height=DEFAULT_FIGURE_HEIGHT, width=width, layout_cache=self.layout_cache
         )
-        return interactive_wordcloud(wordcloud)
\ No newline at end of file
+
+    def render_wordcloud(self, fig, prepared):
+        """Show the output of prepare_wordcloud in fig if possible, otherwise in a new figure."""
+        wordcloud, data = prepared
+        if fig is not None and update_wordcloud(fig, wordcloud, data):
+            return fig
+        return interactive_wordcloud(wordcloud, data)
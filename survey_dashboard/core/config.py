@@ -17,11 +17,7 @@ import os
 from pathlib import Path
 
 from survey_dashboard.plots import DEFAULT_FIGURE_WIDTH
-from survey_dashboard.data.hcs_clean_dictionaries import (
-    HCSquestions,
-    HCS_colnamesDict,
-    HCS_MCsubquestions,
-)
+from survey_dashboard.data import hcs_clean_dictionaries
 from survey_dashboard.hmc_layout.hmc_colordicts import (
   hubPalette,
   get_hmc_colors
@@ -38,7 +34,40 @@ def get_data_path():
     this_folder = Path(__file__).parent.parent
     return this_folder / "data" / "hmc_survey_2021_data.csv"
 
-DATAFILE_PATH = str(get_data_path())
+# Survey CSV shown by the dashboard, e.g. a synthetic survey of benchmarks/synthetic_survey.py
+DATAFILE_PATH = os.environ.get("SURVEY_DASHBOARD_DATA_FILE", str(get_data_path()))
+
+# Directory for the columnar cache of the survey data, set to an empty string to disable
+DATA_CACHE_DIR = os.environ.get(
+    "SURVEY_DASHBOARD_CACHE_DIR", str(Path.home() / ".cache" / "survey_dashboard")
+)
+
+# Number of chart query results shared between the sessions of a worker process, 0 disables the cache
+RESULT_CACHE_SIZE = int(os.environ.get("SURVEY_DASHBOARD_RESULT_CACHE_SIZE", "512"))
+
+# Global filter changes within this many milliseconds are combined into one chart update, 0 disables it
+FILTER_DEBOUNCE_MS = int(os.environ.get("SURVEY_DASHBOARD_FILTER_DEBOUNCE_MS", "150"))
+
+# Threads preparing chart data and word clouds outside of the event loop, 0 runs them in the callbacks
+WORKER_THREADS = int(os.environ.get("SURVEY_DASHBOARD_WORKER_THREADS", "2"))
+
+# Number of word cloud layouts kept in memory per worker process, 0 disables the cache
+WORDCLOUD_CACHE_SIZE = int(os.environ.get("SURVEY_DASHBOARD_WORDCLOUD_CACHE_SIZE", "256"))
+
+# Directory storing word cloud layouts across restarts, empty (the default) keeps them in memory only
+WORDCLOUD_CACHE_DIR = os.environ.get("SURVEY_DASHBOARD_WORDCLOUD_CACHE_DIR", "")
+
+# Sets of initial dashboard figures built ahead of new sessions per worker process, 0 builds them per session
+PREBUILT_SESSIONS = int(os.environ.get("SURVEY_DASHBOARD_PREBUILT_SESSIONS", "2"))
+
+# Latest chart updates whose timing is kept per worker process, 0 (the default) keeps none
+CALLBACK_TIMINGS = int(os.environ.get("SURVEY_DASHBOARD_CALLBACK_TIMINGS", "0"))
+
+# File receiving the timing of every chart update as one JSON object per line, empty (the default) for none
+CALLBACK_TIMING_LOG = os.environ.get("SURVEY_DASHBOARD_CALLBACK_TIMING_LOG", "")
+
+# Chart panes whose update takes longer than this many milliseconds show a loading indicator
+LOADING_DELAY_MS = 100
 
 # Filter Configuration
 FILTER_BY = "researchArea"
@@ -102,18 +131,36 @@ WORDCLOUD_CONTENT = {
 HALF_WIDTH_OFFSET = 2  # ACCORDION_WIDTH / 2
 OFFSET_HEIGHT_FOR_TABS = 40
 
-# Create reverse dictionaries for data mapping
-HCS_COLNAMES_REVERT_DICT = {val: key for key, val in HCS_colnamesDict.items()}
-HCS_QUESTIONS_REVERT = {}
-HCS_QUESTIONS_REVERT[LANGUAGE] = {
-    val: key for key, val in HCSquestions[LANGUAGE].items()
+# Reverse dictionaries for data mapping, derived on first access, see __getattr__
+def _colnames_revert_dict():
+    return {val: key for key, val in hcs_clean_dictionaries.HCS_colnamesDict.items()}
+
+
+def _questions_revert():
+    questions = hcs_clean_dictionaries.HCSquestions[LANGUAGE]
+    return {LANGUAGE: {val: key for key, val in questions.items()}}
+
+
+def _mc_subquestions_flattened():
+    """Flatten MC subquestions for easier lookup"""
+    flattened = {}
+    for val in hcs_clean_dictionaries.HCS_MCsubquestions.values():
+        flattened.update(val)
+    return flattened
+
+
+_DERIVED = {
+    "HCS_COLNAMES_REVERT_DICT": _colnames_revert_dict,
+    "HCS_QUESTIONS_REVERT": _questions_revert,
+    "HCS_MCSUBQUESTIONS_FLATTENED": _mc_subquestions_flattened,
 }
 
-# Flatten MC subquestions for easier lookup
-HCS_MCSUBQUESTIONS_FLATTENED = {}
-for key, val in HCS_MCsubquestions.items():
-    for ke, va in val.items():
-        HCS_MCSUBQUESTIONS_FLATTENED[ke] = va
+
+def __getattr__(name: str):
+    if name not in _DERIVED:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals().setdefault(name, _DERIVED[name]())
+
 
 # Panel Configuration
 PANEL_CONFIG = {
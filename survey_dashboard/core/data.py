@@ -13,92 +13,561 @@ Data processing module for the survey dashboard.
 Handles all survey data filtering, transformation, and preparation for visualization.
 """
 
+import hashlib
+import inspect
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 from bokeh.models import ColumnDataSource
 
 from survey_dashboard.analysis import (
     calculate_crosstab,
-    prepare_data_research_field,
-    filter_dataframe,
-    percentage_to_area,
-    get_all_values
+    crosstab_from_counts,
+    percentage_to_area
 )
 from survey_dashboard.data.hcs_clean_dictionaries import (
-    HCSquestions,
     HCS_orderedCats,
     HCS_MCsubquestions,
     HCS_colnamesDict,
-    HCS_MCList,
-    HCS_dtypesWOmc
+    HCS_dtypesWOmc,
+    BARCHART_ALLOWED,
+    METADATA_DIR,
+    corr_chart_allowed
 )
+from survey_dashboard.core.aggregates import CountCube
+from survey_dashboard.core.bitsets import BitsetIndex, popcount
+from survey_dashboard.core.cache import LRUCache, freeze, thaw
+from survey_dashboard.core.catalog import QUESTION_CATALOG
+from survey_dashboard.core.encoding import EncodedSurvey
+from survey_dashboard.core.prebuilt import get_figure_pool
+from survey_dashboard.core.timing import get_callback_timings
+from survey_dashboard.core.wordclouds import get_wordcloud_cache
 from survey_dashboard.core.config import (
     LANGUAGE,
     DATAFILE_PATH,
+    DATA_CACHE_DIR,
+    RESULT_CACHE_SIZE,
     FILTER_BY,
     FILTER_BY_2,
-    RESEARCH_FIELDS,
     RESEARCH_AREA_COLORS,
-    HCS_COLNAMES_REVERT_DICT,
-    HCS_QUESTIONS_REVERT,
     HCS_MCSUBQUESTIONS_FLATTENED
 )
 
+logger = logging.getLogger(__name__)
+
+
+def process_rss_bytes() -> int:
+    """Return the resident set size of the current process in bytes (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return 0
+    # Fallback: peak RSS, reported in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _category_order(column: str, values: pd.Series) -> list:
+    """Categories of a column: the order from HCS_orderedCats, then any other observed answer."""
+    ordered = list(HCS_orderedCats.get(column, []))
+    known = set(ordered)
+    extra = sorted((val for val in values.dropna().unique() if val not in known), key=str)
+    return ordered + extra
+
+
+def apply_survey_dtypes(survey_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Type the renamed survey table.
+
+    Multiple choice subcolumns (True or empty) become boolean, categorical columns
+    (HCS_dtypesWOmc) and free text columns become categoricals, ordered as in
+    HCS_orderedCats where an order is given. Numerical columns are kept.
+    """
+    columns = {}
+    for column, values in survey_data.items():
+        is_subquestion = column in HCS_MCSUBQUESTIONS_FLATTENED and values.dtype == object
+        if is_subquestion and set(values.dropna().unique()) <= {True, False}:
+            values = values.eq(True)
+        elif HCS_dtypesWOmc.get(column) == "category" or values.dtype == object:
+            values = pd.Series(
+                pd.Categorical(values, categories=_category_order(column, values),
+                               ordered=column in HCS_orderedCats),
+                name=column,
+            )
+        columns[column] = values
+    return pd.DataFrame(columns)
+
+
+def read_survey_csv(path: str = DATAFILE_PATH) -> pd.DataFrame:
+    """Read the survey CSV, rename its columns to human readable names and type them."""
+    # Read CSV, skipping comment lines that start with #
+    survey_data = pd.read_csv(path, comment='#')
+    # Rename columns to human readable names
+    survey_data.rename(columns=HCS_colnamesDict, inplace=True)
+    return apply_survey_dtypes(survey_data)
+
+
+# Columnar cache of the typed survey table.
+# One directory per CSV content hash and typing schema, holding a manifest and one .npy file
+# per dtype, in which every row is one column of the survey. Categorical columns are stored as
+# integer codes, so the whole table can be memory-mapped and worker processes (--num-procs)
+# share its pages through the OS page cache instead of each holding a parsed copy.
+CACHE_FORMAT_VERSION = 1
+CACHE_MANIFEST = "manifest.json"
+# Dictionaries deciding the column names, dtypes and category orders of the typed table
+SCHEMA_METADATA = ("HCS_colnamesDict", "HCS_dtypesWOmc", "HCS_orderedCats", "HCS_MCsubquestions")
+
+
+def survey_schema_hash() -> str:
+    """
+    SHA-256 of everything the typed survey table depends on besides the CSV.
+
+    Covers the metadata files of SCHEMA_METADATA and the code of read_survey_csv,
+    apply_survey_dtypes and _category_order, so a changed category order, dtype or
+    typing rule never reuses a columnar cache built before the change.
+    """
+    digest = hashlib.sha256()
+    for name in SCHEMA_METADATA:
+        digest.update((METADATA_DIR / f"{name}.json").read_bytes())
+    for function in (read_survey_csv, apply_survey_dtypes, _category_order):
+        try:
+            digest.update(inspect.getsource(function).encode("utf-8"))
+        except (OSError, TypeError):  # installed without sources
+            digest.update(function.__code__.co_code)
+    return digest.hexdigest()
+
+
+def csv_content_hash(path: str = DATAFILE_PATH) -> str:
+    """SHA-256 of the survey file content, the key of its columnar cache."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as data_file:
+        for chunk in iter(lambda: data_file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def columnar_cache_path(path: str = DATAFILE_PATH, cache_dir: str = DATA_CACHE_DIR) -> Path:
+    """Directory of the columnar cache for the current content of the survey file and typing schema."""
+    return Path(cache_dir) / (
+        f"survey-v{CACHE_FORMAT_VERSION}-{csv_content_hash(path)[:16]}-{survey_schema_hash()[:16]}"
+    )
+
+
+def build_columnar_cache(path: str = DATAFILE_PATH, cache_dir: str = DATA_CACHE_DIR) -> Path:
+    """
+    Convert the survey CSV into a typed columnar cache, unless it already exists.
+
+    The cache is written to a temporary directory and moved into place at the end,
+    so concurrently starting workers never see a partially written cache.
+
+    Returns:
+        Path of the cache directory
+    """
+    cache_path = columnar_cache_path(path, cache_dir)
+    if (cache_path / CACHE_MANIFEST).exists():
+        return cache_path
+
+    survey_data = read_survey_csv(path)
+    columns = []
+    blocks = {}
+    for column, values in survey_data.items():
+        spec = {"name": column}
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            spec["kind"] = "categorical"
+            spec["categories"] = values.cat.categories.tolist()
+            spec["ordered"] = bool(values.cat.ordered)
+            array = values.cat.codes.to_numpy()
+        else:
+            spec["kind"] = "array"
+            array = values.to_numpy()
+        block = blocks.setdefault(array.dtype.str, [])
+        spec["block"] = array.dtype.str
+        spec["index"] = len(block)
+        block.append(array)
+        columns.append(spec)
+
+    block_files = {dtype: f"block{i}.npy" for i, dtype in enumerate(blocks)}
+    manifest = {
+        "format": CACHE_FORMAT_VERSION,
+        "source": str(path),
+        "sha256": csv_content_hash(path),
+        "schema_sha256": survey_schema_hash(),
+        "rows": len(survey_data),
+        "blocks": block_files,
+        "columns": columns,
+    }
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    build_path = Path(tempfile.mkdtemp(prefix=".build-", dir=cache_path.parent))
+    try:
+        for dtype, arrays in blocks.items():
+            np.save(build_path / block_files[dtype], np.stack(arrays), allow_pickle=False)
+        with open(build_path / CACHE_MANIFEST, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+        try:
+            os.replace(build_path, cache_path)
+        except OSError:
+            # Another worker finished the same cache first
+            if not (cache_path / CACHE_MANIFEST).exists():
+                raise
+    finally:
+        shutil.rmtree(build_path, ignore_errors=True)
+    return cache_path
+
+
+def load_columnar_cache(cache_path: Path) -> pd.DataFrame:
+    """Memory-map a columnar cache written by build_columnar_cache into a typed DataFrame."""
+    cache_path = Path(cache_path)
+    with open(cache_path / CACHE_MANIFEST) as manifest_file:
+        manifest = json.load(manifest_file)
+    if manifest.get("schema_sha256") != survey_schema_hash():
+        raise ValueError(f"columnar cache {cache_path} was built for another survey schema")
+
+    blocks = {
+        dtype: np.load(cache_path / file_name, mmap_mode="r", allow_pickle=False)
+        for dtype, file_name in manifest["blocks"].items()
+    }
+    columns = {}
+    for spec in manifest["columns"]:
+        values = blocks[spec["block"]][spec["index"]]
+        if spec["kind"] == "categorical":
+            dtype = pd.CategoricalDtype(spec["categories"], ordered=spec["ordered"])
+            values = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+        columns[spec["name"]] = pd.Series(values, copy=False)
+    return pd.DataFrame(columns, copy=False)
+
+
+def load_survey_data(path: str = DATAFILE_PATH, cache_dir: str = DATA_CACHE_DIR) -> pd.DataFrame:
+    """
+    Load the typed survey table, through the columnar cache if a cache directory is configured.
+
+    Falls back to parsing the CSV if the cache cannot be written or read.
+    """
+    if cache_dir:
+        try:
+            return load_columnar_cache(build_columnar_cache(path, cache_dir))
+        except (OSError, ValueError, KeyError) as error:
+            logger.warning("Columnar cache in %s not usable (%s), reading %s", cache_dir, error, path)
+    return read_survey_csv(path)
+
+
+def _question_key(question: str) -> str:
+    """Question text without the ★ correlation indicator."""
+    return question.replace("★ ", "")
+
+
+def _filter_key(values: list) -> tuple:
+    """Order independent, hashable form of a filter selection."""
+    return tuple(sorted(set(values)))
+
+
+@dataclass(frozen=True, eq=False)
+class FilterState:
+    """
+    Normalized global filter selection and the respondents it selects.
+
+    Built once per filter change by DataProcessor.filter_state and shared by every
+    chart that depends on the global filters.
+
+    Attributes:
+        research_areas: Sorted research area filter, including All and Cum. Sum
+        methods: Sorted data generation method filter
+        method_columns: Multiple choice subcolumns of the selected methods
+        method_bits: Bitmap of respondents using every selected method
+        row_bits: method_bits further restricted to the selected research areas, unless All is selected
+        rows: Row mask of row_bits, to select rows of the survey table
+    """
+    research_areas: tuple
+    methods: tuple
+    method_columns: tuple
+    method_bits: np.ndarray
+    row_bits: np.ndarray
+    rows: np.ndarray
+
+
+class SurveyDataset:
+    """
+    Read-only survey table shared by all sessions of one worker process.
+
+    The table is loaded once and never modified afterwards. Sessions get
+    shallow views via view(), so the column data itself is never copied.
+    The integer coded form, its bitmap index used for filtering and counting,
+    the aggregated counts answering the chart queries and the cache of query
+    results are shared in the same way.
+    """
+
+    def __init__(self, frame: pd.DataFrame, path: str, load_seconds: float):
+        self._frame = frame
+        self.path = path
+        self.load_seconds = load_seconds
+        self.memory_bytes = int(frame.memory_usage(deep=True).sum())
+        self.encoded = EncodedSurvey(frame)
+        self.bitsets = BitsetIndex(self.encoded)
+        method_columns = [column for column in HCS_MCsubquestions[FILTER_BY_2] if column in self.encoded]
+        self.counts = CountCube(self.encoded, method_columns, FILTER_BY)
+        self.results = LRUCache(RESULT_CACHE_SIZE)
+
+    @property
+    def shape(self) -> tuple:
+        """Number of respondents and columns."""
+        return self._frame.shape
+
+    def view(self) -> pd.DataFrame:
+        """Return a zero-copy view of the survey table for a single session."""
+        return self._frame.copy(deep=False)
+
+    def stats(self) -> dict:
+        """Load time and memory footprint of the dataset and the current process."""
+        rows, columns = self.shape
+        return {
+            "path": self.path,
+            "rows": rows,
+            "columns": columns,
+            "load_seconds": self.load_seconds,
+            "memory_bytes": self.memory_bytes,
+            "process_rss_bytes": process_rss_bytes(),
+            "result_cache": self.results.stats(),
+            "wordcloud_cache": get_wordcloud_cache().stats(),
+            "figure_pool": get_figure_pool().stats(),
+            "callback_timings": get_callback_timings().stats(),
+        }
+
+
+# Process wide registry, one dataset per data file
+_DATASETS = {}
+_DATASETS_LOCK = threading.Lock()
+
+
+def get_survey_dataset(path: str = DATAFILE_PATH) -> SurveyDataset:
+    """
+    Return the shared survey dataset for the given data file, loading it on first use.
+
+    Loading happens at most once per worker process, also if several sessions are
+    created concurrently.
+    """
+    dataset = _DATASETS.get(path)
+    if dataset is not None:
+        return dataset
+
+    with _DATASETS_LOCK:
+        dataset = _DATASETS.get(path)
+        if dataset is None:
+            start = time.perf_counter()
+            frame = load_survey_data(path)
+            dataset = SurveyDataset(frame, path, time.perf_counter() - start)
+            processor = DataProcessor(dataset)
+            processor.precompute_counts()
+            processor.precompute_crosstabs()
+            _DATASETS[path] = dataset
+            logger.info(
+                "Loaded survey data %s: %d rows x %d columns in %.3f s, %.1f MB in memory",
+                path, dataset.shape[0], dataset.shape[1], dataset.load_seconds, dataset.memory_bytes / 1e6
+            )
+    return dataset
+
 
 class DataProcessor:
     """Handles all survey data operations and transformations."""
     
-    def __init__(self):
-        """Initialize the data processor with survey data."""
-        # Read CSV, skipping comment lines that start with #
-        self.survey_data = pd.read_csv(DATAFILE_PATH, comment='#')
-        # Rename columns to human readable names
-        self.survey_data.rename(columns=HCS_colnamesDict, inplace=True)
-        
-        # Create data sources for different uses
-        self.source = ColumnDataSource(self.survey_data)
-        self.source_corr = ColumnDataSource(self.survey_data)
-    
+    def __init__(self, dataset: SurveyDataset = None):
+        """
+        Initialize the data processor with survey data.
+
+        Args:
+            dataset: Shared survey dataset, defaults to the process wide dataset of DATAFILE_PATH
+        """
+        self.dataset = dataset if dataset is not None else get_survey_dataset()
+        self.survey_data = self.dataset.view()
+        self.encoded = self.dataset.encoded
+        self.bitsets = self.dataset.bitsets
+        self.counts = self.dataset.counts
+        self.results = self.dataset.results
+        self._filter_state = None
+        self._filter_state_lock = threading.Lock()
+
     def map_qkey_to_question(self, key: str, lang: str = LANGUAGE) -> str:
         """
         Given a key return the full question to be displayed associated with the key for a given language
         """
-        mc_key = key
-
-        if key in HCS_MCList:
-            # Multiple choice, all have the same question for now
-            mc_key = list(HCS_MCsubquestions[key].keys())[0]
-            index = HCS_COLNAMES_REVERT_DICT[mc_key].split("/")[0]
-        else:
-            index = HCS_COLNAMES_REVERT_DICT[mc_key]
-
-        return HCSquestions[lang][index]
+        return QUESTION_CATALOG.question_text(key, lang)
 
     def map_question_to_qkey(self, question: str, lang: str = LANGUAGE) -> list:
         """
         Map a given question String to the corresponding columns keys in the dataframe
 
-        usually this is one column, but for multiple choice this can be several columns.
-        Handles question strings with or without the ★ correlation indicator prefix.
+        usually this is one column, but for multiple choice this can be several columns,
+        in natural order (_1 _2 _10). Handles question strings with or without the ★
+        correlation indicator prefix.
+        """
+        return list(QUESTION_CATALOG.question_columns(question, lang))
+
+    def _method_columns(self, data_filters_method: list) -> list:
+        """Map the selected data generation methods to their multiple choice subcolumns."""
+        methods_dict = HCS_MCsubquestions[FILTER_BY_2]
+        return [key for method in data_filters_method for key, val in methods_dict.items() if val == method]
+
+    def filter_state(self, data_filters: list, data_filters_method: list) -> FilterState:
+        """
+        Return the FilterState of a global filter selection.
+
+        The last state is kept, so all charts updated for one filter change share
+        a single computation of the row masks, also when they are prepared in
+        parallel.
+        """
+        research_areas, methods = _filter_key(data_filters), _filter_key(data_filters_method)
+        with self._filter_state_lock:
+            state = self._filter_state
+            if state is not None and state.research_areas == research_areas and state.methods == methods:
+                return state
+            state = self._compute_filter_state(research_areas, methods)
+            self._filter_state = state
+            return state
+
+    def _compute_filter_state(self, research_areas: tuple, methods: tuple) -> FilterState:
+        """Respondents of a global filter selection, see filter_state."""
+        method_columns = tuple(self._method_columns(methods))
+        method_bits = self.bitsets.all_of(method_columns)
+        row_bits = method_bits
+        real_areas = [area for area in research_areas if area not in {"All", "Cum. Sum"}]
+        if real_areas and "All" not in research_areas:
+            categories = self.encoded.categories(FILTER_BY)
+            selected = [categories.index(area) for area in real_areas if area in categories]
+            row_bits = method_bits & self.bitsets.any_of(FILTER_BY, selected)
+        method_bits.flags.writeable = False
+        row_bits.flags.writeable = False
+
+        return FilterState(research_areas, methods, method_columns, method_bits, row_bits,
+                           self.bitsets.unpack(row_bits))
+
+    def _answered_bits(self, bits: np.ndarray, columns: list) -> np.ndarray:
+        """Copy of bits without the respondents who did not answer a single choice column of columns."""
+        bits = bits.copy()
+        for column in columns:
+            if not self.encoded.is_flag(column):
+                bits &= self.bitsets.answered(column)
+        return bits
+
+    def row_mask(self, data_filters: list, data_filters_method: list, columns: list = (),
+                 exclude_nan: bool = True) -> np.ndarray:
+        """
+        Row mask of the respondents selected by the global filters, without copying survey data.
+
+        The mask is unpacked from the bitmaps of the FilterState, the research area and
+        method filters are applied as in the charts.
+
+        Args:
+            data_filters: Selected research areas, every area if none or All is selected
+            data_filters_method: Selected data generation methods, respondents have to use all of them
+            columns: Survey columns of a question, multiple choice subcolumns never exclude a respondent
+            exclude_nan: Whether to exclude respondents without an answer to a single choice column of columns
+
+        Returns:
+            Read-only boolean array with one entry per row of survey_data
+        """
+        state = self.filter_state(data_filters, data_filters_method)
+        if not exclude_nan or all(self.encoded.is_flag(column) for column in columns):
+            return state.rows
+        return self.bitsets.unpack(self._answered_bits(state.row_bits, list(columns)))
+
+    def row_count(self, data_filters: list, data_filters_method: list, columns: list = (),
+                  exclude_nan: bool = True) -> int:
+        """
+        Number of respondents selected by the global filters, a popcount of the bitmaps.
+
+        Takes the same arguments as row_mask and neither unpacks nor copies a row mask.
+        """
+        state = self.filter_state(data_filters, data_filters_method)
+        bits = self._answered_bits(state.row_bits, list(columns)) if exclude_nan else state.row_bits
+        return int(popcount(bits))
+
+    def _select_rows(self, columns: list, state: FilterState, exclude_nan: bool = True,
+                     filter_by: str = FILTER_BY) -> np.ndarray:
+        """
+        Bitmap of the respondents to count for the given question columns.
+
+        Respondents have to use every selected data generation method. With exclude_nan,
+        respondents without an answer to a single choice column or to `filter_by` are
+        excluded as well.
+        """
+        if exclude_nan:
+            return self._answered_bits(state.method_bits, [filter_by] + columns)
+        return state.method_bits.copy()
+
+    def _answer_counts(self, columns: list, state: FilterState, multiple_choice: bool,
+                       filter_by: str = FILTER_BY) -> tuple:
+        """
+        Count the answers to a question per research area.
+
+        Counts for the default research area filter come from the precomputed count
+        cube, other groupings are popcounts of the respondent bitmaps.
+
+        Returns:
+            tuple: (counts, respondents), counts per research area (rows) and answer
+            (columns) and the number of counted respondents per research area. For
+            multiple choice questions a last row holds respondents without a research
+            area, single choice questions only count respondents with one.
         """
-        column_keys = []
-        # Strip the ★ indicator if present (used to mark correlation-compatible questions)
-        clean_question = question.replace("★ ", "")
-        key = HCS_QUESTIONS_REVERT[lang][clean_question]
-        if key in HCS_MCList:
-            # for multiple choice this is a list of subquestions
-            key_s = key + "/"
-            for key in HCS_colnamesDict.keys():
-                if key_s in key:
-                    if not "other" in key:  # for now, needs to be included in HCS_MCsubquestions
-                        column_keys.append(HCS_colnamesDict[key])
-            column_keys.sort()  # Wrong sort... _1 _10 _2 ...
+        if filter_by == self.counts.by:
+            counts = self.counts.table(columns, state.method_columns)
+            respondents = self.counts.respondents(state.method_columns)
         else:
-            column_keys.append(HCS_colnamesDict[key])
-        return column_keys
+            bits = self._select_rows(columns, state, exclude_nan=not multiple_choice, filter_by=filter_by)
+            if multiple_choice:
+                counts = self.bitsets.count_flags_by(columns, filter_by, bits)
+            else:
+                counts = self.bitsets.count_by(columns[0], filter_by, bits)
+            respondents = self.bitsets.count_rows_by(filter_by, bits)
+        if not multiple_choice:
+            counts = counts[:-1]
+            respondents = counts.sum(axis=1)
+        return counts, respondents[:len(self.encoded.categories(filter_by))]
+
+    def precompute_counts(self, question_keys: list = BARCHART_ALLOWED):
+        """Build the count tables of the given questions ahead of the first chart request."""
+        for key in question_keys:
+            columns = self.map_question_to_qkey(self.map_qkey_to_question(key))
+            self.counts.build([[column for column in columns if column in self.encoded]])
 
     def select_data(self, question, data_filters, data_filters_method, filter_by=FILTER_BY):
-        """Select and transform data for visualization"""
+        """
+        Select and transform data for visualization
+
+        Results are shared between sessions through the result cache, the
+        ColumnDataSources are created per call.
+        """
+        key = ("select_data", _question_key(question), _filter_key(data_filters),
+               _filter_key(data_filters_method), filter_by)
+        data, ydata_spec, display_options = thaw(self.results.get_or_compute(
+            key, lambda: freeze(self._select_data(key[1], list(key[2]), list(key[3]), filter_by))
+        ))
+        return ColumnDataSource(data=data), ColumnDataSource(data=ydata_spec), display_options
+
+    def _select_data(self, question, data_filters, data_filters_method, filter_by=FILTER_BY):
+        """
+        Compute the bar chart data of a question for the given filters
+
+        Counts come from the precomputed count cube, every returned series is
+        aligned to x_value.
+
+        Returns:
+            tuple: (data, ydata_spec, display_options), plain dicts
+        """
 
         def get_real_research_areas(data_filters):
             """
@@ -121,39 +590,18 @@ class DataProcessor:
         question_full = question.replace("★ ", "")
 
         # Clean up missing columns
-        q_index_clean = []
-        keys = list(self.survey_data.keys())
-        for key in q_index:
-            if key in keys:
-                q_index_clean.append(key)
+        q_index_clean = [key for key in q_index if key in self.encoded]
+        multiple_choice = len(q_index) > 1
 
-        exclude_nan = True
-        if len(q_index) > 1:
-            exclude_nan = False
-
-        # Process method filters
-        method_include = []
-        method_exclude = []
-        methods_dict = HCS_MCsubquestions[FILTER_BY_2]
-        for method in data_filters_method:
-            for key, val in methods_dict.items():
-                if val == method:
-                    method_include.append(key)
-                    method_exclude.append((key, [False]))
-
-        include_clean = list(set([FILTER_BY] + q_index_clean + method_include))
-        
-        # Filter dataframe
-        df = filter_dataframe(
-            self.survey_data,
-            include=include_clean,
-            exclude=method_exclude,
-            exclude_nan=exclude_nan,
-        )
-        
-        data_all = get_all_values(
-            df, q_index_clean, display_dict=HCS_MCSUBQUESTIONS_FLATTENED
-        )
+        if multiple_choice:
+            labels = [HCS_MCSUBQUESTIONS_FLATTENED[key].replace(" \n", "") for key in q_index_clean]
+        else:
+            labels = self.encoded.categories(q_index_0)
+        state = self.filter_state(data_filters, data_filters_method)
+        counts, respondents = self._answer_counts(q_index_clean, state, multiple_choice, filter_by)
+        areas = self.encoded.categories(filter_by)
+        area_counts = dict(zip(areas, counts))
+        all_counts = counts.sum(axis=0)
 
         # Separate real research areas from pseudo-categories
         real_research_areas, pseudo_categories = get_real_research_areas(data_filters)
@@ -161,116 +609,40 @@ class DataProcessor:
         # Handle data filtering based on what's selected
         if "All" in data_filters and len(data_filters) == 1:
             # Only "All" is selected - use the aggregated data from all research areas
-            if len(q_index_clean) == 1:
-                key = q_index_clean[0]
-                data = {
-                    "All": data_all["All"],
-                    key: data_all.get(key, []),
-                    "x_value": data_all.get(key, [])
-                }
-                y_keys = ["All"]
-            else:
-                # Multiple columns case (multiple-choice questions)
-                data = data_all.copy()
-                # For multiple-choice, get_all_values returns {All: values, last_key: labels}
-                # We need to add x_value for the plotting code
-                # The last key in q_index_clean contains the x-axis labels
-                last_key = q_index_clean[-1]
-                if last_key in data_all and "x_value" not in data:
-                    data["x_value"] = data_all[last_key]
-                y_keys = data_filters
+            data = {"All": all_counts}
+            y_keys = ["All"]
+        elif q_index_0 == filter_by:
+            # The research area question itself, every area only has a count at its own position
+            data = {area: area_counts.get(area, np.zeros_like(all_counts)) for area in real_research_areas}
+            if "Cum. Sum" in pseudo_categories:
+                data["Cum. Sum"] = all_counts
+            y_keys = real_research_areas + [cat for cat in pseudo_categories if cat != "All"]
+            if "All" in pseudo_categories:
+                data["All"] = all_counts
+                y_keys = ["All"] + y_keys
         else:
-            # Handle filtering based on real research areas (not pseudo-categories)
-            if real_research_areas:
-                # Real research areas are selected - filter the data to include only those
-                exclude = []
-                for field in RESEARCH_FIELDS:
-                    # Only exclude fields that are real research areas (not pseudo-categories)
-                    if field not in {"All", "Cum. Sum"} and field not in real_research_areas:
-                        exclude.append(field)
-
-                for filter_key in exclude:
-                    df = df[df[filter_by] != filter_key]
-            # else: Only pseudo-categories selected - df remains unfiltered
-
-            # Special case: if we're querying the research area question itself,
-            # we need different logic to avoid double-grouping by research areas
-            if q_index_0 == filter_by:  # This is the research area question
-                # For research area distribution, create data structure directly
-                data = {}
-                # Use the full research area list as x_value for proper positioning
-                data["x_value"] = data_all.get(q_index_0, [])
-
-                # Create arrays for each real research area selected
-                for area in real_research_areas:
-                    # Create array with value at correct position, zeros elsewhere
-                    area_array = np.zeros(len(data["x_value"]))
-                    if area in data["x_value"]:
-                        position = data["x_value"].index(area)
-                        area_count = len(df[df[filter_by] == area])
-                        area_array[position] = area_count
-                    data[area] = area_array
-
-                # Handle "Cum. Sum" pseudo-category if selected
-                if "Cum. Sum" in pseudo_categories:
-                    # Add cumulative sum data (this will be the total across all areas)
-                    data["Cum. Sum"] = data_all.get("All", [])
-
-                # Set y_keys to include both real areas and pseudo-categories
-                y_keys = real_research_areas + [cat for cat in pseudo_categories if cat != "All"]
-            else:
-                # Normal case: use prepare_data_research_field for other questions
-                data, y_keys = prepare_data_research_field(df, q_index)
-
-            # Add "All" data if it's selected in the pseudo-categories
+            # Show the selected research areas, or all of them if only pseudo-categories are selected
+            shown = [area for area in areas if area in real_research_areas or not real_research_areas]
+            present = [i for i in np.argsort(-respondents, kind="stable") if respondents[i] and areas[i] in shown]
+            research_areas = [areas[i] for i in present]
+
+            data = {"Cum. Sum": counts[present].sum(axis=0)}
+            for area in research_areas:
+                data[area] = area_counts[area]
             if "All" in pseudo_categories:
-                all_data = data_all.get("All", [])
-
-                # Special handling for research area question
-                if q_index_0 == filter_by:  # This is the research area question
-                    # Add "All" data to our research area structure
-                    data["All"] = all_data
-                    # Make sure "All" is in y_keys
-                    if "All" not in y_keys:
-                        y_keys = ["All"] + y_keys
-                elif "researchArea" in data:
-                    # When "All" + specific filters are selected, expand to show all research areas
-                    # Use full "All" data and expand x_value to all research areas
-                    data["All"] = all_data
-                    data["x_value"] = data_all["researchArea"]
-
-                    # Expand specific research area data to match full x_value length
-                    for key in data_filters:
-                        if key != "All" and key in data:
-                            # Find position of this research area in full x_value
-                            try:
-                                position = data["x_value"].index(key)
-                                # Create array with value at correct position, zeros elsewhere
-                                new_array = np.zeros(len(data["x_value"]), dtype=data[key].dtype)
-                                new_array[position] = data[key][0]  # Use first (and only) value
-                                data[key] = new_array
-                            except ValueError:
-                                # If not found, just pad with zeros
-                                padding = [0] * (len(data["x_value"]) - len(data[key]))
-                                data[key] = list(data[key]) + padding
-                else:
-                    # For other questions: truncate to match x_value length
-                    if len(all_data) > len(data["x_value"]):
-                        data["All"] = all_data[:len(data["x_value"])]
-                    else:
-                        data["All"] = all_data
-
-            # Also expand Cum. Sum to match the new x_value length
-            if "Cum. Sum" in data:
-                cum_sum_data = data["Cum. Sum"]
-                if len(cum_sum_data) < len(data["x_value"]):
-                    # Pad with zeros to match new length
-                    if isinstance(cum_sum_data, np.ndarray):
-                        padding = np.zeros(len(data["x_value"]) - len(cum_sum_data), dtype=cum_sum_data.dtype)
-                        data["Cum. Sum"] = np.concatenate([cum_sum_data, padding])
-                    else:
-                        padding = [0] * (len(data["x_value"]) - len(cum_sum_data))
-                        data["Cum. Sum"] = list(cum_sum_data) + padding
+                data["All"] = all_counts
+            y_keys = ["Cum. Sum"] + research_areas
+
+        # Answers nobody gave are dropped, except for multiple choice where every option is shown
+        x_value = list(labels)
+        if not multiple_choice:
+            answered = np.zeros(len(labels), dtype=bool)
+            for series in data.values():
+                answered |= series > 0
+            x_value = [label for label, keep in zip(labels, answered) if keep]
+            data = {key: series[answered] for key, series in data.items()}
+        data[q_index_clean[-1] if q_index_clean else q_index_0] = x_value
+        data["x_value"] = x_value
 
         # Prepare display specifications
         ydata_spec = {}
@@ -283,9 +655,8 @@ class DataProcessor:
         if q_index_0 in HCS_dtypesWOmc.keys():
             xtype = HCS_dtypesWOmc[q_index_0]
 
-        if len(q_index) > 1:  # multiple choice case
-            # Defensive: ensure x_value exists, fallback to using q_index_0 data
-            x_range = data.get("x_value", data.get(q_index_0, []))
+        if multiple_choice:
+            x_range = data["x_value"]
             width = 0.1
         elif xtype == "category":
             x_range = HCS_orderedCats[q_index_0]
@@ -298,8 +669,6 @@ class DataProcessor:
         ydata_spec["y_keys"] = y_keys
         ydata_spec["colors"] = colors
         ydata_spec["legend_labels"] = y_keys
-        selected = ColumnDataSource(data=data)
-        ydata_spec = ColumnDataSource(data=ydata_spec)
 
         display_options = {
             "x_range": x_range,
@@ -308,10 +677,40 @@ class DataProcessor:
             "width": width,
         }
 
-        return selected, ydata_spec, display_options
+        return data, ydata_spec, display_options
 
     def select_data_corr(self, question, question2, data_filters, data_filters_method):
-        """Select the data to display in the correlation vis"""
+        """Select the data to display in the correlation vis, shared through the result cache"""
+        key = ("select_data_corr", _question_key(question), _question_key(question2),
+               _filter_key(data_filters), _filter_key(data_filters_method))
+        data, display_options, marker_scale = thaw(self.results.get_or_compute(
+            key, lambda: freeze(self._select_data_corr(key[1], key[2], list(key[3]), list(key[4])))
+        ))
+        return ColumnDataSource(data=data), display_options, marker_scale
+
+    def _crosstab_supported(self, column1: str, column2: str) -> bool:
+        """Whether the cross table of two columns can come from the precomputed counts."""
+        return (
+            column1 != column2
+            and column1 in self.encoded and not self.encoded.is_flag(column1)
+            and column2 in self.encoded and not self.encoded.is_flag(column2)
+        )
+
+    def precompute_crosstabs(self, question_keys: list = corr_chart_allowed):
+        """Build the cross tables of every pair of the given questions ahead of the first correlation plot."""
+        columns = [self.map_question_to_qkey(self.map_qkey_to_question(key))[0] for key in question_keys]
+        self.counts.build_crosstabs([
+            (column1, column2) for column1 in columns for column2 in columns
+            if self._crosstab_supported(column1, column2)
+        ])
+
+    def _select_data_corr(self, question, question2, data_filters, data_filters_method):
+        """
+        Compute the cross tabulation of two questions for the correlation vis
+
+        Returns:
+            tuple: (data, display_options, marker_scale), data as ColumnDataSource columns
+        """
         q1_key = self.map_question_to_qkey(question)
         q2_key = self.map_question_to_qkey(question2)
         q1_index_0 = q1_key[0]
@@ -351,37 +750,27 @@ class DataProcessor:
         if len(q1_key) > 1:
             exclude_nan = False
 
-        # Process method filters
-        method_include = []
-        method_exclude = []
-        methods_dict = HCS_MCsubquestions[FILTER_BY_2]
-        for method in data_filters_method:
-            for key, val in methods_dict.items():
-                if val == method:
-                    method_include.append(key)
-                    method_exclude.append((key, [False]))
-
-        include_clean = list(
-            set([FILTER_BY] + q2_key_clean + q1_key_clean + method_include)
-        )
-
-        # Filter dataframe
-        df = filter_dataframe(
-            self.survey_data,
-            include=include_clean,
-            exclude=method_exclude,
-            exclude_nan=exclude_nan,
-        )
+        # Respondents using every selected method, the research area filter does not apply here
+        state = self.filter_state(data_filters, data_filters_method)
+        if exclude_nan and self._crosstab_supported(q1_index_0, q2_index_0):
+            cross_tab = crosstab_from_counts(
+                self.counts.crosstab(q1_index_0, q2_index_0, state.method_columns),
+                self.encoded.categories(q1_index_0), self.encoded.categories(q2_index_0),
+                q1_index_0, q2_index_0,
+            )
+        else:
+            bits = self._select_rows(q2_key_clean + q1_key_clean, state, exclude_nan=exclude_nan)
+            df = self.survey_data.loc[self.bitsets.unpack(bits), list(dict.fromkeys(q1_key_clean + q2_key_clean))].astype("object")
+            cross_tab = {
+                column: values.to_numpy()
+                for column, values in calculate_crosstab(df, q1_index_0, q2_index_0).items()
+            }
 
-        # Calculate cross-tabulation
-        cross_tab = calculate_crosstab(df, q1_index_0, q2_index_0)
         marker_scale = 20.0
-        cross_tab["markersize"] = percentage_to_area(
-            cross_tab["percentage"], scale_m=marker_scale
-        )
+        cross_tab["markersize"] = percentage_to_area(cross_tab["percentage"], scale_m=marker_scale)
         cross_tab["x_values"] = cross_tab[q1_index_0]
         cross_tab["y_values"] = cross_tab[q2_index_0]
-        cross_tab["color"] = ["#A0235A" for i in cross_tab[q2_index_0]]
+        cross_tab["color"] = np.full(len(cross_tab["value"]), "#A0235A", dtype=object)
 
         # Configure tooltips
         tooltips = [
@@ -396,7 +785,8 @@ class DataProcessor:
         xlabel = f"{question.replace('★ ', '')}"
         ylabel = f"{question2.replace('★ ', '')}"
 
-        selected = ColumnDataSource(cross_tab)
+        # Same columns as ColumnDataSource.from_df, the row number first
+        selected = {"index": np.arange(len(cross_tab["value"])), **cross_tab}
 
         display_options = {
             "x_range": x_range,
@@ -410,22 +800,20 @@ class DataProcessor:
         return selected, display_options, marker_scale
 
     def select_data_wordcloud(self, data_filters, data_filters_method, content):
-        """Filter data for wordcloud from data filters"""
-        word_list = []
-
-        method_include = []
-        method_exclude = []
-        methods_dict = HCS_MCsubquestions[FILTER_BY_2]
-        method_keys = list(methods_dict.keys())
-        for method in data_filters_method:
-            for key in method_keys:
-                if methods_dict[key] == method:
-                    method_include.append(key)
-                    method_exclude.append((key, [False]))
-
+        """Filter data for wordcloud from data filters, shared through the result cache"""
+        key = ("select_data_wordcloud", _filter_key(data_filters), _filter_key(data_filters_method), tuple(content))
+        return thaw(self.results.get_or_compute(
+            key, lambda: freeze(self._select_data_wordcloud(list(key[1]), list(key[2]), list(key[3])))
+        ))
+
+    def _select_data_wordcloud(self, data_filters, data_filters_method, content):
+        """Collect the free text answers of the given content columns for the word cloud"""
+        state = self.filter_state(data_filters, data_filters_method)
+
+        # Text columns of the selected methods, or of all methods if none is selected
+        method_include = list(state.method_columns)
         if len(data_filters_method) == 0:
-            method_include = method_keys
-            method_exclude = []
+            method_include = list(HCS_MCsubquestions[FILTER_BY_2].keys())
 
         # Process content specification
         data_include = []
@@ -440,28 +828,10 @@ class DataProcessor:
         else:
             data_include = content
             
-        # Filter dataframe
-        df = filter_dataframe(
-            self.survey_data,
-            include=[FILTER_BY] + method_include + data_include,
-            exclude=method_exclude,
-            as_type="str",
-        )
-        
-        # Filter by research areas
-        exclude = []
-        for field in RESEARCH_FIELDS:
-            if field not in data_filters:
-                exclude.append(field)
-        if "All" in data_filters:
-            exclude = []
-        for area in exclude:
-            df = df[df[FILTER_BY] != area]
-
-        # Prepare word list
+        # Answers of the respondents selected by the global filters
         word_list = []
-        for method in data_include:
-            w_list = [word for word in df[method] if str(word) != "nan"]
-            word_list = word_list + w_list
+        for column in data_include:
+            answers = self.survey_data.loc[state.rows, column].dropna().astype("str")
+            word_list += answers.replace("Anonymized", "").tolist()
 
         return word_list
\ No newline at end of file
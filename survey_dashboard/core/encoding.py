@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Integer coded representation of the survey table.
+Filtering and counting for the charts run on these codes instead of python objects.
+"""
+
+import numpy as np
+import pandas as pd
+
+from survey_dashboard.data.hcs_clean_dictionaries import HCS_MCList, HCS_MCsubquestions
+from survey_dashboard.core.config import HCS_MCSUBQUESTIONS_FLATTENED
+
+
+class EncodedSurvey:
+    """
+    Read-only, integer coded copy of the survey table.
+
+    Single choice and numeric columns are stored as integer codes into their
+    categories, -1 marks a missing answer. The category order follows
+    HCS_orderedCats, numeric columns are ordered by value. The subcolumns of
+    every multiple choice question in HCS_MCList are packed into one boolean
+    matrix of shape (rows, subcolumns), column selections of these matrices are
+    memoized as they are requested.
+    """
+
+    def __init__(self, survey_data: pd.DataFrame):
+        self.n_rows = len(survey_data)
+        self._codes = {}
+        self._categories = {}
+        self._flags = {}
+        self._flag_blocks = {}
+
+        for question in HCS_MCList:
+            subcolumns = [column for column in HCS_MCsubquestions.get(question, {}) if column in survey_data]
+            if not subcolumns:
+                continue
+            block = np.column_stack([survey_data[column].eq(True).to_numpy(dtype=bool) for column in subcolumns])
+            block.flags.writeable = False
+            for i, column in enumerate(subcolumns):
+                self._flags[column] = block[:, i]
+
+        for column in survey_data.columns:
+            if column in self._flags:
+                continue
+            values = survey_data[column]
+            if column in HCS_MCSUBQUESTIONS_FLATTENED or pd.api.types.is_bool_dtype(values.dtype):
+                # Subcolumn of a question without an HCS_MCList entry
+                self._flags[column] = values.eq(True).to_numpy(dtype=bool)
+                continue
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                values = pd.Categorical(values)
+            else:
+                values = values.array
+            codes = np.asarray(values.codes)
+            codes.flags.writeable = False
+            self._codes[column] = codes
+            self._categories[column] = list(values.categories)
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._codes or column in self._flags
+
+    def is_flag(self, column: str) -> bool:
+        """Whether the column is a multiple choice subcolumn."""
+        return column in self._flags
+
+    def codes(self, column: str) -> np.ndarray:
+        """Integer codes of a single choice column, -1 for missing answers."""
+        return self._codes[column]
+
+    def categories(self, column: str) -> list:
+        """Categories of a single choice column, in code order."""
+        return self._categories[column]
+
+    def flag(self, column: str) -> np.ndarray:
+        """Boolean row mask of a multiple choice subcolumn."""
+        return self._flags[column]
+
+    def flags(self, columns: list) -> np.ndarray:
+        """Boolean matrix of shape (rows, len(columns)) for multiple choice subcolumns."""
+        key = tuple(columns)
+        block = self._flag_blocks.get(key)
+        if block is None:
+            block = np.column_stack([self._flags[column] for column in columns])
+            block.flags.writeable = False
+            self._flag_blocks[key] = block
+        return block
+
+    def group_codes(self, by: str, rows: np.ndarray = None) -> np.ndarray:
+        """Codes of `by` for the selected rows, missing answers mapped to an extra last group."""
+        codes = self._codes[by] if rows is None else self._codes[by][rows]
+        groups = codes.astype(np.intp)
+        groups[groups < 0] = len(self._categories[by])
+        return groups
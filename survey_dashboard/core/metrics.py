@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Operational metrics of a server process in the Prometheus text format.
+Served at /metrics by the survey_dashboard.metrics server plugin.
+"""
+
+import bisect
+import logging
+import threading
+import time
+
+from survey_dashboard.core.data import get_survey_dataset, process_rss_bytes
+from survey_dashboard.core.timing import get_callback_timings
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets in seconds
+SESSION_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+UPDATE_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Phases of a chart update in the callback timing records, see survey_dashboard.core.timing
+UPDATE_PHASES = ("total", "queued", "select", "render", "patch")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Cumulative bucket counts, sum and count of observed values, like a Prometheus histogram."""
+
+    def __init__(self, buckets: tuple):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def samples(self, name: str, labels: dict) -> list:
+        """Sample lines of the histogram, buckets first."""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{name}_bucket{_labels({**labels, 'le': le})} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {_number(self.sum)}")
+        lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+        return lines
+
+
+class ServerMetrics:
+    """
+    Sessions, chart update latencies, cache hit ratios and memory of the current process.
+
+    Sessions are counted from Panel's session hooks, see install. Their creation
+    latency runs from the start of a session until its document is built and the
+    server can answer the page request, their ready latency until the browser
+    reports the page rendered. Chart update latencies come from the callback timing
+    records, per chart type and phase. With several worker processes (--num-procs)
+    every process counts its own sessions and updates.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = {}
+        self._installed = False
+        self.sessions_created = 0
+        self.sessions_destroyed = 0
+        self.session_creation = Histogram(SESSION_BUCKETS)
+        self.session_ready = Histogram(SESSION_BUCKETS)
+        self.chart_updates = {}
+        self.chart_update_seconds = {}
+
+    def install(self):
+        """Register the session hooks and subscribe to the callback timings, once per process."""
+        import panel as pn
+
+        with self._lock:
+            if self._installed:
+                return
+            self._installed = True
+        pn.state.on_session_created(self.session_created)
+        pn.state.on_session_destroyed(self.session_destroyed)
+        get_callback_timings().subscribe(self.observe_update)
+
+    def session_created(self, session_context):
+        import panel as pn
+
+        session_id = session_context.id
+        with self._lock:
+            self.sessions_created += 1
+            self._started[session_id] = time.perf_counter()
+        # Panel runs the hook with the document of the new session as the current one
+        doc = pn.state.curdoc
+        if doc is None or doc.session_context is not session_context:
+            logger.debug("No document of session %s, its latency is not observed", session_id)
+            return
+        # Session callbacks start once the document is built, this one runs on the next tick after
+        doc.add_next_tick_callback(lambda: self._observe_session(session_id, self.session_creation))
+        pn.state.onload(lambda: self._observe_session(session_id, self.session_ready))
+
+    def _observe_session(self, session_id, histogram: Histogram):
+        with self._lock:
+            started = self._started.get(session_id)
+            if started is not None:
+                histogram.observe(time.perf_counter() - started)
+
+    def session_destroyed(self, session_context):
+        with self._lock:
+            self.sessions_destroyed += 1
+            self._started.pop(session_context.id, None)
+
+    def observe_update(self, record: dict):
+        """Count a callback timing record and observe the phases of a shown update."""
+        chart = record.get("chart") or "unknown"
+        with self._lock:
+            key = (chart, record["outcome"])
+            self.chart_updates[key] = self.chart_updates.get(key, 0) + 1
+            if record["outcome"] != "shown":
+                return
+            for phase in UPDATE_PHASES:
+                seconds = record.get(f"{phase}_s")
+                if seconds is not None:
+                    histogram = self.chart_update_seconds.get((chart, phase))
+                    if histogram is None:
+                        histogram = self.chart_update_seconds[(chart, phase)] = Histogram(UPDATE_BUCKETS)
+                    histogram.observe(seconds)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+
+        with self._lock:
+            metric("survey_dashboard_sessions_active", "gauge", "Sessions currently open in this process",
+                   [f"survey_dashboard_sessions_active {self.sessions_created - self.sessions_destroyed}"])
+            metric("survey_dashboard_sessions_created_total", "counter", "Sessions created by this process",
+                   [f"survey_dashboard_sessions_created_total {self.sessions_created}"])
+            metric("survey_dashboard_session_creation_seconds", "histogram",
+                   "Time from the start of a session until its document is built",
+                   self.session_creation.samples("survey_dashboard_session_creation_seconds", {}))
+            metric("survey_dashboard_session_ready_seconds", "histogram",
+                   "Time from the start of a session until the browser reports the page rendered",
+                   self.session_ready.samples("survey_dashboard_session_ready_seconds", {}))
+            metric("survey_dashboard_chart_updates_total", "counter",
+                   "Chart updates by chart type and outcome (shown, superseded or error)",
+                   [f"survey_dashboard_chart_updates_total{_labels({'chart': chart, 'outcome': outcome})} {count}"
+                    for (chart, outcome), count in sorted(self.chart_updates.items())])
+            samples = []
+            for (chart, phase), histogram in sorted(self.chart_update_seconds.items()):
+                samples += histogram.samples("survey_dashboard_chart_update_seconds", {"chart": chart, "phase": phase})
+            metric("survey_dashboard_chart_update_seconds", "histogram",
+                   "Duration of shown chart updates by chart type and phase, total from scheduling to the patch",
+                   samples)
+
+        stats = get_survey_dataset().stats()
+        caches = {"result": stats["result_cache"], "wordcloud": stats["wordcloud_cache"],
+                  "figure_pool": stats["figure_pool"]}
+        # Layouts loaded from the precomputed artifact or from disk are hits of the word cloud cache, too
+        wordcloud = caches["wordcloud"]
+        hits = {name: cache["hits"] for name, cache in caches.items()}
+        hits["wordcloud"] += wordcloud["artifact_hits"] + wordcloud["disk_hits"]
+        metric("survey_dashboard_cache_hits_total", "counter", "Cache hits by cache",
+               [f"survey_dashboard_cache_hits_total{_labels({'cache': name})} {hits[name]}" for name in caches])
+        metric("survey_dashboard_cache_misses_total", "counter", "Cache misses by cache",
+               [f"survey_dashboard_cache_misses_total{_labels({'cache': name})} {cache['misses']}"
+                for name, cache in caches.items()])
+        metric("survey_dashboard_cache_hit_ratio", "gauge", "Hits per request of a cache since the process started",
+               [f"survey_dashboard_cache_hit_ratio{_labels({'cache': name})} {_number(cache['hit_ratio'])}"
+                for name, cache in caches.items()])
+        metric("survey_dashboard_survey_rows", "gauge", "Respondents of the survey served by this process",
+               [f"survey_dashboard_survey_rows {stats['rows']}"])
+        metric("process_resident_memory_bytes", "gauge", "Resident memory size in bytes",
+               [f"process_resident_memory_bytes {process_rss_bytes()}"])
+        return "\n".join(lines) + "\n"
+
+
+_metrics = None
+_lock = threading.Lock()
+
+
+def get_server_metrics() -> ServerMetrics:
+    """Return the process wide server metrics, created on first use."""
+    global _metrics
+    if _metrics is None:
+        with _lock:
+            if _metrics is None:
+                _metrics = ServerMetrics()
+    return _metrics
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Figures of the initial dashboard state, built ahead of the sessions that show them.
+Every new session takes a ready set and a background thread builds the next one.
+"""
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from survey_dashboard.core.config import PREBUILT_SESSIONS
+
+logger = logging.getLogger(__name__)
+
+
+class FigurePool:
+    """
+    Ready-built Bokeh figures per chart state, each handed out to one session only.
+
+    Bokeh models belong to a single document, so figures can not be shared between
+    sessions. Building the models is the larger part of a new session, the chart data
+    itself comes from the shared caches. The pool keeps up to `size` figures per key,
+    callers refill a key with fill after taking a figure of it. Figures are built one at a
+    time on a thread of the pool, not on the worker threads, so prebuilding never
+    delays chart updates and takes at most one thread's share of the interpreter
+    from the sessions.
+    """
+
+    def __init__(self, size: int = PREBUILT_SESSIONS):
+        self.size = size
+        self._ready = {}
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = None
+        self.hits = 0
+        self.misses = 0
+        self.build_errors = 0
+
+    def take(self, key, build):
+        """
+        Return a ready figure of key or build one, the pool is not refilled.
+
+        Args:
+            key: Hashable chart state, figures of equal keys must be interchangeable
+            build: Function without arguments building a new figure of key
+
+        Returns:
+            The figure, not shared with any other caller
+        """
+        with self._lock:
+            ready = self._ready.get(key)
+            figure = ready.popleft() if ready else None
+            if figure is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if figure is None:
+            figure = build()
+        return figure
+
+    def fill(self, key, build):
+        """Build figures of key in the background until `size` are ready or pending."""
+        if self.size <= 0:
+            return
+        with self._lock:
+            missing = self.size - len(self._ready.get(key, ())) - self._pending.get(key, 0)
+            if missing <= 0:
+                return
+            self._pending[key] = self._pending.get(key, 0) + missing
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="survey_dashboard_prebuild")
+        for _ in range(missing):
+            self._executor.submit(self._build, key, build)
+
+    def _build(self, key, build):
+        figure = None
+        try:
+            figure = build()
+        except Exception:
+            logger.exception("Prebuilding a figure of %s failed", key)
+        with self._lock:
+            self._pending[key] -= 1
+            if figure is None:
+                self.build_errors += 1
+            else:
+                self._ready.setdefault(key, deque()).append(figure)
+
+    def stats(self) -> dict:
+        """Hit ratio of the pool and the number of ready figures."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / requests if requests else 0.0,
+                "build_errors": self.build_errors,
+                "keys": len(self._ready),
+                "ready": sum(len(ready) for ready in self._ready.values()),
+                "size": self.size,
+            }
+
+
+_pool = None
+_lock = threading.Lock()
+
+
+def get_figure_pool() -> FigurePool:
+    """Return the process wide figure pool, created on first use."""
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = FigurePool()
+    return _pool
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Timing of the chart updates of the interactive callbacks.
+Off by default, see CALLBACK_TIMINGS and CALLBACK_TIMING_LOG in the config.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+from bokeh.core.json_encoder import PayloadEncoder
+from bokeh.core.serialization import Serializer
+from bokeh.document.events import DocumentPatchedEvent
+
+from survey_dashboard.core.config import CALLBACK_TIMING_LOG, CALLBACK_TIMINGS
+
+logger = logging.getLogger(__name__)
+
+# Name of the callback scheduling chart updates on the current thread, see timed_callback
+_callback = contextvars.ContextVar("survey_dashboard_callback", default=None)
+
+
+def patch_bytes(events: list) -> int:
+    """
+    Size of the PATCH-DOC message sent for held document events, JSON and binary buffers.
+
+    Encodes the events like the message does, without marking new models as synced,
+    so the events are sent unchanged afterwards.
+    """
+    events = [event for event in events if isinstance(event, DocumentPatchedEvent)]
+    if not events:
+        return 0
+    serializer = Serializer(references=events[0].document.models.synced_references)
+    content = serializer.encode(events)
+    # Binary buffers are sent as separate frames and referenced in the JSON content
+    content_json = PayloadEncoder(buffers=serializer.buffers, separators=(",", ":")).encode(content)
+    return len(content_json.encode("utf-8")) + sum(memoryview(buffer.data).nbytes for buffer in serializer.buffers)
+
+
+class UpdateTiming:
+    """
+    Timing of one chart update, from scheduling to the figure patched into the document.
+
+    The record holds the callback, the trigger and details of the update and the
+    seconds spent queued for a worker thread, selecting the data, building or
+    updating the figure and dispatching the document patch, plus the patch size.
+    Phases an update did not reach are None.
+    """
+
+    def __init__(self, timings, callback: str, details: dict):
+        self._timings = timings
+        self._scheduled = time.perf_counter()
+        self.record = {
+            "time": time.time(),
+            "pid": os.getpid(),
+            "callback": callback,
+            **details,
+            "queued_s": None,
+            "select_s": None,
+            "render_s": None,
+            "patch_s": None,
+            "total_s": None,
+            "payload_bytes": None,
+            "outcome": None,
+        }
+
+    def selection(self, compute):
+        """Wrap the data selection of the update, to be called in its place."""
+        @wraps(compute)
+        def timed():
+            start = time.perf_counter()
+            self.record["queued_s"] = start - self._scheduled
+            try:
+                return compute()
+            finally:
+                self.record["select_s"] = time.perf_counter() - start
+        return timed
+
+    def show(self, doc, show):
+        """
+        Run show() on the document and finish the record.
+
+        Document events are held while show() builds the figure, so their dispatch,
+        in which the server serializes the patch for the browser, is timed on its own.
+        The patch size is measured from the held events before the dispatch, it is
+        None if the Bokeh version does not keep them where expected.
+        """
+        hold = doc is not None and doc.callbacks.hold_value is None
+        if hold:
+            doc.hold("combine")
+        outcome = "error"
+        start = time.perf_counter()
+        try:
+            show()
+            outcome = "shown"
+        finally:
+            self.record["render_s"] = time.perf_counter() - start
+            if hold:
+                # Bokeh has no public accessor of the held events, without them the size is not recorded
+                held_events = getattr(doc.callbacks, "_held_events", None)
+                if held_events is not None:
+                    try:
+                        self.record["payload_bytes"] = patch_bytes(held_events)
+                    except Exception:
+                        logger.exception("Measuring the document patch of %s failed", self.record["callback"])
+                start = time.perf_counter()
+                doc.unhold()
+                self.record["patch_s"] = time.perf_counter() - start
+            self.finish(outcome)
+
+    def finish(self, outcome: str):
+        """Store the record, outcome is shown, superseded by a newer update of the pane, or error."""
+        self.record["outcome"] = outcome
+        self.record["total_s"] = time.perf_counter() - self._scheduled
+        self._timings.add(self.record)
+
+
+class CallbackTimings:
+    """
+    The latest chart update timings of a worker process, optionally logged to a file.
+
+    Records are kept in a ring buffer of `size` entries, the log receives every record
+    as one JSON object per line. Timing is enabled if either is configured or a
+    listener subscribes, e.g. the metrics endpoint.
+    """
+
+    def __init__(self, size: int = CALLBACK_TIMINGS, log_path: str = CALLBACK_TIMING_LOG):
+        self.size = size
+        self.log_path = log_path
+        self.enabled = size > 0 or bool(log_path)
+        self._records = deque(maxlen=max(size, 0))
+        self._lock = threading.Lock()
+        self._log = None
+        self._listeners = []
+
+    def start(self, details: dict):
+        """Timing of a chart update scheduled now, None if timing is disabled."""
+        if not self.enabled:
+            return None
+        return UpdateTiming(self, _callback.get(), details)
+
+    def subscribe(self, listener):
+        """
+        Call listener(record) with every new record, timing is enabled from now on.
+
+        Callbacks decorated with timed_callback before are not named in the records.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+            self.enabled = True
+
+    def add(self, record: dict):
+        for listener in self._listeners:
+            try:
+                listener(record)
+            except Exception:
+                logger.exception("Callback timing listener %r failed", listener)
+        with self._lock:
+            self._records.append(record)
+            if not self.log_path:
+                return
+            try:
+                if self._log is None:
+                    self._log = open(self.log_path, "a", encoding="utf-8")
+                self._log.write(json.dumps(record, default=str) + "\n")
+                self._log.flush()
+            except OSError as error:
+                logger.warning("Could not write the callback timing log %s (%s)", self.log_path, error)
+
+    def records(self) -> list:
+        """The kept records, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    def stats(self) -> dict:
+        """Number of kept updates and their median and maximum total seconds per callback."""
+        records = self.records()
+        totals = {}
+        for record in records:
+            if record["outcome"] == "shown":
+                totals.setdefault(record["callback"], []).append(record["total_s"])
+        return {
+            "enabled": self.enabled,
+            "records": len(records),
+            "callbacks": {
+                callback: {"updates": len(values), "median_s": statistics.median(values), "max_s": max(values)}
+                for callback, values in totals.items()
+            },
+        }
+
+
+def timed_callback(name: str):
+    """
+    Decorator naming the chart updates a callback schedules in their timing records.
+
+    Returns the callback unchanged if timing is disabled.
+    """
+    def decorate(callback):
+        if not get_callback_timings().enabled:
+            return callback
+
+        @wraps(callback)
+        def timed(*args, **kwargs):
+            token = _callback.set(name)
+            try:
+                return callback(*args, **kwargs)
+            finally:
+                _callback.reset(token)
+        return timed
+    return decorate
+
+
+_timings = None
+_lock = threading.Lock()
+
+
+def get_callback_timings() -> CallbackTimings:
+    """Return the process wide callback timings, created on first use."""
+    global _timings
+    if _timings is None:
+        with _lock:
+            if _timings is None:
+                _timings = CallbackTimings()
+    return _timings
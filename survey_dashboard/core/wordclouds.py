@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Cache of word cloud layouts shared by all sessions of a worker process.
+Placing the words is the expensive part of a word cloud, the same word
+frequencies and parameters always reuse the first layout computed for them.
+Layouts of the common filter selections are built offline with
+`survey-dashboard build-cache` into a read-only artifact loaded on startup.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from itertools import combinations
+from pathlib import Path
+from types import MappingProxyType
+
+import wordcloud as wordcloud_module
+from wordcloud import WordCloud
+
+from survey_dashboard.core.cache import LRUCache
+from survey_dashboard.core.config import (
+    DATAFILE_PATH,
+    DATA_CACHE_DIR,
+    WORDCLOUD_CACHE_SIZE,
+    WORDCLOUD_CACHE_DIR,
+    WORDCLOUD_CONTENT,
+)
+from survey_dashboard.data.hcs_clean_dictionaries import FILTER_OPTIONS
+
+logger = logging.getLogger(__name__)
+
+# Part of every key, increase when the stored layout format changes
+LAYOUT_FORMAT_VERSION = 1
+
+
+def layout_key(word_counts: dict, params: dict, font_path: str) -> str:
+    """
+    Fingerprint of a word cloud layout.
+
+    Args:
+        word_counts: Frequency of every word
+        params: Keyword arguments of WordCloud, e.g. size, font sizes and max_words
+        font_path: Font of the word cloud, only its file name is part of the key
+
+    Returns:
+        Hex SHA-256 of the frequencies, the parameters and the layout format
+    """
+    payload = {
+        "format": LAYOUT_FORMAT_VERSION,
+        "wordcloud": wordcloud_module.__version__,
+        "font": os.path.basename(font_path),
+        "params": params,
+        "words": sorted(word_counts.items()),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def dump_layout(layout: list) -> list:
+    """Convert WordCloud.layout_ into plain JSON values."""
+    return [
+        [word, float(frequency), int(font_size), int(y), int(x),
+         None if orientation is None else int(orientation), color]
+        for (word, frequency), font_size, (y, x), orientation, color in layout
+    ]
+
+
+def load_layout(values: list) -> tuple:
+    """Convert the output of dump_layout back into the entries of WordCloud.layout_."""
+    return tuple(
+        ((word, frequency), font_size, (y, x), orientation, color)
+        for word, frequency, font_size, y, x, orientation, color in values
+    )
+
+
+class WordcloudLayoutCache:
+    """
+    Word cloud layouts in memory and, if a directory is given, on disk.
+
+    Layouts are keyed by layout_key, so any session asking for the same words
+    gets the layout without running the placement again. The in-memory part is
+    a bounded LRU cache, the disk part holds one JSON file per layout and
+    survives restarts. Layouts missing in memory are looked up in the read-only
+    artifact first, then on disk, and only generated if neither has them.
+    """
+
+    def __init__(self, maxsize: int = 256, cache_dir: str = "", artifact=None):
+        self.cache_dir = cache_dir
+        self.artifact = MappingProxyType(dict(artifact or {}))
+        self._memory = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self.artifact_hits = 0
+        self.disk_hits = 0
+        self.layouts = 0
+        self.layout_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def get_or_generate(self, word_counts: dict, params: dict) -> WordCloud:
+        """
+        Return a WordCloud with the layout of the given word frequencies.
+
+        Args:
+            word_counts: Frequency of every word
+            params: Keyword arguments of WordCloud
+        """
+        wordcloud = WordCloud(**params)
+        key = layout_key(word_counts, params, wordcloud.font_path)
+        generated = []
+
+        def compute():
+            stored = self.artifact.get(key)
+            if stored is not None:
+                with self._lock:
+                    self.artifact_hits += 1
+                return {"layout": load_layout(stored["layout"]), "seconds": stored["seconds"]}
+            entry = self._read(key)
+            if entry is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                return entry
+            start = time.perf_counter()
+            wordcloud.generate_from_frequencies(word_counts)
+            entry = {"layout": load_layout(dump_layout(wordcloud.layout_)), "seconds": time.perf_counter() - start}
+            generated.append(entry)
+            self._write(key, entry)
+            return entry
+
+        entry = self._memory.get_or_compute(key, compute)
+        with self._lock:
+            if generated:
+                self.layouts += 1
+                self.layout_seconds += entry["seconds"]
+            else:
+                self.saved_seconds += entry["seconds"]
+        if not generated:
+            wordcloud.layout_ = list(entry["layout"])
+        return wordcloud
+
+    def _path(self, key: str) -> Path:
+        return Path(self.cache_dir) / f"{key}.json"
+
+    def _read(self, key: str):
+        """Layout entry stored on disk, None if there is none or it cannot be read."""
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as layout_file:
+                stored = json.load(layout_file)
+            return {"layout": load_layout(stored["layout"]), "seconds": stored["seconds"]}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as error:
+            logger.warning("Ignoring unreadable word cloud layout %s (%s)", self._path(key), error)
+            return None
+
+    def _write(self, key: str, entry: dict):
+        """Store a layout entry on disk, written to a temporary file first and moved into place."""
+        if not self.cache_dir:
+            return
+        try:
+            Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=self.cache_dir, suffix=".tmp", delete=False,
+                                             encoding="utf-8") as layout_file:
+                json.dump({"layout": dump_layout(entry["layout"]), "seconds": entry["seconds"]}, layout_file)
+            os.replace(layout_file.name, self._path(key))
+        except OSError as error:
+            logger.warning("Could not store word cloud layout in %s (%s)", self.cache_dir, error)
+
+    def export(self) -> dict:
+        """Layouts held in memory in the JSON form of the artifact, keyed by layout_key."""
+        return {
+            key: {"layout": dump_layout(entry["layout"]), "seconds": entry["seconds"]}
+            for key, entry in self._memory.items()
+        }
+
+    def clear(self):
+        """Drop the layouts held in memory and reset the counters, the artifact and files on disk are kept."""
+        self._memory.clear()
+        with self._lock:
+            self.artifact_hits = 0
+            self.disk_hits = 0
+            self.layouts = 0
+            self.layout_seconds = 0.0
+            self.saved_seconds = 0.0
+
+    def stats(self) -> dict:
+        """Hit counters, the time spent on layouts and the time saved by reusing them."""
+        memory = self._memory.stats()
+        with self._lock:
+            requests = memory["hits"] + memory["misses"]
+            hits = memory["hits"] + self.artifact_hits + self.disk_hits
+            return {
+                "hits": memory["hits"],
+                "artifact_hits": self.artifact_hits,
+                "artifact_size": len(self.artifact),
+                "disk_hits": self.disk_hits,
+                "misses": self.layouts,
+                "hit_ratio": hits / requests if requests else 0.0,
+                "size": memory["size"],
+                "maxsize": memory["maxsize"],
+                "layout_seconds": self.layout_seconds,
+                "saved_seconds": self.saved_seconds,
+            }
+
+
+def layout_artifact_path(path: str = DATAFILE_PATH, cache_dir: str = DATA_CACHE_DIR) -> Path:
+    """File of the precomputed word cloud layouts for the current content of the survey file."""
+    # Imported here, core.data reports the stats of this module
+    from survey_dashboard.core.data import csv_content_hash
+
+    return Path(cache_dir) / f"wordcloud-layouts-v{LAYOUT_FORMAT_VERSION}-{csv_content_hash(path)[:16]}.json"
+
+
+def load_layout_artifact(artifact_path) -> dict:
+    """
+    Layouts of a precomputed artifact, keyed by layout_key.
+
+    A missing, unreadable or outdated artifact is ignored, the layouts are
+    then generated on demand.
+    """
+    try:
+        with open(artifact_path, encoding="utf-8") as artifact_file:
+            artifact = json.load(artifact_file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as error:
+        logger.warning("Ignoring unreadable word cloud layout artifact %s (%s)", artifact_path, error)
+        return {}
+    if artifact.get("format") != LAYOUT_FORMAT_VERSION or artifact.get("wordcloud") != wordcloud_module.__version__:
+        logger.warning("Ignoring outdated word cloud layout artifact %s, run survey-dashboard build-cache", artifact_path)
+        return {}
+    return artifact["layouts"]
+
+
+def wordcloud_selections() -> list:
+    """
+    Global filter selections whose word clouds are precomputed.
+
+    Every single research area and every pair of research areas, each without a
+    method filter and with every single method.
+
+    Returns:
+        list of (research_areas, methods) tuples
+    """
+    area_options = FILTER_OPTIONS["researchArea"]
+    real_areas = [area for area in area_options if area not in {"All", "Cum. Sum"}]
+    area_selections = [[area] for area in area_options] + [list(pair) for pair in combinations(real_areas, 2)]
+    method_selections = [[]] + [[method] for method in FILTER_OPTIONS["method"]]
+    return [(areas, methods) for areas in area_selections for methods in method_selections]
+
+
+def build_layout_artifact(chart_manager, artifact_path, widths) -> dict:
+    """
+    Lay out the word clouds of all wordcloud_selections and store them as artifact.
+
+    The artifact is written to a temporary file and moved into place at the end,
+    so running servers never read a partially written file.
+
+    Args:
+        chart_manager: ChartManager whose layout_cache collects the layouts
+        artifact_path: File to write, see layout_artifact_path
+        widths: Figure widths the word clouds are shown with
+
+    Returns:
+        The stats of the layout cache after the build
+    """
+    for areas, methods in wordcloud_selections():
+        for content in WORDCLOUD_CONTENT.values():
+            for width in widths:
+                chart_manager.layout_wordcloud(areas, methods, content, width=width)
+
+    artifact = {
+        "format": LAYOUT_FORMAT_VERSION,
+        "wordcloud": wordcloud_module.__version__,
+        "layouts": chart_manager.layout_cache.export(),
+    }
+    artifact_path = Path(artifact_path)
+    artifact_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=artifact_path.parent, suffix=".tmp", delete=False,
+                                     encoding="utf-8") as artifact_file:
+        json.dump(artifact, artifact_file)
+    # Readable by servers running as another user, they never write to it
+    os.chmod(artifact_file.name, 0o644)
+    os.replace(artifact_file.name, artifact_path)
+    return chart_manager.layout_cache.stats()
+
+
+_layout_cache = None
+_layout_cache_lock = threading.Lock()
+
+
+def get_wordcloud_cache() -> WordcloudLayoutCache:
+    """Return the process wide word cloud layout cache, created on first use."""
+    global _layout_cache
+    if _layout_cache is None:
+        with _layout_cache_lock:
+            if _layout_cache is None:
+                artifact = load_layout_artifact(layout_artifact_path()) if DATA_CACHE_DIR else {}
+                _layout_cache = WordcloudLayoutCache(WORDCLOUD_CACHE_SIZE, WORDCLOUD_CACHE_DIR, artifact)
+    return _layout_cache
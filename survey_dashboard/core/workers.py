@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Worker threads shared by all sessions of a process.
+Chart data and word cloud layouts are prepared here, so a slow update of one
+session does not block the event loop serving the others.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from survey_dashboard.core.config import WORKER_THREADS
+
+_executor = None
+_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Return the process wide thread pool, created on first use.
+
+    Returns:
+        ThreadPoolExecutor with WORKER_THREADS threads, None if WORKER_THREADS is 0
+    """
+    global _executor
+    if WORKER_THREADS <= 0:
+        return None
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="survey_dashboard")
+    return _executor
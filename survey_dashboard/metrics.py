@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Server plugin, passed to `panel serve --plugins survey_dashboard.metrics`.
+
+Serves the metrics of survey_dashboard.core.metrics at /metrics for a Prometheus
+scraper or a plain `curl`, no collector is needed. Importing the plugin starts
+counting sessions and timing the chart updates of the process.
+"""
+from tornado.web import RequestHandler
+
+from survey_dashboard.core.metrics import CONTENT_TYPE, get_server_metrics
+
+
+class MetricsHandler(RequestHandler):
+    """Metrics of the serving process in the Prometheus text format."""
+
+    def get(self):
+        self.set_header("Content-Type", CONTENT_TYPE)
+        self.set_header("Cache-Control", "no-store")
+        self.write(get_server_metrics().render())
+
+
+get_server_metrics().install()
+
+ROUTES = [("/metrics", MetricsHandler, {})]
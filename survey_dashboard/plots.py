@@ -12,7 +12,7 @@
 This module contains functions to visualize data in an interactive way with mainly bokeh
 """
 import numpy as np
-from functools import wraps
+from functools import wraps, lru_cache
 from collections import Counter
 from bokeh.models import ColumnDataSource
 
@@ -228,6 +228,26 @@ def rek_set_attr(obj: object, key: str, val:object) -> None:
         key_new = ".".join(ke for ke in keys[1:])
         return rek_set_attr(obj2, key_new, val)
 
+
+# Prefix of the tag recording what the glyphs of a figure were built for
+GLYPH_STRUCTURE_TAG = 'glyph_structure='
+
+
+def tag_glyph_structure(fig, structure: tuple) -> None:
+    """
+    Record in the tags of fig what its glyphs were built for, see has_glyph_structure
+
+    Tags are a public property of every Bokeh model, so the record stays with the
+    figure wherever it was built, e.g. ahead of a session.
+    """
+    tags = [tag for tag in fig.tags if not (isinstance(tag, str) and tag.startswith(GLYPH_STRUCTURE_TAG))]
+    fig.tags = tags + [GLYPH_STRUCTURE_TAG + repr(structure)]
+
+
+def has_glyph_structure(fig, structure: tuple) -> bool:
+    """True if the glyphs of fig were built for structure and it has a renderer to update"""
+    return bool(fig.renderers) and GLYPH_STRUCTURE_TAG + repr(structure) in fig.tags
+
 # DONE: Refactored this function heavily to get the plots to work
 def bokeh_barchart(df, x='x_value', y=['y_value'], factors=None, figure=None, data_visible=[True], title='', 
                     width=0.1,  xlabel='', ylabel='Number of answers', palette=Category20c, 
@@ -276,30 +296,7 @@ def _bokeh_barchart_impl(df, x='x_value', y=['y_value'], factors=None, figure=No
     help_t = HelpTool(description=description, redirect=redirect)
     tools = 'wheel_zoom,box_zoom,undo,reset,save'
     
-     # Use the provided ranges or calculate defaults
-    if x_range is None:
-        if x in source.data:
-            x_range = source.data[x]
-        else:
-            x_range = ['Category 1', 'Category 2', 'Category 3']
-
-    # Convert numerical lists to strings for categorical data
-    if isinstance(x_range, list) and len(x_range) > 0 and isinstance(x_range[0], (int, float)):
-        x_range = [str(val) for val in x_range]
-    
-    #if y_range is None:
-     # Calculate numerical range from actual data values
-    max_values = []
-    for y_key in y_keys:
-        if y_key in source.data:
-            max_values.extend(source.data[y_key])
-    
-    if max_values:
-        numerical_max = max(max_values)
-        numerical_range = (0, numerical_max * 1.1)
-    else:
-        numerical_range = (0, 10)  # Fallback default range
-
+    x_range, numerical_range = _barchart_ranges(source, x, y_keys, x_range)
     
     # Set up ranges based on orientation
     if orientation == 'vertical':
@@ -369,9 +366,74 @@ def _bokeh_barchart_impl(df, x='x_value', y=['y_value'], factors=None, figure=No
     # Set axis labels
     fig.yaxis.axis_label = fig_ylabel
     fig.xaxis.axis_label = fig_xlabel
+
+    # Glyphs, legend and tooltips depend on these, see update_barchart
+    tag_glyph_structure(fig, ('bar', orientation, tuple(y_keys), tuple(fill_color), width, bool(bars)))
     
     return fig
 
+
+def _barchart_ranges(source, x, y_keys, x_range=None):
+    """Categorical factors and numerical (start, end) range of a bar chart"""
+     # Use the provided ranges or calculate defaults
+    if x_range is None:
+        if x in source.data:
+            x_range = source.data[x]
+        else:
+            x_range = ['Category 1', 'Category 2', 'Category 3']
+
+    # Convert numerical lists to strings for categorical data
+    if isinstance(x_range, list) and len(x_range) > 0 and isinstance(x_range[0], (int, float)):
+        x_range = [str(val) for val in x_range]
+    
+    #if y_range is None:
+     # Calculate numerical range from actual data values
+    max_values = []
+    for y_key in y_keys:
+        if y_key in source.data:
+            max_values.extend(source.data[y_key])
+    
+    if max_values:
+        numerical_max = max(max_values)
+        numerical_range = (0, numerical_max * 1.1)
+    else:
+        numerical_range = (0, 10)  # Fallback default range
+
+    return x_range, numerical_range
+
+
+def update_barchart(fig, df, x='x_value', y=['y_value'], title='', width=0.1, fill_color=None,
+                    orientation='vertical', x_range=None, **kwargs):
+    """
+    Update a bar chart made by bokeh_barchart in place.
+
+    Only the data, the ranges and the title are replaced, which is a small document
+    patch compared to a new figure. Takes the arguments of bokeh_barchart, arguments
+    only used while building the figure are ignored.
+
+    :return: False if the figure has no series or other series, colors, bar width or orientation
+        and has to be rebuilt, True otherwise
+    """
+    # Without any series there is no renderer holding the data, the chart is rebuilt
+    if not y:
+        return False
+    structure = ('bar', orientation, tuple(y), tuple(fill_color or ()), width, True)
+    if not has_glyph_structure(fig, structure):
+        return False
+
+    factors, (start, end) = _barchart_ranges(df, x, y, x_range)
+    if orientation == 'vertical':
+        factor_range, numerical_range = fig.x_range, fig.y_range
+    else:
+        factor_range, numerical_range = fig.y_range, fig.x_range
+
+    # All bars share one source
+    fig.renderers[0].data_source.data = dict(df.data)
+    factor_range.factors = list(factors)
+    numerical_range.update(start=start, end=end)
+    fig.title.text = title
+    return True
+
 # bokeh piechart
 @apply_theme(theme=pie_theme)
 def bokeh_piechart(df, x='x_value', y=['counts'], figure=None, outer_radius=0.7, inner_radius=0.4, 
@@ -778,6 +840,7 @@ def bokeh_corr_plot(source, x='x_values', y='y_values',  figure=None, title='',
     fig.outline_line_color = None
     fig.yaxis.axis_label = ylabel
     fig.xaxis.axis_label = xlabel
+    tag_glyph_structure(fig, ('corr', x, y, x_range is None, y_range is None))
     #fig.title.text_font_size='18px'
     #fig.yaxis.axis_label_text_font_size = '18px'
     #fig.xaxis.axis_label_text_font_size = '18px'
@@ -802,6 +865,33 @@ def bokeh_corr_plot(source, x='x_values', y='y_values',  figure=None, title='',
     #fig.add_layout(legend, 'right')
 
     return fig
+
+
+def update_corr_plot(fig, source, x='x_values', y='y_values', title='', x_range=None, y_range=None,
+                     xlabel='', ylabel='', tooltips=None, **kwargs):
+    """
+    Update a correlation plot made by bokeh_corr_plot in place.
+
+    Replaces the data, the categorical ranges, axis labels, title and tooltips.
+
+    :return: False if the figure has to be rebuilt because an axis changes between
+        categorical and numerical, True otherwise
+    """
+    structure = ('corr', x, y, x_range is None, y_range is None)
+    if not has_glyph_structure(fig, structure):
+        return False
+
+    fig.renderers[0].data_source.data = dict(source.data)
+    if x_range is not None:
+        fig.x_range.factors = list(x_range)
+    if y_range is not None:
+        fig.y_range.factors = list(y_range)
+    fig.xaxis.axis_label = xlabel
+    fig.yaxis.axis_label = ylabel
+    fig.title.text = title
+    if tooltips is not None:
+        fig.select_one(HoverTool).tooltips = tooltips
+    return True
 '''
 def create_legend_items(number, size_min, color, fig):
     """
@@ -887,10 +977,13 @@ def create_legend_corr(fig, colors=['red', 'blue', 'green', 'red', 'red', 'red']
 
 
 # Try to find an interactive wordcloud
-def generate_wordcloud(word_list, min_font_size=5, max_font_size=50, max_words=100, background_color='white', **kwargs):
+def generate_wordcloud(word_list, min_font_size=5, max_font_size=50, max_words=100, background_color='white', layout_cache=None, **kwargs):
     """
     This returns a static svg image of the wordcloud
 
+    :param layout_cache: reuses the layout of equal word frequencies and parameters if given
+    :type layout_cache: WordcloudLayoutCache
+
     """
     if len(word_list) == 0:
         # if no words are given, we at least return a wordcloud, importaant as palceholder
@@ -898,24 +991,78 @@ def generate_wordcloud(word_list, min_font_size=5, max_font_size=50, max_words=1
     word_count_dict = Counter(word_list)
     #text = "+".join(ent for ent in word_list)
     #print(text)
-    wordcloud = WordCloud(max_font_size=max_font_size, min_font_size=min_font_size, max_words=max_words, background_color=background_color, **kwargs).generate_from_frequencies(word_count_dict)
+    params = dict(max_font_size=max_font_size, min_font_size=min_font_size, max_words=max_words, background_color=background_color, **kwargs)
+    if layout_cache is not None:
+        return layout_cache.get_or_generate(word_count_dict, params)
+    wordcloud = WordCloud(**params).generate_from_frequencies(word_count_dict)
     
     return wordcloud
 
 
 
-def interactive_wordcloud(wordcloud, **kwargs):
+def interactive_wordcloud(wordcloud, data=None, **kwargs):
     """
     Visualize a wordcloud
 
     :param wordcloud: the wordcloud instance 
     :type wordcloud: Wordcloud
+    :param data: the glyph columns of the wordcloud from wordcloud_data, computed if not given
+    :type data: dict
 
     """
     wc = wordcloud
-    data = {}
     height, width = wc.height*wc.scale, wc.width*wc.scale
 
+    source = ColumnDataSource(data=wordcloud_data(wc) if data is None else data)
+    tools='hover,tap'#pan,box_zoom,wheel_zoom,save'
+
+    # Maybe switch tooltip off, and register a callback to the size,
+    # i.e. increase size on hover, or color black
+    tooltips = [("", "@text")]#[(f"Word", "@text"), 
+               # (f"Count", "@count")]#,
+               #(f"X", "@x"),
+               #(f"Y", "@y")]
+    
+    fig =  bokeh_figure(height=height, width=width,
+               title='',
+               toolbar_location=None,
+               tools=tools,
+               outline_line_color = None,
+               x_axis_type= None, y_axis_type=None,#,
+               tooltips=tooltips
+            )
+    glyph = Text(x="x", y="y", text="text", angle='angle', angle_units='deg',
+                 text_color="color", text_font_size='font_size', text_font={'value': 'HIFIS DIN'}, **kwargs)
+    fig.add_glyph(source, glyph)
+    
+    fig.background_fill_color = '#00000000' #F7F7F7', #transparent
+    fig.border_fill_color = '#00000000'
+    tag_glyph_structure(fig, ('wordcloud', height, width))
+
+    return fig
+
+
+@lru_cache(maxsize=128)
+def _truetype_font(font_path, size):
+    """Font of the given pixel size, each font file and size is parsed only once"""
+    return ImageFont.truetype(font_path, size)
+
+
+@lru_cache(maxsize=8192)
+def _glyph_metrics(font_path, word, size):
+    """
+    Size, offset, ascent and descent of a word rendered in a font of the given pixel size
+
+    :return: (size_x, size_y, offset_x, offset_y, ascent, descent)
+    """
+    font = _truetype_font(font_path, size)
+    (size_x, size_y), (offset_x, offset_y) = font.font.getsize(word)
+    ascent, descent = font.getmetrics()
+    return size_x, size_y, offset_x, offset_y, ascent, descent
+
+
+def wordcloud_data(wc):
+    """Columns of the text glyph for the words placed by a wordcloud instance"""
     data_word, data_word_count, data_word_x, data_word_y, data_word_color, data_word_font_size,  data_word_angle= [],[],[],[],[],[], []
     # Get font information
     # Get max font size
@@ -923,7 +1070,7 @@ def interactive_wordcloud(wordcloud, **kwargs):
         max_font_size = max(w[1] for w in wc.layout_)
     else:
         max_font_size = wc.max_font_size
-    font = ImageFont.truetype(wc.font_path, int(max_font_size * wc.scale))
+    font = _truetype_font(wc.font_path, int(max_font_size * wc.scale))
     raw_font_family, raw_font_style = font.getname()
     font_family = repr(raw_font_family)
 
@@ -934,9 +1081,8 @@ def interactive_wordcloud(wordcloud, **kwargs):
         y *= wc.scale
 
         # Get text metrics
-        font = ImageFont.truetype(wc.font_path, int(font_size * wc.scale))
-        (size_x, size_y), (offset_x, offset_y) = font.font.getsize(word)
-        ascent, descent = font.getmetrics()
+        size_x, size_y, offset_x, offset_y, ascent, descent = _glyph_metrics(
+            wc.font_path, word, int(font_size * wc.scale))
 
         # Compute text bounding box
         min_x = -offset_x
@@ -972,28 +1118,21 @@ def interactive_wordcloud(wordcloud, **kwargs):
             'count' : data_word_count,
             'angle' : data_word_angle
            }
-    source = ColumnDataSource(data=data)
-    tools='hover,tap'#pan,box_zoom,wheel_zoom,save'
 
-    # Maybe switch tooltip off, and register a callback to the size,
-    # i.e. increase size on hover, or color black
-    tooltips = [("", "@text")]#[(f"Word", "@text"), 
-               # (f"Count", "@count")]#,
-               #(f"X", "@x"),
-               #(f"Y", "@y")]
-    
-    fig =  bokeh_figure(height=height, width=width,
-               title='',
-               toolbar_location=None,
-               tools=tools,
-               outline_line_color = None,
-               x_axis_type= None, y_axis_type=None,#,
-               tooltips=tooltips
-            )
-    glyph = Text(x="x", y="y", text="text", angle='angle', angle_units='deg',
-                 text_color="color", text_font_size='font_size', text_font={'value': 'HIFIS DIN'}, **kwargs)
-    fig.add_glyph(source, glyph)
-    
-    fig.background_fill_color = '#00000000' #F7F7F7', #transparent
-    fig.border_fill_color = '#00000000'
-    return fig
\ No newline at end of file
+    return data
+
+
+def update_wordcloud(fig, wordcloud, data=None):
+    """
+    Update a wordcloud made by interactive_wordcloud in place with the words of another wordcloud.
+
+    :param data: the glyph columns of the wordcloud from wordcloud_data, computed if not given
+    :return: False if the figure has another size and has to be rebuilt, True otherwise
+    """
+    wc = wordcloud
+    structure = ('wordcloud', wc.height*wc.scale, wc.width*wc.scale)
+    if not has_glyph_structure(fig, structure):
+        return False
+
+    fig.renderers[0].data_source.data = wordcloud_data(wc) if data is None else data
+    return True
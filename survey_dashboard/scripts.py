@@ -57,10 +57,43 @@ import sys
 from pathlib import Path
 
 
+def build_cache():
+    """
+    Build the columnar cache of the survey data, so workers only memory-map it on startup,
+    and the word cloud layouts of the common filter selections.
+    """
+    from survey_dashboard.core.config import ACCORDION_WIDTH, DATAFILE_PATH, DATA_CACHE_DIR
+    from survey_dashboard.core.charts import ChartManager
+    from survey_dashboard.core.data import DataProcessor, build_columnar_cache
+    from survey_dashboard.core.wordclouds import (
+        WordcloudLayoutCache,
+        build_layout_artifact,
+        layout_artifact_path,
+    )
+    from survey_dashboard.plots import DEFAULT_FIGURE_WIDTH
+
+    if not DATA_CACHE_DIR:
+        print("No cache directory configured (SURVEY_DASHBOARD_CACHE_DIR is empty).")
+        sys.exit(1)
+    cache_path = build_columnar_cache(DATAFILE_PATH, DATA_CACHE_DIR)
+    print(f"Columnar survey data cache: {cache_path}")
+
+    artifact_path = layout_artifact_path(DATAFILE_PATH, DATA_CACHE_DIR)
+    # Unbounded and without artifact, so every layout is generated and kept for the export
+    chart_manager = ChartManager(DataProcessor(), layout_cache=WordcloudLayoutCache(maxsize=sys.maxsize))
+    stats = build_layout_artifact(chart_manager, artifact_path, widths=(DEFAULT_FIGURE_WIDTH, ACCORDION_WIDTH))
+    print(
+        f"Word cloud layouts: {artifact_path} "
+        f"({stats['size']} layouts in {stats['layout_seconds']:.1f} s)"
+    )
+
+
 def run_app():
     """Run the survey dashboard application using Panel serve.
 
     Supports both development and production modes via command-line arguments.
+    `survey-dashboard build-cache` prepares the data cache instead of starting the server,
+    `--metrics` serves the metrics of survey_dashboard.core.metrics at /metrics.
 
     Kubernetes Deployment Note:
     ---------------------------
@@ -75,6 +108,13 @@ def run_app():
     """
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Run the HMC Survey Dashboard")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="serve",
+        choices=["serve", "build-cache"],
+        help="Start the dashboard server (default) or build the survey data and word cloud caches"
+    )
     parser.add_argument(
         "--production",
         action="store_true",
@@ -90,8 +130,17 @@ def run_app():
         default="5006",
         help="Port to run the server on (default: 5006)"
     )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Serve sessions, chart update latencies, cache hit ratios and memory at /metrics (Prometheus format)"
+    )
     args = parser.parse_args()
 
+    if args.command == "build-cache":
+        build_cache()
+        return
+
     # Get the directory containing app.py (same directory as scripts.py)
     script_dir = Path(__file__).parent
     app_path = script_dir / "app.py"
@@ -99,6 +148,9 @@ def run_app():
     # Static files directory for assets
     static_dir = script_dir / "hmc_layout" / "static" / "en_files"
 
+    # Setup script loading the shared survey data once per worker process
+    setup_path = script_dir / "warmup.py"
+
     # Build the panel serve command
     cmd = [
         sys.executable, "-m", "panel", "serve",
@@ -107,8 +159,12 @@ def run_app():
         "--address", args.host if args.production else "localhost",
         "--static-dirs", f"en_files={static_dir}",
         "--index", "app",  # Serve app.py at the root of prefix instead of /app
+        "--setup", str(setup_path),
     ]
 
+    if args.metrics:
+        cmd.extend(["--plugins", "survey_dashboard.metrics"])
+
     # Production-specific settings
     if args.production:
         cmd.extend([
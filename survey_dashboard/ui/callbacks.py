@@ -13,8 +13,19 @@ Callbacks module for the survey dashboard.
 Handles all interactive update callbacks for charts and visualizations.
 """
 
-from survey_dashboard.core.config import DEFAULT_QUESTIONS, WORDCLOUD_CONTENT
+from functools import partial
+
+import panel as pn
+
+from survey_dashboard.core.config import DEFAULT_QUESTIONS, WORDCLOUD_CONTENT, FILTER_DEBOUNCE_MS, LOADING_DELAY_MS
 from survey_dashboard.core.charts import ChartManager
+from survey_dashboard.core.timing import get_callback_timings, timed_callback
+from survey_dashboard.core.workers import get_executor
+
+
+def _trigger(event):
+    """Name of the widget whose change triggered a callback."""
+    return getattr(getattr(event, "obj", None), "name", None)
 
 
 class CallbackManager:
@@ -33,6 +44,11 @@ class CallbackManager:
         self.chart_manager = chart_manager
         self.widget_factory = widget_factory
         self.correlation_row = None  # Will be set via set_correlation_row()
+        self._global_filters = None  # Will be set via bind_global_filters()
+        self._global_updates = []
+        self._pending_filter_event = None
+        self._debounce = None
+        self._generations = {}  # id(target) -> number of the latest update scheduled for it
 
     def set_correlation_row(self, correlation_row):
         """
@@ -43,6 +59,119 @@ class CallbackManager:
         """
         self.correlation_row = correlation_row
 
+    def bind_global_filters(self, research_area, method, updates):
+        """
+        Recompute every chart depending on the global filters once per filter change.
+
+        Both filter widgets share one watcher. Changes following each other within
+        FILTER_DEBOUNCE_MS are coalesced into a single recompute. The updates then
+        run concurrently on the worker threads, in the given order, and share one
+        FilterState.
+
+        Args:
+            research_area: Research area MultiChoice widget
+            method: Data generation method MultiChoice widget
+            updates: List of (callback, target) pairs with callbacks from create_update_callbacks
+        """
+        self._global_filters = (research_area, method)
+        self._global_updates = list(updates)
+        research_area.param.watch(self._on_global_filter_change, "value")
+        method.param.watch(self._on_global_filter_change, "value")
+
+    def _on_global_filter_change(self, event):
+        """Schedule the global filter updates, restarting the debounce window."""
+        self._pending_filter_event = event
+        doc = pn.state.curdoc
+        if self._debounce is not None:
+            try:
+                doc.remove_timeout_callback(self._debounce)
+            except ValueError:
+                pass  # Already ran
+            self._debounce = None
+
+        if FILTER_DEBOUNCE_MS > 0 and doc is not None and doc.session_context is not None:
+            self._debounce = doc.add_timeout_callback(self._apply_global_filters, FILTER_DEBOUNCE_MS)
+        else:
+            # No server session to schedule on, e.g. in a notebook
+            self._apply_global_filters()
+
+    def _apply_global_filters(self):
+        """Schedule all global filter updates for the current filter selection."""
+        self._debounce = None
+        event, self._pending_filter_event = self._pending_filter_event, None
+
+        # Submitted in order, so the overview charts do not wait for the word clouds
+        for callback, target in self._global_updates:
+            callback(target, event)
+
+    def _schedule(self, target, compute, render, **details):
+        """
+        Update a pane with data prepared off the event loop.
+
+        compute() runs on the worker threads, render(target.object, result) then runs
+        on the session's document and returns the figure to show. Every pane is
+        updated by its own task and shown as soon as that task is done. Panes still
+        waiting after LOADING_DELAY_MS show a loading indicator, toggling it costs
+        several milliseconds on the event loop and is not worth it for fast updates.
+
+        The update counts as the latest one of the pane. When a newer update of the
+        pane is scheduled meanwhile, this one is skipped if it has not started yet
+        and its result is dropped otherwise. Without a server session or with
+        WORKER_THREADS = 0 the update runs right away.
+
+        If callback timing is enabled, the phases of the update are recorded together
+        with details, e.g. the question and filters, see survey_dashboard.core.timing.
+        """
+        generation = self._generations.get(id(target), 0) + 1
+        self._generations[id(target)] = generation
+
+        def current():
+            return self._generations.get(id(target)) == generation
+
+        timing = get_callback_timings().start(details)
+        if timing is not None:
+            compute = timing.selection(compute)
+
+        doc = pn.state.curdoc
+        executor = get_executor()
+        if executor is None or doc is None or doc.session_context is None:
+            result = compute()
+            self._display(target, lambda: render(target.object, result), timing, doc)
+            return
+
+        future = executor.submit(lambda: compute() if current() else None)
+        doc.add_timeout_callback(partial(self._show_loading, target, current, future), LOADING_DELAY_MS)
+        # Models may only be changed on the session's document, not on the worker thread
+        future.add_done_callback(
+            lambda future: doc.add_next_tick_callback(
+                partial(self._render, target, current, future, render, timing, doc)
+            )
+        )
+
+    @staticmethod
+    def _show_loading(target, current, future):
+        """Show the loading indicator of a pane whose update is still running."""
+        if current() and not future.done():
+            target.loading = True
+
+    def _render(self, target, current, future, render, timing=None, doc=None):
+        """Show the result of a finished update task unless a newer update of the pane is pending."""
+        if not current():
+            if timing is not None:
+                timing.finish("superseded")
+            return
+        try:
+            self._display(target, lambda: render(target.object, future.result()), timing, doc)
+        finally:
+            target.loading = False
+
+    def _display(self, target, build, timing, doc):
+        """Show the figure returned by build(), timing its construction and document patch if enabled."""
+        if timing is None:
+            self._show(target, build())
+        else:
+            timing.show(doc, lambda: self._show(target, build()))
+
     def _check_both_questions_compatible(self, question1_text, question2_text):
         """
         Check if both questions are correlation-compatible.
@@ -80,14 +209,19 @@ class CallbackManager:
             return False
 
     def update_chart(self, target, event, question_sel, f_choice, m_choice, q_filter, charttype):
-        """Update charts based on user selections."""
+        """Update charts based on user selections, patching the shown figure where possible."""
         question = question_sel
         data_filters = f_choice.value
         data_filters_method = m_choice.value
         charttype = charttype
 
-        fig = self.chart_manager.create_chart(question, data_filters, data_filters_method, charttype)
-        target.object = fig
+        self._schedule(
+            target,
+            partial(self.chart_manager.prepare_chart, question, data_filters, data_filters_method, charttype),
+            self.chart_manager.render_chart,
+            trigger=_trigger(event), chart=charttype, question=question,
+            research_areas=list(data_filters), methods=list(data_filters_method),
+        )
 
     def update_correlation_chart(self, target, event, question_sel, question_sel2, f_choice, m_choice):
         """Update the correlation plot and toggle visibility based on question compatibility."""
@@ -106,19 +240,33 @@ class CallbackManager:
             data_filters = f_choice.value
             data_filters_method = m_choice.value
 
-            fig_corr = self.chart_manager.create_correlation_plot(
-                question, question2, data_filters, data_filters_method
+            self._schedule(
+                target,
+                partial(self.chart_manager.prepare_correlation_plot, question, question2, data_filters, data_filters_method),
+                self.chart_manager.render_correlation_plot,
+                trigger=_trigger(event), chart="Correlation plot", question=question, question2=question2,
+                research_areas=list(data_filters), methods=list(data_filters_method),
             )
-            target.object = fig_corr
 
     def update_wordcloud(self, target, event, f_choice, m_choice, content):
         """Update word cloud visualizations."""
         data_filters = f_choice.value
         data_filters_method = m_choice.value
 
-        wordcloud = self.chart_manager.create_wordcloud(data_filters, data_filters_method, content)
-        target.object = wordcloud
-    
+        self._schedule(
+            target,
+            partial(self.chart_manager.prepare_wordcloud, data_filters, data_filters_method, content),
+            self.chart_manager.render_wordcloud,
+            trigger=_trigger(event), chart="Word cloud", content=list(content),
+            research_areas=list(data_filters), methods=list(data_filters_method),
+        )
+
+    @staticmethod
+    def _show(target, fig):
+        """Show a figure in a pane, figures updated in place are already shown."""
+        if fig is not target.object:
+            target.object = fig
+
     def create_update_callbacks(self, widgets):
         """Create all update callback functions."""
         # Extract widgets for easier access
@@ -131,7 +279,8 @@ class CallbackManager:
         multi_filter = widgets["exploration"]["filter1"]
         multi_filter2 = widgets["exploration"]["filter2"]
         
-        # Create callback functions
+        # Create callback functions, named in the callback timing records
+        @timed_callback("overview.ov1")
         def gen_update_overview1(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             question_sel = self.data_processor.map_qkey_to_question(DEFAULT_QUESTIONS["overview"]["ov1"])
@@ -140,6 +289,7 @@ class CallbackManager:
                 q_filter=None, charttype="Vertical Bar chart"
             )
 
+        @timed_callback("overview.ov2")
         def gen_update_overview2(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             question_sel = self.data_processor.map_qkey_to_question(DEFAULT_QUESTIONS["overview"]["ov2"])
@@ -148,6 +298,7 @@ class CallbackManager:
                 q_filter=None, charttype="Vertical Bar chart"
             )
 
+        @timed_callback("overview.ov3")
         def gen_update_overview3(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             question_sel = self.data_processor.map_qkey_to_question(DEFAULT_QUESTIONS["overview"]["ov3"])
@@ -156,6 +307,7 @@ class CallbackManager:
                 q_filter=None, charttype="Vertical Bar chart"
             )
 
+        @timed_callback("overview.ov4")
         def gen_update_overview4(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             question_sel = self.data_processor.map_qkey_to_question(DEFAULT_QUESTIONS["overview"]["ov4"])
@@ -164,6 +316,7 @@ class CallbackManager:
                 q_filter=None, charttype="Vertical Bar chart"
             )
 
+        @timed_callback("exploration.1")
         def gen_update_exp1(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             question_sel, q_filter, charttype = (
@@ -173,6 +326,7 @@ class CallbackManager:
             )
             self.update_chart(target, event, question_sel, f_choice, m_choice, q_filter, charttype)
 
+        @timed_callback("exploration.2")
         def gen_update_exp2(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             question_sel, q_filter, charttype = (
@@ -182,22 +336,26 @@ class CallbackManager:
             )
             self.update_chart(target, event, question_sel, f_choice, m_choice, q_filter, charttype)
 
+        @timed_callback("correlation")
         def gen_update_corr(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             question_sel = question_select
             question_sel2 = question_select2
             self.update_correlation_chart(target, event, question_sel, question_sel2, f_choice, m_choice)
 
+        @timed_callback("wordcloud.methods")
         def gen_update_wc_methods(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             content = WORDCLOUD_CONTENT["methods"]
             self.update_wordcloud(target, event, f_choice, m_choice, content)
 
+        @timed_callback("wordcloud.software")
         def gen_update_wc_software(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             content = WORDCLOUD_CONTENT["software"]
             self.update_wordcloud(target, event, f_choice, m_choice, content)
 
+        @timed_callback("wordcloud.repositories")
         def gen_update_wc_repo(target, event):
             f_choice, m_choice = multi_choice, multi_choice_method
             content = WORDCLOUD_CONTENT["repositories"]
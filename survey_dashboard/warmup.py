@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Server setup script, passed to `panel serve --setup`.
+
+Runs once per worker process before the first session is created and warms up
+the process wide survey dataset and the word cloud layout cache, so no visitor
+pays for parsing the data or loading the precomputed layouts. The figures of the
+initial dashboard state are then built in the background for the first
+visitors.
+"""
+import logging
+
+from survey_dashboard.core.charts import ChartManager
+from survey_dashboard.core.data import DataProcessor, get_survey_dataset
+from survey_dashboard.core.prebuilt import get_figure_pool
+from survey_dashboard.core.wordclouds import get_wordcloud_cache
+from survey_dashboard.ui.widgets import WidgetFactory
+
+# Run as a script by panel serve, so __name__ is not the module name
+logger = logging.getLogger("survey_dashboard.warmup")
+
+# panel serve only sets the level of the bokeh loggers (--log-level, INFO by default),
+# the package logs at the same level unless its level is configured otherwise
+package_logger = logging.getLogger("survey_dashboard")
+if package_logger.level == logging.NOTSET:
+    package_logger.setLevel(logging.getLogger("bokeh").getEffectiveLevel())
+
+dataset = get_survey_dataset()
+logger.info(
+    "Survey data ready: %d rows, loaded in %.3f s, %.1f MB",
+    dataset.shape[0], dataset.load_seconds, dataset.memory_bytes / 1e6
+)
+logger.info("Word cloud layouts ready: %d precomputed", len(get_wordcloud_cache().artifact))
+
+data_processor = DataProcessor()
+widgets = WidgetFactory(data_processor).create_all_widgets()
+ChartManager(data_processor).prebuild_initial_charts(
+    widgets["exploration"]["question1"].value,
+    widgets["exploration"]["question2"].value,
+    widgets["global_filters"]["research_area"].value,
+    widgets["global_filters"]["method"].value,
+)
+logger.info("Initial figures: building %d sets in the background", get_figure_pool().size)
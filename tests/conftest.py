@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Test configuration, the caches of the tests are written to a temporary directory.
+
+The cache directories are read from the environment when survey_dashboard.core.config
+is imported, so they are set here, before any test module imports the package.
+"""
+import os
+import shutil
+import tempfile
+
+CACHE_DIR = tempfile.mkdtemp(prefix="survey_dashboard-tests-")
+os.environ["SURVEY_DASHBOARD_CACHE_DIR"] = CACHE_DIR
+os.environ["SURVEY_DASHBOARD_WORDCLOUD_CACHE_DIR"] = ""
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
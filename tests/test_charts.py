@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Tests of the in place chart updates of survey_dashboard.core.charts.
+"""
+import pytest
+from bokeh.models import ColumnDataSource
+
+from survey_dashboard.core.catalog import QUESTION_CATALOG
+from survey_dashboard.core.charts import ChartManager
+from survey_dashboard.core.config import FILTER_BY, LANGUAGE
+from survey_dashboard.core.data import DataProcessor
+from survey_dashboard.core.prebuilt import FigurePool
+from survey_dashboard.plots import bokeh_barchart, update_barchart
+
+CHART_TYPE = "Vertical Bar chart"
+
+
+@pytest.fixture(scope="module")
+def chart_manager():
+    return ChartManager(DataProcessor(), figure_pool=FigurePool(size=0))
+
+
+@pytest.fixture(scope="module")
+def research_area_question():
+    # Without selected research areas the research area question has no series
+    return QUESTION_CATALOG.question_text(FILTER_BY, LANGUAGE)
+
+
+def test_update_from_empty_research_areas(chart_manager, research_area_question):
+    fig = chart_manager.create_chart(research_area_question, [], [], CHART_TYPE)
+    assert not fig.renderers
+
+    updated = chart_manager.update_chart(fig, research_area_question, [], ["imaging"], CHART_TYPE)
+    assert updated is not fig
+    assert not updated.renderers
+
+    updated = chart_manager.update_chart(updated, research_area_question, ["Physics"], ["imaging"], CHART_TYPE)
+    assert updated.renderers
+
+
+def test_update_to_empty_research_areas(chart_manager, research_area_question):
+    fig = chart_manager.create_chart(research_area_question, ["Physics"], [], CHART_TYPE)
+    updated = chart_manager.update_chart(fig, research_area_question, [], [], CHART_TYPE)
+    assert updated is not fig
+    assert not updated.renderers
+
+
+def test_update_in_place(chart_manager, research_area_question):
+    fig = chart_manager.create_chart(research_area_question, ["Physics"], [], CHART_TYPE)
+    assert chart_manager.update_chart(fig, research_area_question, ["Physics"], ["imaging"], CHART_TYPE) is fig
+
+
+def test_update_barchart_without_series():
+    source = ColumnDataSource({"x_value": ["a", "b"]})
+    fig = bokeh_barchart(source, y=[], factors=[], legend_labels=[], fill_color=[])
+    assert not update_barchart(fig, source, y=[], fill_color=[])
+    assert not update_barchart(fig, source, y=["All"], fill_color=["#005AA0"])
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Tests of the columnar cache of the survey table in survey_dashboard.core.data.
+"""
+import json
+import shutil
+
+import pytest
+
+from survey_dashboard.core import data
+from survey_dashboard.core.config import DATAFILE_PATH
+from survey_dashboard.data.hcs_clean_dictionaries import METADATA_DIR
+
+
+@pytest.fixture
+def changed_schema(tmp_path, monkeypatch):
+    """Metadata directory whose first ordered categories are reversed."""
+    metadata_dir = tmp_path / "hcs_metadata"
+    shutil.copytree(METADATA_DIR, metadata_dir)
+    ordered = json.loads((metadata_dir / "HCS_orderedCats.json").read_text(encoding="utf-8"))
+    column = next(iter(ordered))
+    ordered[column] = ordered[column][::-1]
+    (metadata_dir / "HCS_orderedCats.json").write_text(json.dumps(ordered), encoding="utf-8")
+    return lambda: monkeypatch.setattr(data, "METADATA_DIR", metadata_dir)
+
+
+def test_cache_matches_csv(tmp_path):
+    cached = data.load_columnar_cache(data.build_columnar_cache(DATAFILE_PATH, tmp_path))
+    expected = data.read_survey_csv(DATAFILE_PATH)
+    # Categorical dtypes compare their categories and order, the values are compared as objects
+    # as the cached arrays are memory-mapped
+    assert cached.dtypes.equals(expected.dtypes)
+    assert cached.astype(object).equals(expected.astype(object))
+
+
+def test_cache_key_covers_schema(tmp_path, changed_schema):
+    cache_path = data.columnar_cache_path(DATAFILE_PATH, tmp_path)
+    changed_schema()
+    assert data.columnar_cache_path(DATAFILE_PATH, tmp_path) != cache_path
+
+
+def test_cache_of_other_schema_is_rejected(tmp_path, changed_schema):
+    cache_path = data.build_columnar_cache(DATAFILE_PATH, tmp_path)
+    changed_schema()
+    with pytest.raises(ValueError):
+        data.load_columnar_cache(cache_path)
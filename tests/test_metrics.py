@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Tests of the server metrics of survey_dashboard.core.metrics.
+"""
+from types import SimpleNamespace
+
+from survey_dashboard.core.metrics import Histogram, ServerMetrics
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.samples("x", {}) == [
+        'x_bucket{le="0.1"} 2',
+        'x_bucket{le="1.0"} 3',
+        'x_bucket{le="+Inf"} 4',
+        "x_sum 2.65",
+        "x_count 4",
+    ]
+
+
+def test_session_without_document_is_counted():
+    metrics = ServerMetrics()
+    # Outside of a server session there is no current document
+    session_context = SimpleNamespace(id="session")
+    metrics.session_created(session_context)
+    assert "survey_dashboard_sessions_active 1\n" in metrics.render()
+    assert "survey_dashboard_session_creation_seconds_count 0\n" in metrics.render()
+
+    metrics.session_destroyed(session_context)
+    assert "survey_dashboard_sessions_active 0\n" in metrics.render()
+
+
+def test_chart_updates_by_chart_and_outcome():
+    metrics = ServerMetrics()
+    shown = {"chart": "Word cloud", "outcome": "shown", "total_s": 0.2, "queued_s": 0.01,
+             "select_s": 0.1, "render_s": 0.05, "patch_s": None}
+    metrics.observe_update(shown)
+    metrics.observe_update({**shown, "outcome": "superseded"})
+    text = metrics.render()
+    assert 'survey_dashboard_chart_updates_total{chart="Word cloud",outcome="shown"} 1' in text
+    assert 'survey_dashboard_chart_updates_total{chart="Word cloud",outcome="superseded"} 1' in text
+    assert 'survey_dashboard_chart_update_seconds_count{chart="Word cloud",phase="total"} 1' in text
+    # Phases an update did not reach have no samples
+    assert 'phase="patch"' not in text
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Tests of the answer counts of DataProcessor.select_data and of its row selection on the shipped survey.
+
+The reference is the per-column loop the dashboard counted multiple choice answers
+with before the count cube: True replaced by the x tick label, value_counts per
+column, per research area on a slice of the rows.
+"""
+import pytest
+
+from survey_dashboard.core.catalog import QUESTION_CATALOG
+from survey_dashboard.core.config import FILTER_BY, FILTER_BY_2, HCS_MCSUBQUESTIONS_FLATTENED, LANGUAGE
+from survey_dashboard.core.data import DataProcessor
+from survey_dashboard.data.hcs_clean_dictionaries import BARCHART_ALLOWED, HCS_MCsubquestions, HCS_orderedCats
+
+METHOD_FILTERS = [[], ["imaging"], ["simulations", "recordings"]]
+
+
+def reference_counts(column, xtick):
+    """Counts of a multiple choice column as the loop counted them, True as xtick."""
+    return column.replace(to_replace=True, value=xtick).replace(to_replace=False, value=None).value_counts()
+
+
+def reference_combined(df, keylist):
+    """Count per x tick label, summed over the columns of the question."""
+    combined = {}
+    for key in keylist:
+        xtick = HCS_MCSUBQUESTIONS_FLATTENED[key].replace(" \n", "")
+        counts = reference_counts(df[key], xtick)
+        if counts.empty:
+            combined[xtick] = 0
+        for value, count in counts.items():
+            combined[value] = combined.get(value, 0) + int(count)
+    return combined
+
+
+def reference_per_area(df, keylist):
+    """Count of every column per research area, the first value in sort order."""
+    data = {}
+    for area in df[FILTER_BY].value_counts().keys():
+        for key in keylist:
+            xtick = HCS_MCSUBQUESTIONS_FLATTENED[key].replace(" \n", "")
+            counts = reference_counts(df.loc[df[FILTER_BY] == area, key], xtick).sort_index()
+            data.setdefault(area, []).append(0 if counts.empty else int(counts.values[0]))
+    return data
+
+
+@pytest.fixture(scope="module")
+def processor():
+    return DataProcessor()
+
+
+def multiple_choice_questions():
+    """The chart questions with several answer columns, from the catalog without loading the survey."""
+    return [
+        key for key in BARCHART_ALLOWED
+        if len(QUESTION_CATALOG.question_columns(QUESTION_CATALOG.question_text(key, LANGUAGE), LANGUAGE)) > 1
+    ]
+
+
+def _reference_frame(processor, keylist, methods):
+    """Respondents using every selected method, as the method filter selects them."""
+    method_columns = [key for key, method in HCS_MCsubquestions[FILTER_BY_2].items() if method in methods]
+    df = processor.survey_data[list(dict.fromkeys([FILTER_BY] + keylist + method_columns))].astype(object)
+    for column in method_columns:
+        df = df[df[column] == True]  # noqa: E712, the columns hold objects
+    return df
+
+
+@pytest.mark.parametrize("methods", METHOD_FILTERS)
+@pytest.mark.parametrize("key", multiple_choice_questions())
+def test_multiple_choice_counts_per_area(processor, key, methods):
+    question = processor.map_qkey_to_question(key)
+    keylist = [column for column in processor.map_question_to_qkey(question) if column in processor.survey_data]
+    df = _reference_frame(processor, keylist, methods)
+    data = processor.select_data(question, ["Cum. Sum"], methods)[0].data
+
+    combined = reference_combined(df, keylist)
+    assert list(data["x_value"]) == list(combined)
+    for area, counts in reference_per_area(df, keylist).items():
+        assert [int(count) for count in data[area]] == counts
+    # Cum. Sum counts the respondents with a research area only
+    with_area = reference_combined(df[df[FILTER_BY].notna()], keylist)
+    assert [int(count) for count in data["Cum. Sum"]] == list(with_area.values())
+
+
+@pytest.mark.parametrize("methods", METHOD_FILTERS)
+@pytest.mark.parametrize("key", multiple_choice_questions())
+def test_multiple_choice_counts_all(processor, key, methods):
+    question = processor.map_qkey_to_question(key)
+    keylist = [column for column in processor.map_question_to_qkey(question) if column in processor.survey_data]
+    data = processor.select_data(question, ["All"], methods)[0].data
+
+    combined = reference_combined(_reference_frame(processor, keylist, methods), keylist)
+    assert list(data["x_value"]) == list(combined)
+    assert [int(count) for count in data["All"]] == list(combined.values())
+
+
+@pytest.mark.parametrize("filters", [["All"], ["Cum. Sum"]])
+def test_single_choice_answers_in_catalog_order(processor, filters):
+    # The answers follow HCS_orderedCats, not their frequency, the pie chart draws its wedges in this order
+    data = processor.select_data(processor.map_qkey_to_question("careerLevel"), filters, [])[0].data
+    assert list(data["x_value"]) == [
+        "Student", "PhD candidate", "Postdoc", "Research Associate",
+        "Principal Investigator", "Technical Staff", "Other",
+    ]
+    assert list(data["x_value"]) == HCS_orderedCats["careerLevel"]
+
+
+@pytest.mark.parametrize("methods", METHOD_FILTERS)
+@pytest.mark.parametrize("areas", [["All"], ["All", "Physics"], ["Cum. Sum", "Physics", "Chemistry"]])
+def test_row_mask_and_count(processor, areas, methods):
+    columns = ["careerLevel", "yearsInResearch", "dataGenMethod_1"]
+    df = _reference_frame(processor, columns, methods)
+    if "All" not in areas:
+        df = df[df[FILTER_BY].isin(areas)]
+    answered = df[df["careerLevel"].notna() & df["yearsInResearch"].notna()]
+
+    mask = processor.row_mask(areas, methods, columns)
+    assert list(processor.survey_data.index[mask]) == list(answered.index)
+    assert processor.row_count(areas, methods, columns) == len(answered)
+    # Multiple choice subcolumns and exclude_nan=False keep respondents without an answer
+    assert list(processor.survey_data.index[processor.row_mask(areas, methods, ["dataGenMethod_1"])]) == list(df.index)
+    assert processor.row_count(areas, methods, columns, exclude_nan=False) == len(df)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), Forschungszentrum Jülich GmbH, IAS-9, Germany.               #
+#                All rights reserved.                                         #
+# This file is part of the survey_dashboard package.                          #
+#                                                                             #
+# The code is hosted on GitHub at                                             #
+# https://github.com/Materials-Data-Science-and-Informatics/survey_dashboard  #
+# For further information on the license, see the LICENSE file                #
+###############################################################################
+"""
+Tests of the chart update timing of survey_dashboard.core.timing.
+"""
+from types import SimpleNamespace
+
+from bokeh.document import Document
+from bokeh.plotting import figure
+
+from survey_dashboard.core.timing import CallbackTimings
+
+
+def test_show_records_phases_and_patch_size():
+    timings = CallbackTimings(size=4)
+    fig = figure()
+    doc = Document()
+    doc.add_root(fig)
+    changes = []
+    doc.on_change(changes.append)
+
+    timings.start({"chart": "test"}).show(doc, lambda: setattr(fig.title, "text", "updated"))
+
+    record, = timings.records()
+    assert record["outcome"] == "shown"
+    assert record["render_s"] is not None and record["patch_s"] is not None
+    assert record["payload_bytes"] > 0
+    # The held change is dispatched once the update is shown
+    assert changes and doc.callbacks.hold_value is None
+
+
+def test_show_without_held_events(caplog):
+    timings = CallbackTimings(size=4)
+    # A document whose callbacks keep no held events where the timing looks for them
+    doc = SimpleNamespace(
+        callbacks=SimpleNamespace(hold_value=None),
+        hold=lambda policy: None,
+        unhold=lambda: None,
+    )
+
+    timings.start({"chart": "test"}).show(doc, lambda: None)
+
+    record, = timings.records()
+    assert record["outcome"] == "shown"
+    assert record["payload_bytes"] is None
+    assert record["patch_s"] is not None
+    assert not caplog.records
+
+
+def test_disabled_timing_starts_nothing():
+    assert CallbackTimings(size=0, log_path="").start({}) is None